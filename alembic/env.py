@@ -9,7 +9,7 @@ from logging.config import fileConfig
 from sqlalchemy import engine_from_config
 from sqlalchemy import pool
 from app.db.base import target_metadata
-from app.core.config import settings
+from app.core.config import get_settings
 
 from alembic import context
 
@@ -17,7 +17,7 @@ from alembic import context
 config = context.config
 
 # URL de connexion : prise depuis .env via settings (prioritaire sur alembic.ini).
-config.set_main_option("sqlalchemy.url", settings.database_url)
+config.set_main_option("sqlalchemy.url", get_settings().database_url)
 
 # Interpret the config file for Python logging.
 # This line sets up loggers basically.
@@ -0,0 +1,30 @@
+"""Add per-enrollment attendance bitmap columns.
+
+Revision ID: d0e1f2a3b4c5
+Revises: c9d0e1f2a3b4
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+
+revision: str = "d0e1f2a3b4c5"
+down_revision: Union[str, Sequence[str], None] = "c9d0e1f2a3b4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Bitmap attendance storage (ATTENDANCE_STORAGE=bitmap): one bit per day or half-day slot."""
+    op.add_column("enrollments", sa.Column("attendance", postgresql.BIT(varying=True), nullable=True))
+    op.add_column("enrollments", sa.Column("attendance_origin", sa.Date(), nullable=True))
+
+
+def downgrade() -> None:
+    """Drop the bitmap columns."""
+    op.drop_column("enrollments", "attendance_origin")
+    op.drop_column("enrollments", "attendance")
@@ -0,0 +1,51 @@
+"""Add jobs table and brief deadline tracking.
+
+Revision ID: e1f2a3b4c5d6
+Revises: d0e1f2a3b4c5
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+revision: str = "e1f2a3b4c5d6"
+down_revision: Union[str, Sequence[str], None] = "d0e1f2a3b4c5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Deadline index for the scheduler sweep, reminder / overdue flags, job queue."""
+    op.create_index("ix_briefs_delivery_deadline", "briefs", ["delivery_deadline"])
+    op.add_column("briefs", sa.Column("reminded_at", sa.DateTime(), nullable=True))
+    op.add_column("briefs", sa.Column("overdue_at", sa.DateTime(), nullable=True))
+    op.create_table(
+        "jobs",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("kind", sa.String(length=50), nullable=False),
+        sa.Column("brief_id", sa.Integer(), nullable=False),
+        sa.Column("deadline", sa.DateTime(), nullable=False),
+        sa.Column("run_at", sa.DateTime(), nullable=False),
+        sa.Column("status", sa.String(length=20), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("done_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["brief_id"], ["briefs.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("kind", "brief_id", "deadline", name="uq_job_kind_brief_deadline"),
+    )
+    # Only pending jobs are ever claimed: the partial index stays as small as the backlog.
+    op.create_index(
+        "ix_jobs_pending_run_at", "jobs", ["run_at"], postgresql_where=sa.text("status = 'pending'")
+    )
+
+
+def downgrade() -> None:
+    """Drop the job queue and the brief deadline tracking."""
+    op.drop_index("ix_jobs_pending_run_at", table_name="jobs")
+    op.drop_table("jobs")
+    op.drop_column("briefs", "overdue_at")
+    op.drop_column("briefs", "reminded_at")
+    op.drop_index("ix_briefs_delivery_deadline", table_name="briefs")
@@ -0,0 +1,49 @@
+"""ON DELETE CASCADE on session, user, brief and group children.
+
+Revision ID: b8c9d0e1f2a3
+Revises: a7b8c9d0e1f2
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "b8c9d0e1f2a3"
+down_revision: Union[str, Sequence[str], None] = "a7b8c9d0e1f2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column, referenced table); Postgres named the constraints <table>_<column>_fkey.
+# sessions.formation_id / sessions.teacher_id stay restrictive: deleting a formation
+# or a trainer must not silently wipe their sessions.
+CASCADING_FOREIGN_KEYS = (
+    ("enrollments", "session_id", "sessions"),
+    ("enrollments", "student_id", "users"),
+    ("signatures", "session_id", "sessions"),
+    ("signatures", "user_id", "users"),
+    ("groups", "session_id", "sessions"),
+    ("group_members", "group_id", "groups"),
+    ("group_members", "student_id", "users"),
+    ("briefs", "session_id", "sessions"),
+    ("brief_students", "brief_id", "briefs"),
+    ("brief_students", "student_id", "users"),
+)
+
+
+def _recreate(ondelete: Union[str, None]) -> None:
+    for table, column, referent in CASCADING_FOREIGN_KEYS:
+        name = f"{table}_{column}_fkey"
+        op.drop_constraint(name, table, type_="foreignkey")
+        op.create_foreign_key(name, table, referent, [column], ["id"], ondelete=ondelete)
+
+
+def upgrade() -> None:
+    """Children are deleted by Postgres with their parent: one DELETE per API call."""
+    _recreate("CASCADE")
+
+
+def downgrade() -> None:
+    """Back to plain (restrictive) foreign keys."""
+    _recreate(None)
@@ -0,0 +1,27 @@
+"""Add claim_token to idempotency_keys.
+
+Revision ID: b4c5d6e7f8a9
+Revises: a3b4c5d6e7f8
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+revision: str = "b4c5d6e7f8a9"
+down_revision: Union[str, Sequence[str], None] = "a3b4c5d6e7f8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Token of the execution holding the key: only it may store or release the response."""
+    op.add_column("idempotency_keys", sa.Column("claim_token", sa.String(length=32), nullable=True))
+
+
+def downgrade() -> None:
+    """Drop claim_token."""
+    op.drop_column("idempotency_keys", "claim_token")
@@ -0,0 +1,62 @@
+"""Add transactional outbox for change events.
+
+Revision ID: f2a3b4c5d6e7
+Revises: e1f2a3b4c5d6
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+
+revision: str = "f2a3b4c5d6e7"
+down_revision: Union[str, Sequence[str], None] = "e1f2a3b4c5d6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """outbox_events, read in (xid, id) order, with a per-statement NOTIFY trigger."""
+    op.create_table(
+        "outbox_events",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column(
+            "xid",
+            sa.BigInteger(),
+            server_default=sa.text("CAST(CAST(pg_current_xact_id() AS text) AS bigint)"),
+            nullable=False,
+        ),
+        sa.Column("topic", sa.String(length=50), nullable=False),
+        sa.Column("payload", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_outbox_events_xid_id", "outbox_events", ["xid", "id"])
+    op.create_index("ix_outbox_events_created_at", "outbox_events", ["created_at"])
+    # NOTIFY is queued until commit and collapsed within a transaction: one wake-up per write.
+    op.execute(
+        """
+        CREATE FUNCTION notify_outbox_events() RETURNS trigger LANGUAGE plpgsql AS $$
+        BEGIN
+            PERFORM pg_notify('outbox_events', '');
+            RETURN NULL;
+        END;
+        $$
+        """
+    )
+    op.execute(
+        "CREATE TRIGGER outbox_events_notify AFTER INSERT ON outbox_events "
+        "FOR EACH STATEMENT EXECUTE FUNCTION notify_outbox_events()"
+    )
+
+
+def downgrade() -> None:
+    """Drop the outbox and its trigger."""
+    op.execute("DROP TRIGGER outbox_events_notify ON outbox_events")
+    op.execute("DROP FUNCTION notify_outbox_events()")
+    op.drop_index("ix_outbox_events_created_at", table_name="outbox_events")
+    op.drop_index("ix_outbox_events_xid_id", table_name="outbox_events")
+    op.drop_table("outbox_events")
@@ -0,0 +1,26 @@
+"""Index session periods for calendar range queries.
+
+Revision ID: f6a7b8c9d0e1
+Revises: e5f6a7b8c9d0
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "f6a7b8c9d0e1"
+down_revision: Union[str, Sequence[str], None] = "e5f6a7b8c9d0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """GiST index on tsrange(start_date, end_date): overlap (&&) lookups without teacher filter."""
+    op.execute("CREATE INDEX ix_sessions_period ON sessions USING gist (tsrange(start_date, end_date))")
+
+
+def downgrade() -> None:
+    """Drop the session period index."""
+    op.drop_index("ix_sessions_period", table_name="sessions")
@@ -0,0 +1,41 @@
+"""Prevent overlapping sessions for the same teacher.
+
+Revision ID: e5f6a7b8c9d0
+Revises: d4e5f6a7b8c9
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "e5f6a7b8c9d0"
+down_revision: Union[str, Sequence[str], None] = "d4e5f6a7b8c9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Exclusion constraint (GiST) on (teacher, [start_date, end_date)).
+
+    The teacher id is wrapped in a single-value int4range so that the constraint
+    only needs built-in range operator classes (no btree_gist extension).
+    Fails if the table already contains overlapping sessions for a teacher.
+    """
+    op.execute(
+        """
+        ALTER TABLE sessions
+        ADD CONSTRAINT excl_sessions_teacher_schedule
+        EXCLUDE USING gist (
+            int4range(teacher_id, teacher_id, '[]') WITH &&,
+            tsrange(start_date, end_date) WITH &&
+        )
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop the teacher schedule exclusion constraint."""
+    op.execute("ALTER TABLE sessions DROP CONSTRAINT excl_sessions_teacher_schedule")
@@ -0,0 +1,30 @@
+"""Index per-student lookups (enrollments, brief assignments, signatures).
+
+Revision ID: a7b8c9d0e1f2
+Revises: f6a7b8c9d0e1
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "a7b8c9d0e1f2"
+down_revision: Union[str, Sequence[str], None] = "f6a7b8c9d0e1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """The existing unique indexes lead with session/brief ids: add student-first indexes."""
+    op.create_index("ix_enrollments_student_id", "enrollments", ["student_id"])
+    op.create_index("ix_brief_students_student_id", "brief_students", ["student_id"])
+    op.create_index("ix_signatures_user_id", "signatures", ["user_id"])
+
+
+def downgrade() -> None:
+    """Drop per-student lookup indexes."""
+    op.drop_index("ix_signatures_user_id", table_name="signatures")
+    op.drop_index("ix_brief_students_student_id", table_name="brief_students")
+    op.drop_index("ix_enrollments_student_id", table_name="enrollments")
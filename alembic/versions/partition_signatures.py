@@ -0,0 +1,85 @@
+"""Partition signatures by month on date.
+
+Revision ID: c9d0e1f2a3b4
+Revises: b8c9d0e1f2a3
+Create Date: 2026-10-19
+
+"""
+from datetime import date
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+from app.db.partitions import add_months, ensure_partitions, month_start
+
+
+revision: str = "c9d0e1f2a3b4"
+down_revision: Union[str, Sequence[str], None] = "b8c9d0e1f2a3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Months created ahead of the current one; the app keeps this window filled on startup.
+MONTHS_AHEAD = 3
+
+
+def _create_signatures(partitioned: bool) -> None:
+    """signatures with its constraints, reusing the existing id sequence."""
+    op.create_table(
+        "signatures",
+        sa.Column("id", sa.Integer(), server_default=sa.text("nextval('signatures_id_seq')"), nullable=False),
+        sa.Column("session_id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("date", sa.DateTime(), nullable=not partitioned),
+        sa.ForeignKeyConstraint(["session_id"], ["sessions.id"], name="signatures_session_id_fkey", ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], name="signatures_user_id_fkey", ondelete="CASCADE"),
+        # A partitioned table's unique constraints must include the partition key.
+        sa.PrimaryKeyConstraint(*(("id", "date") if partitioned else ("id",)), name="signatures_pkey"),
+        sa.UniqueConstraint("session_id", "user_id", "date", name="uq_signature_session_user_date"),
+        **({"postgresql_partition_by": "RANGE (date)"} if partitioned else {}),
+    )
+    op.execute("ALTER SEQUENCE signatures_id_seq OWNED BY signatures.id")
+    op.create_index("ix_signatures_user_id", "signatures", ["user_id"])
+
+
+def _set_aside(name: str) -> None:
+    """Rename the current table and free the names the new one needs."""
+    op.execute(f"ALTER TABLE signatures RENAME TO {name}")
+    op.execute(
+        f"ALTER TABLE {name} DROP CONSTRAINT signatures_pkey, DROP CONSTRAINT uq_signature_session_user_date, "
+        "DROP CONSTRAINT signatures_session_id_fkey, DROP CONSTRAINT signatures_user_id_fkey"
+    )
+    op.drop_index("ix_signatures_user_id", table_name=name)
+    op.execute("ALTER SEQUENCE signatures_id_seq OWNED BY NONE")
+
+
+def _move_rows(source: str) -> None:
+    op.execute(
+        f"INSERT INTO signatures (id, session_id, user_id, date) SELECT id, session_id, user_id, date FROM {source}"
+    )
+    op.drop_table(source)
+
+
+def upgrade() -> None:
+    """Monthly RANGE partitions on date: one per month holding rows, plus the upcoming window."""
+    _set_aside("signatures_unpartitioned")
+    _create_signatures(partitioned=True)
+    bind = op.get_bind()
+    months = bind.execute(
+        sa.text(
+            "SELECT DISTINCT CAST(date_trunc('month', date) AS date) "
+            "FROM signatures_unpartitioned WHERE date IS NOT NULL"
+        )
+    ).scalars().all()
+    for month in months:
+        ensure_partitions(bind, month, month)
+    current = month_start(date.today())
+    ensure_partitions(bind, current, add_months(current, MONTHS_AHEAD))
+    _move_rows("signatures_unpartitioned")
+
+
+def downgrade() -> None:
+    """Back to a single heap; partitions already moved to the archive schema are left alone."""
+    _set_aside("signatures_partitioned")
+    _create_signatures(partitioned=False)
+    _move_rows("signatures_partitioned")
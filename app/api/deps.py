@@ -1,18 +1,56 @@
 """
-Dépendances FastAPI partagées (auth, session DB).
+Dépendances FastAPI partagées (auth, session DB, lecture groupée par ids).
 """
-from fastapi import Depends, HTTPException, Request, status
+from typing import List, Optional
+
+from fastapi import Depends, HTTPException, Query, Request, Response, status
 from sqlmodel import Session
 
+from app.core.rate_limit import login_limiter
 from app.core.security import decode_token
 from app.db.session import get_session
 from app.models.user import User
 from app.repositories.user_repo import UserRepository
 from app.services.auth_service import AuthService
+from app.utils.enum import Role
+
+
+# Lecture groupée (`GET /users?ids=3,1,2`) : nombre maximal d'ids par requête,
+# en-tête listant les ids demandés mais introuvables.
+MAX_BATCH_IDS = 1000
+MISSING_IDS_HEADER = "X-Missing-Ids"
+
+
+def parse_ids(
+    ids: Optional[str] = Query(
+        None, description=f"Ids séparés par des virgules (max {MAX_BATCH_IDS}) : lecture groupée, ordre conservé."
+    ),
+) -> Optional[List[int]]:
+    """
+    Parse `?ids=3,1,2` en liste d'entiers sans doublons, dans l'ordre demandé.
+
+    None si le paramètre est absent ; 422 si une valeur n'est pas un entier ou s'il y en a trop.
+    """
+    if ids is None:
+        return None
+    try:
+        values = [int(value) for value in ids.split(",") if value.strip()]
+    except ValueError:
+        raise HTTPException(422, detail="ids must be a comma-separated list of integers")
+    values = list(dict.fromkeys(values))
+    if len(values) > MAX_BATCH_IDS:
+        raise HTTPException(422, detail=f"at most {MAX_BATCH_IDS} ids per request")
+    return values
+
+
+def set_missing_ids(response: Response, missing: List[int]) -> None:
+    """Renseigne l'en-tête X-Missing-Ids (ids demandés absents de la réponse), s'il y en a."""
+    if missing:
+        response.headers[MISSING_IDS_HEADER] = ",".join(str(id) for id in missing)
 
 
 def get_auth_service(session: Session = Depends(get_session)) -> AuthService:
-    return AuthService(UserRepository(session))
+    return AuthService(UserRepository(session), login_limiter)
 
 
 def get_current_user(
@@ -51,3 +89,13 @@ def get_current_user(
         )
 
     return user
+
+
+def get_current_admin(user: User = Depends(get_current_user)) -> User:
+    """Comme get_current_user, mais réservé aux administrateurs (403 sinon)."""
+    if user.role != Role.ADMIN:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin privileges required",
+        )
+    return user
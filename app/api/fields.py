@@ -0,0 +1,71 @@
+"""
+Champs partiels (`?fields=id,first_name,last_name`) pour les routes de lecture.
+
+Les noms sont validés contre le schéma Read de la ressource (422 sinon). La requête
+SQL ne sélectionne que ces colonnes (plus l'id) et la réponse n'expose qu'elles.
+Le sérialiseur (schéma Read réduit aux champs demandés) est construit une fois par
+combinaison de champs puis mis en cache : la sélection dynamique n'ajoute aucune
+construction de schéma par requête.
+"""
+from functools import lru_cache
+from typing import Any, Callable, List, Optional, Tuple, Type
+
+from fastapi import HTTPException, Query, Response
+from pydantic import BaseModel, ConfigDict, TypeAdapter, create_model
+
+# Combinaisons de champs distinctes gardées en cache (toutes ressources confondues).
+FIELDS_CACHE_SIZE = 256
+
+Fields = Tuple[str, ...]
+
+
+def fields_param(schema: Type[BaseModel]) -> Callable[..., Optional[Fields]]:
+    """
+    Dépendance FastAPI parsant `?fields=` pour `schema`.
+
+    Retourne None si le paramètre est absent, sinon les champs dans l'ordre du
+    schéma (deux ordres de saisie partagent ainsi le même sérialiseur).
+    """
+    allowed = tuple(schema.model_fields)
+
+    def parse_fields(
+        fields: Optional[str] = Query(None, description=f"Champs à renvoyer parmi : {', '.join(allowed)}."),
+    ) -> Optional[Fields]:
+        if fields is None:
+            return None
+        requested = {name.strip() for name in fields.split(",") if name.strip()}
+        unknown = sorted(requested.difference(allowed))
+        if unknown or not requested:
+            raise HTTPException(
+                422, detail=f"unknown fields: {', '.join(unknown) or '(none given)'}; allowed: {', '.join(allowed)}"
+            )
+        return tuple(name for name in allowed if name in requested)
+
+    return parse_fields
+
+
+@lru_cache(maxsize=FIELDS_CACHE_SIZE)
+def _serializer(schema: Type[BaseModel], fields: Fields) -> Tuple[TypeAdapter, TypeAdapter]:
+    """(un élément, liste) pour le schéma réduit à `fields` ; construit une fois par combinaison."""
+    partial = create_model(
+        f"{schema.__name__}[{','.join(fields)}]",
+        __config__=ConfigDict(from_attributes=True),
+        **{name: (schema.model_fields[name].annotation, schema.model_fields[name]) for name in fields},
+    )
+    return TypeAdapter(partial), TypeAdapter(List[partial])
+
+
+def fields_response(
+    schema: Type[BaseModel], fields: Fields, data: Any, response: Optional[Response] = None
+) -> Response:
+    """
+    Réponse JSON ne contenant que `fields` pour un objet ou une liste (lignes de
+    projection SQL ou entités ORM). Les en-têtes déjà posés sur `response`
+    (paramètre Response de la route) sont repris.
+    """
+    one, many = _serializer(schema, fields)
+    adapter = many if isinstance(data, list) else one
+    result = Response(content=adapter.dump_json(adapter.validate_python(data)), media_type="application/json")
+    if response is not None:
+        result.headers.raw.extend(response.headers.raw)
+    return result
@@ -0,0 +1,51 @@
+"""
+Inventaire des routes montées sur l'application (chemins complets, préfixes inclus).
+
+Les versions récentes de FastAPI n'aplatissent plus `include_router` : `app.routes`
+contient alors des sous-routeurs inclus (`original_router` + préfixe) au lieu des
+routes préfixées. Ce module parcourt les deux formes.
+"""
+from typing import Any, Callable, Dict, Iterable, Iterator, Tuple
+
+
+def iter_routes(routes: Iterable[Any], prefix: str = "") -> Iterator[Tuple[str, Any]]:
+    """Produit (chemin complet, route) pour chaque route ayant un endpoint."""
+    for route in routes:
+        included = getattr(route, "original_router", None)
+        if included is not None:
+            yield from iter_routes(included.routes, prefix + route.include_context.prefix)
+        elif getattr(route, "endpoint", None) is not None:
+            yield prefix + route.path, route
+
+
+def route_templates(app: Any) -> Dict[Callable, str]:
+    """Endpoint → gabarit de chemin complet (ex. `/api/v1/users/{id}`)."""
+    return {route.endpoint: path for path, route in iter_routes(app.routes)}
+
+
+def api_operations(app: Any, prefix: str) -> Iterator[str]:
+    """« MÉTHODE chemin » pour chaque route dont le chemin commence par `prefix`."""
+    for path, route in iter_routes(app.routes):
+        if path.startswith(prefix):
+            for method in sorted(getattr(route, "methods", None) or ()):
+                yield f"{method} {path}"
+
+
+def prime_routes(app: Any) -> int:
+    """
+    Construit d'avance les routes des sous-routeurs inclus (dépendances, modèles de
+    réponse), que FastAPI récent ne prépare qu'à la première requête qui les traverse.
+    Retourne le nombre de routes préparées (0 avec un FastAPI qui aplatit les routes).
+    """
+
+    def walk(routes: Iterable[Any]) -> int:
+        primed = 0
+        for route in routes:
+            candidates = getattr(route, "effective_candidates", None)
+            if candidates is not None:
+                primed += walk(candidates())
+            elif getattr(route, "original_route", None) is not None:
+                primed += 1
+        return primed
+
+    return walk(app.routes)
@@ -1,9 +1,9 @@
 """
 Routes d'authentification.
 
-Connexion, changement de mot de passe.
+Connexion (limitée par IP et par email), changement de mot de passe.
 """
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Request, status
 
 from app.api.deps import get_auth_service, get_current_user
 from app.models.user import User
@@ -16,10 +16,12 @@ router = APIRouter(prefix="/auth", tags=["auth"])
 @router.post("/login", response_model=TokenResponse)
 def login(
     request: LoginRequest,
+    http_request: Request,
     service: AuthService = Depends(get_auth_service),
 ):
-    """Connexion : renvoie un JWT et l'indication must_change_password."""
-    return service.login(request)
+    """Connexion : renvoie un JWT et l'indication must_change_password ; 429 (Retry-After) si trop de tentatives."""
+    client_ip = http_request.client.host if http_request.client else None
+    return service.login(request, client_ip)
 
 
 @router.post("/change-password", status_code=status.HTTP_204_NO_CONTENT)
@@ -10,7 +10,7 @@ from app.db.session import get_session
 from app.repositories.brief_repo import BriefRepository
 from app.repositories.group_repo import GroupRepository
 from app.repositories.session_repo import SessionRepository
-from app.schemas.brief import BriefCreate, BriefRead, BriefUpdate
+from app.schemas.brief import BriefCreate, BriefRead, BriefUpdate, BriefUpdateRead
 from app.services.brief_service import BriefService
 
 
@@ -64,7 +64,7 @@ def get_brief(id: int, service: BriefService = Depends(get_brief_service)):
     return service.get_by_id(id)
 
 
-@router.patch("/{id}", response_model=BriefRead)
+@router.patch("/{id}", response_model=BriefUpdateRead)
 def update_brief(
     id: int,
     data: BriefUpdate,
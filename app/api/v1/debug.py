@@ -0,0 +1,65 @@
+"""
+Routes de diagnostic (administrateurs uniquement).
+
+GET /debug/queries : empreintes SQL les plus coûteuses (temps total cumulé).
+GET /debug/profiles/{profile_id} : piles repliées d'une requête profilée (X-Profile: 1).
+"""
+from typing import List
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import PlainTextResponse
+
+from app.api.deps import get_current_admin
+from app.core.errors import ProfileNotFound
+from app.core.profiling import store
+from app.db.query_stats import get_collector
+from app.models.user import User
+from app.schemas.debug import QueryFingerprintRead
+
+router = APIRouter(prefix="/debug", tags=["debug"])
+
+
+@router.get("/queries", response_model=List[QueryFingerprintRead])
+def list_top_queries(
+    limit: int = Query(20, ge=1, le=100),
+    _: User = Depends(get_current_admin),
+):
+    """Top-N des empreintes SQL par temps total (agrégat en mémoire de ce process)."""
+    collector = get_collector()
+    if collector is None:
+        return []
+    return [
+        QueryFingerprintRead(
+            fingerprint=stats.fingerprint,
+            calls=stats.calls,
+            total_ms=round(stats.total * 1000, 3),
+            mean_ms=round(stats.total * 1000 / stats.calls, 3),
+            max_ms=round(stats.max * 1000, 3),
+            rows=stats.rows,
+        )
+        for stats in collector.top(limit)
+    ]
+
+
+@router.get("/profiles/{profile_id}", response_class=PlainTextResponse)
+def get_profile(
+    profile_id: str,
+    _: User = Depends(get_current_admin),
+):
+    """
+    Profil d'une requête lancée avec `X-Profile: 1` (id dans l'en-tête X-Profile-Id).
+
+    Piles repliées prêtes pour flamegraph.pl ou speedscope ; durée et nombre
+    d'échantillons dans les en-têtes X-Profile-Duration-Ms / X-Profile-Samples.
+    """
+    profile = store.get(profile_id)
+    if profile is None:
+        raise ProfileNotFound()
+    return PlainTextResponse(
+        profile.collapsed(),
+        headers={
+            "X-Profile-Duration-Ms": str(profile.duration_ms),
+            "X-Profile-Samples": str(profile.samples),
+            "X-Profile-Request": f"{profile.method} {profile.path}",
+        },
+    )
@@ -3,10 +3,12 @@ Routes formations (CRUD).
 
 CRUD formations avec pagination et filtres (niveau, recherche par titre).
 """
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response
 from sqlmodel import Session
-from typing import List
+from typing import List, Optional
 
+from app.api.deps import parse_ids, set_missing_ids
+from app.api.fields import Fields, fields_param, fields_response
 from app.db.session import get_session
 from app.repositories.formation_repo import FormationRepository
 from app.schemas.formation import FormationCreate, FormationRead, FormationUpdate
@@ -33,24 +35,43 @@ def create_formation(
 
 @router.get("", response_model=List[FormationRead], status_code=200)
 def list_formations(
+    response: Response,
     service: FormationService = Depends(get_formation_service),
     offset: int = 0,
     limit: int = 100,
+    ids: Optional[List[int]] = Depends(parse_ids),
+    fields: Optional[Fields] = Depends(fields_param(FormationRead)),
 ):
     """
     Liste les formations.
+    - **ids** : lecture groupée (`?ids=3,1,2`), dans l'ordre demandé, sans pagination ;
+      les ids introuvables sont listés dans l'en-tête X-Missing-Ids
+    - **fields** : champs de FormationRead à renvoyer (`?fields=id,title`),
+      seules ces colonnes sont lues en base
     """
-    formations = service.list(offset=offset, limit=limit)
+    if ids is not None:
+        formations, missing = service.get_many(ids, fields)
+        set_missing_ids(response, missing)
+    elif fields is not None:
+        formations = service.list_fields(fields, offset=offset, limit=limit)
+    else:
+        formations = service.list(offset=offset, limit=limit)
+    if fields is not None:
+        return fields_response(FormationRead, fields, formations, response)
     return [FormationRead.model_validate(formation) for formation in formations]
 
 @router.get("/{id}", response_model=FormationRead, status_code=200)
 def get_formation(
     id: int,
     service: FormationService = Depends(get_formation_service),
+    fields: Optional[Fields] = Depends(fields_param(FormationRead)),
 ):
     """
     Récupère une formation par ID.
+    - **fields** : champs de FormationRead à renvoyer, comme pour la liste
     """
+    if fields is not None:
+        return fields_response(FormationRead, fields, service.get_fields(id, fields))
     formation = service.get_by_id(id)
     return FormationRead.model_validate(formation)
 
@@ -1,5 +1,5 @@
 """
-Routes groupes (CRUD et liste par session).
+Routes groupes (CRUD, liste par session et répartition automatique des inscrits).
 """
 from typing import List
 
@@ -7,9 +7,10 @@ from fastapi import APIRouter, Depends
 from sqlmodel import Session as SqlSession
 
 from app.db.session import get_session
+from app.repositories.enrollment_repo import EnrollmentRepository
 from app.repositories.group_repo import GroupRepository
 from app.repositories.session_repo import SessionRepository
-from app.schemas.group import GroupCreate, GroupRead, GroupUpdate
+from app.schemas.group import GroupAutoCreate, GroupCreate, GroupRead, GroupUpdate, GroupUpdateRead
 from app.services.group_service import GroupService
 
 
@@ -20,6 +21,7 @@ def get_group_service(session: SqlSession = Depends(get_session)) -> GroupServic
     return GroupService(
         GroupRepository(session),
         SessionRepository(session),
+        EnrollmentRepository(session),
     )
 
 
@@ -32,6 +34,21 @@ def create_group(
     return service.create(data)
 
 
+@router.post("/session/{session_id}/auto", response_model=List[GroupRead], status_code=201)
+def auto_create_groups(
+    session_id: int,
+    data: GroupAutoCreate,
+    service: GroupService = Depends(get_group_service),
+):
+    """
+    Répartit automatiquement les inscrits de la session en groupes équilibrés.
+    - **group_count** ou **group_size** (exactement l'un des deux)
+    - **stratify** : sépare les apprenants déjà réunis dans un groupe
+    - Lève 404 si la session n'existe pas, 400 si la répartition est impossible (GroupSplitInvalid)
+    """
+    return service.auto_create(session_id, data)
+
+
 @router.get("/session/{session_id}", response_model=List[GroupRead])
 def list_groups_by_session(
     session_id: int,
@@ -47,7 +64,7 @@ def get_group(id: int, service: GroupService = Depends(get_group_service)):
     return service.get_by_id(id)
 
 
-@router.patch("/{id}", response_model=GroupRead)
+@router.patch("/{id}", response_model=GroupUpdateRead)
 def update_group(
     id: int,
     data: GroupUpdate,
@@ -1,12 +1,13 @@
 """
 Routeur principal API v1.
 
-Agrège les sous-routeurs : users, formations, sessions, enrollments, briefs, groups.
+Agrège les sous-routeurs : users, formations, sessions, enrollments, briefs, groups, debug.
 """
 from fastapi import APIRouter
 
 from app.api.v1.auth import router as auth_router
 from app.api.v1.briefs import router as briefs_router
+from app.api.v1.debug import router as debug_router
 from app.api.v1.enrollment import router as enrollment_router
 from app.api.v1.formations import router as formations_router
 from app.api.v1.groups import router as groups_router
@@ -23,4 +24,5 @@ api_router.include_router(sessions_router)
 api_router.include_router(signatures_router)
 api_router.include_router(enrollment_router)
 api_router.include_router(briefs_router)
-api_router.include_router(groups_router)
\ No newline at end of file
+api_router.include_router(groups_router)
+api_router.include_router(debug_router)
\ No newline at end of file
@@ -2,20 +2,23 @@
 Routes sessions (CRUD et listes par formation / formateur / dates).
 
 CRUD sessions et endpoints pour lister par formation_id, teacher_id,
-ou récupérer par date de début / fin.
+récupérer par date de début / fin, ou construire un calendrier sur une fenêtre.
 """
 from datetime import datetime
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlmodel import Session as SqlSession
-from typing import List
+from typing import List, Optional
 
+from app.api.deps import parse_ids, set_missing_ids
+from app.api.fields import Fields, fields_param, fields_response
 from app.db.session import get_session
 from app.repositories.formation_repo import FormationRepository
 from app.repositories.session_repo import SessionRepository
 from app.repositories.user_repo import UserRepository
-from app.schemas.session import SessionCreate, SessionRead, SessionUpdate
+from app.schemas.session import SessionCalendarRead, SessionCreate, SessionRead, SessionUpdate
 from app.services.session_service import SessionService
+from app.utils.enum import SessionStatus
 
 
 router = APIRouter(prefix="/sessions", tags=["sessions"])
@@ -44,16 +47,44 @@ def create_session(
 
 @router.get("", response_model=List[SessionRead])
 def list_sessions(
+    response: Response,
     service: SessionService = Depends(get_session_service),
     offset: int = 0,
     limit: int = 100,
+    ids: Optional[List[int]] = Depends(parse_ids),
+    fields: Optional[Fields] = Depends(fields_param(SessionRead)),
 ):
-    """Liste paginée de sessions."""
-    sessions = service.list(offset=offset, limit=limit)
+    """
+    Liste paginée de sessions, ou lecture groupée avec `?ids=3,1,2` (ordre demandé,
+    ids introuvables dans l'en-tête X-Missing-Ids). `?fields=id,start_date` limite la
+    réponse et la requête SQL aux champs de SessionRead demandés.
+    """
+    if ids is not None:
+        sessions, missing = service.get_many(ids, fields)
+        set_missing_ids(response, missing)
+    elif fields is not None:
+        sessions = service.list_fields(fields, offset=offset, limit=limit)
+    else:
+        sessions = service.list(offset=offset, limit=limit)
+    if fields is not None:
+        return fields_response(SessionRead, fields, sessions, response)
     return [SessionRead.model_validate(s) for s in sessions]
 
 
 # Routes avec segments fixes avant /{id} pour éviter que "formation", "teacher", etc. soient pris pour un id
+@router.get("/calendar", response_model=SessionCalendarRead)
+def get_sessions_calendar(
+    date_from: datetime = Query(..., alias="from", description="Début de la fenêtre (inclus), ISO 8601."),
+    date_to: datetime = Query(..., alias="to", description="Fin de la fenêtre (exclue), ISO 8601."),
+    teacher_id: Optional[int] = None,
+    formation_id: Optional[int] = None,
+    status: Optional[SessionStatus] = None,
+    service: SessionService = Depends(get_session_service),
+):
+    """Sessions qui chevauchent [from, to) (filtres optionnels) et nombre de sessions par jour."""
+    return service.calendar(date_from, date_to, teacher_id, formation_id, status)
+
+
 @router.get("/formation/{formation_id}", response_model=List[SessionRead])
 def list_sessions_by_formation_id(
     formation_id: int,
@@ -117,8 +148,11 @@ def get_session_by_end_date(
 def get_session(
     id: int,
     service: SessionService = Depends(get_session_service),
+    fields: Optional[Fields] = Depends(fields_param(SessionRead)),
 ):
-    """Retourne une session par id."""
+    """Retourne une session par id (`?fields=` : seulement ces champs de SessionRead)."""
+    if fields is not None:
+        return fields_response(SessionRead, fields, service.get_fields(id, fields))
     session = service.get_by_id(id)
     return SessionRead.model_validate(session)
 
@@ -2,29 +2,39 @@
 Routes émargement (pad signature).
 
 POST pour émarger (une signature = un jour).
-GET par session + date (qui a signé ce jour) et par session + user (historique pad).
+GET par session + date (qui a signé ce jour) et par session + user (historique pad),
+et flux SSE par session + date (signataires, puis chaque nouvel émargement).
 """
+import asyncio
+import json
 from datetime import date
-from typing import List
+from typing import Any, AsyncIterator, Dict, List
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from sqlmodel import Session as SqlSession
 
-from app.db.session import get_session
+from app.core.attendance_hub import AttendanceHub, Watcher
+from app.core.config import get_settings
+from app.db.session import get_engine, get_session
+from app.repositories.attendance_repo import get_signature_repository
 from app.repositories.enrollment_repo import EnrollmentRepository
 from app.repositories.session_repo import SessionRepository
-from app.repositories.signature_repo import SignatureRepository
 from app.schemas.signature import SignatureCreate, SignatureRead
 from app.services.signature_service import SignatureService
 
 
 router = APIRouter(prefix="/signatures", tags=["signatures"])
 
+# Commentaire SSE envoyé sans émargement pendant ce délai (proxys, détection de coupure).
+STREAM_KEEPALIVE_SECONDS = 15.0
+
 
 def get_signature_service(session: SqlSession = Depends(get_session)) -> SignatureService:
     """Injecte session DB → repositories → service pour les routes signatures."""
     return SignatureService(
-        SignatureRepository(session),
+        get_signature_repository(session),
         SessionRepository(session),
         EnrollmentRepository(session),
     )
@@ -40,6 +50,13 @@ def create_signature(
     return SignatureRead.model_validate(signature)
 
 
+def _parse_date(date_str: str) -> date:
+    try:
+        return date.fromisoformat(date_str)
+    except ValueError:
+        raise HTTPException(422, detail="Invalid date format, use YYYY-MM-DD")
+
+
 @router.get("/session/{session_id}/date/{date_str}", response_model=List[SignatureRead])
 def list_signatures_by_session_and_date(
     session_id: int,
@@ -47,14 +64,64 @@ def list_signatures_by_session_and_date(
     service: SignatureService = Depends(get_signature_service),
 ):
     """Liste les signatures pour une session et un jour (qui a signé ce jour-là). Format date : YYYY-MM-DD."""
-    try:
-        sign_date = date.fromisoformat(date_str)
-    except ValueError:
-        raise HTTPException(422, detail="Invalid date format, use YYYY-MM-DD")
-    signatures = service.list_by_session_and_date(session_id, sign_date)
+    signatures = service.list_by_session_and_date(session_id, _parse_date(date_str))
     return [SignatureRead.model_validate(s) for s in signatures]
 
 
+def _load_signers(session_id: int, sign_date: date) -> List[Dict[str, Any]]:
+    """Signataires du jour, lus sur le primaire dans une session courte (pas de connexion gardée par le flux)."""
+    with SqlSession(get_engine()) as session:
+        signatures = get_signature_service(session).list_by_session_and_date(session_id, sign_date)
+        return [SignatureRead.model_validate(s).model_dump(mode="json") for s in signatures]
+
+
+def _sse(event: str, data: Any) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+async def _signature_events(
+    hub: AttendanceHub, watcher: Watcher, signers: List[Dict[str, Any]], max_seconds: float
+) -> AsyncIterator[str]:
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + max_seconds
+    seen = {signature["id"] for signature in signers}
+    try:
+        yield _sse("snapshot", signers)
+        while (remaining := deadline - loop.time()) > 0:
+            try:
+                signature = await asyncio.wait_for(watcher.queue.get(), min(remaining, STREAM_KEEPALIVE_SECONDS))
+            except asyncio.TimeoutError:
+                yield ": keep-alive\n\n"
+                continue
+            if signature["id"] not in seen:
+                seen.add(signature["id"])
+                yield _sse("signature", signature)
+    finally:
+        hub.unwatch(watcher)
+
+
+@router.get("/session/{session_id}/date/{date_str}/stream")
+async def stream_signatures_by_session_and_date(session_id: int, date_str: str, request: Request):
+    """
+    Flux SSE de l'émargement d'un jour : événement `snapshot` (signataires actuels),
+    puis un événement `signature` par nouvel émargement. Fermé après
+    SIGNATURE_STREAM_MAX_SECONDS (EventSource se reconnecte et reçoit un nouveau snapshot).
+    """
+    sign_date = _parse_date(date_str)
+    hub: AttendanceHub = request.app.state.attendance_hub
+    watcher = hub.watch(session_id, sign_date, asyncio.get_running_loop())
+    try:
+        signers = await run_in_threadpool(hub.snapshot, watcher, lambda: _load_signers(session_id, sign_date))
+    except Exception:
+        hub.unwatch(watcher)
+        raise
+    return StreamingResponse(
+        _signature_events(hub, watcher, signers, get_settings().signature_stream_max_seconds),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.get("/session/{session_id}/user/{user_id}", response_model=List[SignatureRead])
 def list_signatures_by_session_and_user(
     session_id: int,
@@ -1,13 +1,24 @@
 """
-Routes utilisateurs (CRUD).
+Routes utilisateurs (CRUD), tableau de bord apprenant et digest quotidien formateur.
 
 Une route exemple : POST pour créer un utilisateur (DTO entrée UserCreate, sortie UserRead).
 """
-from fastapi import APIRouter, Depends
+from datetime import date
+from typing import Optional
 
+from fastapi import APIRouter, Depends, Response
+
+from app.api.deps import parse_ids, set_missing_ids
+from app.api.fields import Fields, fields_param, fields_response
 from app.db.session import get_session
+from app.repositories.attendance_repo import get_signature_repository
+from app.repositories.brief_repo import BriefRepository
+from app.repositories.enrollment_repo import EnrollmentRepository
+from app.repositories.session_repo import SessionRepository
 from app.repositories.user_repo import UserRepository
+from app.schemas.dashboard import LearnerDashboardRead, TrainerDigestRead
 from app.schemas.user import UserCreate, UserRead, UserUpdate
+from app.services.dashboard_service import DashboardService
 from app.services.user_service import UserService
 from sqlmodel import Session
 from typing import List
@@ -21,6 +32,17 @@ def get_user_service(session: Session = Depends(get_session)) -> UserService:
     return UserService(repo)
 
 
+def get_dashboard_service(session: Session = Depends(get_session)) -> DashboardService:
+    """Injecte session → repositories → service pour le tableau de bord."""
+    return DashboardService(
+        UserRepository(session),
+        EnrollmentRepository(session),
+        BriefRepository(session),
+        get_signature_repository(session),
+        SessionRepository(session),
+    )
+
+
 @router.post("", response_model=UserRead, status_code=201)
 def create_user(
     data: UserCreate,
@@ -36,27 +58,70 @@ def create_user(
 
 @router.get("", response_model=List[UserRead], status_code=200)
 def list_users(
+    response: Response,
     service: UserService = Depends(get_user_service),
     offset: int = 0,
     limit: int = 100,
+    ids: Optional[List[int]] = Depends(parse_ids),
+    fields: Optional[Fields] = Depends(fields_param(UserRead)),
 ):
     """
     Liste les utilisateurs.
+    - **ids** : lecture groupée (`?ids=3,1,2`), dans l'ordre demandé, sans pagination ;
+      les ids introuvables sont listés dans l'en-tête X-Missing-Ids
+    - **fields** : champs de UserRead à renvoyer (`?fields=id,first_name,last_name`),
+      seules ces colonnes sont lues en base
     """
-    users = service.list(offset=offset, limit=limit)
+    if ids is not None:
+        users, missing = service.get_many(ids, fields)
+        set_missing_ids(response, missing)
+    elif fields is not None:
+        users = service.list_fields(fields, offset=offset, limit=limit)
+    else:
+        users = service.list(offset=offset, limit=limit)
+    if fields is not None:
+        return fields_response(UserRead, fields, users, response)
     return [UserRead.model_validate(user) for user in users]
 
 @router.get("/{id}", response_model=UserRead, status_code=200)
 def get_user(
     id: int,
     service: UserService = Depends(get_user_service),
+    fields: Optional[Fields] = Depends(fields_param(UserRead)),
 ):
     """
     Récupère un utilisateur par ID.
+    - **fields** : champs de UserRead à renvoyer, comme pour la liste
     """
+    if fields is not None:
+        return fields_response(UserRead, fields, service.get_fields(id, fields))
     user = service.get_by_id(id)
     return UserRead.model_validate(user)
 
+@router.get("/{id}/dashboard", response_model=LearnerDashboardRead, status_code=200)
+def get_learner_dashboard(
+    id: int,
+    service: DashboardService = Depends(get_dashboard_service),
+):
+    """
+    Tableau de bord apprenant en un appel : inscriptions avec session et formation,
+    briefs à rendre triés par échéance, taux de présence par session.
+    """
+    return service.learner_dashboard(id)
+
+@router.get("/{id}/digest", response_model=TrainerDigestRead, status_code=200)
+def get_trainer_digest(
+    id: int,
+    date: Optional[date] = None,
+    service: DashboardService = Depends(get_dashboard_service),
+):
+    """
+    Digest quotidien d'un formateur (défaut : aujourd'hui) : sessions du jour avec
+    nombre d'inscrits et émargements, briefs dus dans les 7 jours.
+    - Lève 400 si l'utilisateur n'est pas formateur (UserNotTrainer)
+    """
+    return service.trainer_digest(id, date)
+
 @router.patch("/{id}", response_model=UserRead, status_code=200)
 def update_user(
     id: int,
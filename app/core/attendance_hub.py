@@ -0,0 +1,113 @@
+"""
+Diffusion en direct de l'émargement d'une session et d'un jour (flux SSE formateur).
+
+Le hub est abonné une seule fois au dispatcher de l'outbox du worker. Pour
+chaque (session, jour) regardé, il garde la liste des signataires : chargée en
+base par le premier formateur connecté, puis tenue à jour par les événements
+`signature.created`. Les formateurs suivants la reçoivent sans requête, et
+chaque nouvel émargement leur est poussé : N formateurs coûtent une lecture,
+pas N rafraîchissements.
+"""
+import asyncio
+import threading
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from app.core.events import OutboxDispatcher
+from app.models.outbox import SIGNATURE_CREATED, OutboxEvent
+from app.schemas.signature import SignatureRead
+
+Key = Tuple[int, date]
+
+
+@dataclass(eq=False)
+class Watcher:
+    """Un flux ouvert : les émargements poussés arrivent dans `queue` (boucle asyncio de la requête)."""
+
+    key: Key
+    loop: asyncio.AbstractEventLoop
+    queue: "asyncio.Queue[Dict[str, Any]]" = field(default_factory=asyncio.Queue)
+
+
+@dataclass
+class _Channel:
+    watchers: Set[Watcher] = field(default_factory=set)
+    # None tant que la liste n'est pas chargée ; les événements reçus entre-temps vont dans `pending`.
+    signatures: Optional[Dict[int, Dict[str, Any]]] = None
+    pending: Dict[int, Dict[str, Any]] = field(default_factory=dict)
+    loading: threading.Lock = field(default_factory=threading.Lock)
+
+
+class AttendanceHub:
+    """Signataires par (session, jour) regardés, alimentés par l'outbox."""
+
+    def __init__(self, dispatcher: OutboxDispatcher):
+        self._lock = threading.Lock()
+        self._channels: Dict[Key, _Channel] = {}
+        dispatcher.subscribe(self._on_event)
+
+    def watch(self, session_id: int, day: date, loop: asyncio.AbstractEventLoop) -> Watcher:
+        """Ouvre un flux ; les émargements validés à partir de maintenant lui seront poussés."""
+        watcher = Watcher((session_id, day), loop)
+        with self._lock:
+            self._channels.setdefault(watcher.key, _Channel()).watchers.add(watcher)
+        return watcher
+
+    def unwatch(self, watcher: Watcher) -> None:
+        """Ferme un flux ; la liste du (session, jour) est oubliée avec son dernier flux."""
+        with self._lock:
+            channel = self._channels.get(watcher.key)
+            if channel is None:
+                return
+            channel.watchers.discard(watcher)
+            if not channel.watchers:
+                del self._channels[watcher.key]
+
+    def snapshot(self, watcher: Watcher, load: Callable[[], List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        Signataires actuels du flux. `load` (lecture en base) n'est appelé que si
+        aucun autre flux du même (session, jour) ne l'a déjà fait ; ses exceptions
+        sont propagées.
+        """
+        with self._lock:
+            channel = self._channels[watcher.key]
+        with channel.loading:
+            if channel.signatures is None:
+                loaded = {signature["id"]: signature for signature in load()}
+                with self._lock:
+                    loaded.update(channel.pending)
+                    channel.signatures, channel.pending = loaded, {}
+        with self._lock:
+            return list(channel.signatures.values())
+
+    def watcher_count(self, session_id: int, day: date) -> int:
+        with self._lock:
+            channel = self._channels.get((session_id, day))
+            return len(channel.watchers) if channel else 0
+
+    def _on_event(self, event: OutboxEvent) -> None:
+        if event.topic != SIGNATURE_CREATED:
+            return
+        payload = event.payload
+        key = (payload["session_id"], date.fromisoformat(payload["date"]))
+        with self._lock:
+            channel = self._channels.get(key)
+            if channel is None:
+                return
+            signature = SignatureRead(
+                id=payload["id"],
+                session_id=payload["session_id"],
+                user_id=payload["user_id"],
+                date=datetime.combine(key[1], datetime.min.time()),
+                slot=payload["slot"],
+            ).model_dump(mode="json")
+            target = channel.pending if channel.signatures is None else channel.signatures
+            target[signature["id"]] = signature
+            watchers = list(channel.watchers)
+        for watcher in watchers:
+            try:
+                watcher.loop.call_soon_threadsafe(watcher.queue.put_nowait, signature)
+            except RuntimeError:
+                # Boucle de la requête déjà fermée : le flux est en cours de fermeture.
+                continue
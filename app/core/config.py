@@ -1,13 +1,21 @@
 """
 Configuration centralisée de l'application.
 
-Charge les variables d'environnement depuis `.env` (pydantic-settings)
-et expose un singleton `settings` pour DATABASE_URL, ENV, etc.
+Charge les variables d'environnement depuis `.env` (pydantic-settings).
+`get_settings()` construit le singleton au premier appel, pas à l'import :
+importer un module de l'application ne lit ni l'environnement ni `.env`.
 """
+from functools import lru_cache
+from typing import List
+
 from pydantic_settings import BaseSettings
 from pydantic import Field
 
 
+def _split_urls(value: str) -> List[str]:
+    return [url.strip() for url in value.split(",") if url.strip()]
+
+
 class Settings(BaseSettings):
     """
     Paramètres de l'application chargés depuis l'environnement.
@@ -16,6 +24,36 @@ class Settings(BaseSettings):
         database_url: URL de connexion PostgreSQL (obligatoire).
         test_database_url: URL de la base de test (optionnelle).
         env: Environnement d'exécution (dev, prod, etc.), défaut "dev".
+        slow_query_threshold_ms: Seuil (ms) au-delà duquel une instruction SQL est journalisée.
+        profile_sample_interval_ms: Période d'échantillonnage du profilage à la demande.
+        profile_store_size: Nombre de profils conservés en mémoire.
+        warmup_on_startup: Préchauffage au démarrage (pool, OpenAPI, routes, bcrypt/jose).
+        replica_database_urls: URLs des réplicas en lecture, séparées par des virgules (optionnel).
+        test_replica_database_urls: Idem pour la base de test.
+        read_your_writes_seconds: Durée pendant laquelle un client qui vient d'écrire lit sur le primaire.
+        web_concurrency: Nombre de workers de `serve.py` (défaut : nombre de cœurs).
+        db_connection_budget: Connexions Postgres que l'ensemble des workers peut ouvrir.
+        db_pool_size, db_max_overflow: Pool SQLAlchemy par worker (calculés par `serve.py`).
+        max_requests, max_requests_jitter: Recyclage d'un worker après N ± jitter requêtes.
+        graceful_timeout_seconds: Délai laissé aux requêtes en cours à l'arrêt.
+        signature_partitions_ahead: Mois de partitions `signatures` créés d'avance au démarrage.
+        signature_retention_months: Rétention (mois) avant archivage des partitions `signatures`.
+        attendance_storage: Stockage de l'émargement : "rows" (table signatures) ou "bitmap" (bits par inscription).
+        attendance_slots_per_day: Créneaux par jour en stockage bitmap : 1 (journée) ou 2 (matin / après-midi).
+        brief_scheduler_interval_seconds: Période du planificateur d'échéances de briefs (0 : désactivé).
+        brief_reminder_lead_hours: Délai avant l'échéance d'un brief à partir duquel le rappel est enregistré.
+        brief_deadline_lookback_hours: Ancienneté maximale d'une échéance encore prise en compte par le balayage.
+        brief_scheduler_batch_size: Tâches réclamées au plus par passage du planificateur.
+        outbox_poll_seconds: Relecture de l'outbox sans notification, en secondes (0 : dispatcher désactivé).
+        outbox_retention_hours: Rétention des événements de l'outbox, purgés au démarrage d'un worker.
+        signature_stream_max_seconds: Durée d'un flux SSE d'émargement avant fermeture (0 : snapshot seul).
+        login_rate_limit_per_ip: Tentatives de connexion par IP et par fenêtre (0 : sans limite).
+        login_rate_limit_per_email: Tentatives de connexion par email et par fenêtre (0 : sans limite).
+        login_rate_limit_window_seconds: Fenêtre de la limitation des connexions.
+        idempotency_ttl_hours: Conservation des réponses rejouables (en-tête Idempotency-Key), en heures.
+        idempotency_wait_seconds: Attente maximale d'un doublon pendant l'exécution de la requête d'origine.
+        idempotency_lock_seconds: Durée sans signe de vie après laquelle une exécution (worker tombé) peut être
+            reprise par la même requête ; l'exécution en cours rafraîchit sa clé au tiers de ce délai.
     """
 
     database_url: str = Field(..., env="DATABASE_URL")
@@ -24,6 +62,45 @@ class Settings(BaseSettings):
     access_token_expire_minutes: int = 30
     test_database_url: str | None = Field(default=None, env="TEST_DATABASE_URL")
     env: str = Field(default="dev", env="ENV")
+    slow_query_threshold_ms: float = Field(default=200.0, env="SLOW_QUERY_THRESHOLD_MS")
+    profile_sample_interval_ms: float = Field(default=1.0, env="PROFILE_SAMPLE_INTERVAL_MS")
+    profile_store_size: int = Field(default=50, env="PROFILE_STORE_SIZE")
+    warmup_on_startup: bool = Field(default=True, env="WARMUP_ON_STARTUP")
+    replica_database_urls: str = Field(default="", env="REPLICA_DATABASE_URLS")
+    test_replica_database_urls: str = Field(default="", env="TEST_REPLICA_DATABASE_URLS")
+    read_your_writes_seconds: float = Field(default=5.0, env="READ_YOUR_WRITES_SECONDS")
+    web_concurrency: int | None = Field(default=None, env="WEB_CONCURRENCY")
+    db_connection_budget: int = Field(default=90, env="DB_CONNECTION_BUDGET")
+    db_pool_size: int | None = Field(default=None, env="DB_POOL_SIZE")
+    db_max_overflow: int | None = Field(default=None, env="DB_MAX_OVERFLOW")
+    max_requests: int = Field(default=10000, env="MAX_REQUESTS")
+    max_requests_jitter: int = Field(default=1000, env="MAX_REQUESTS_JITTER")
+    graceful_timeout_seconds: int = Field(default=30, env="GRACEFUL_TIMEOUT_SECONDS")
+    signature_partitions_ahead: int = Field(default=3, env="SIGNATURE_PARTITIONS_AHEAD")
+    signature_retention_months: int = Field(default=36, env="SIGNATURE_RETENTION_MONTHS")
+    attendance_storage: str = Field(default="rows", env="ATTENDANCE_STORAGE")
+    attendance_slots_per_day: int = Field(default=1, env="ATTENDANCE_SLOTS_PER_DAY")
+    brief_scheduler_interval_seconds: float = Field(default=60.0, env="BRIEF_SCHEDULER_INTERVAL_SECONDS")
+    brief_reminder_lead_hours: float = Field(default=24.0, env="BRIEF_REMINDER_LEAD_HOURS")
+    brief_deadline_lookback_hours: float = Field(default=168.0, env="BRIEF_DEADLINE_LOOKBACK_HOURS")
+    brief_scheduler_batch_size: int = Field(default=100, env="BRIEF_SCHEDULER_BATCH_SIZE")
+    outbox_poll_seconds: float = Field(default=5.0, env="OUTBOX_POLL_SECONDS")
+    outbox_retention_hours: float = Field(default=24.0, env="OUTBOX_RETENTION_HOURS")
+    signature_stream_max_seconds: float = Field(default=300.0, env="SIGNATURE_STREAM_MAX_SECONDS")
+    login_rate_limit_per_ip: int = Field(default=30, env="LOGIN_RATE_LIMIT_PER_IP")
+    login_rate_limit_per_email: int = Field(default=5, env="LOGIN_RATE_LIMIT_PER_EMAIL")
+    login_rate_limit_window_seconds: float = Field(default=60.0, env="LOGIN_RATE_LIMIT_WINDOW_SECONDS")
+    idempotency_ttl_hours: float = Field(default=24.0, env="IDEMPOTENCY_TTL_HOURS")
+    idempotency_wait_seconds: float = Field(default=10.0, env="IDEMPOTENCY_WAIT_SECONDS")
+    idempotency_lock_seconds: float = Field(default=60.0, env="IDEMPOTENCY_LOCK_SECONDS")
+
+    @property
+    def replica_urls(self) -> List[str]:
+        return _split_urls(self.replica_database_urls)
+
+    @property
+    def test_replica_urls(self) -> List[str]:
+        return _split_urls(self.test_replica_database_urls)
 
     class Config:
         """Configuration Pydantic : chargement depuis .env, ignore les champs extra."""
@@ -33,4 +110,14 @@ class Settings(BaseSettings):
         extra = "ignore"
 
 
-settings = Settings()
\ No newline at end of file
+@lru_cache
+def get_settings() -> Settings:
+    """Paramètres de l'application, lus une seule fois (au premier appel)."""
+    return Settings()
+
+
+def __getattr__(name: str):
+    """Compatibilité : `from app.core.config import settings` reste possible (lecture différée)."""
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -41,6 +41,15 @@ class EmailAlreadyUsed(AppError):
         super().__init__(code=self.code, message=message)
 
 
+class UserHasSessions(AppError):
+    """Levée lors d'une suppression si l'utilisateur anime encore des sessions."""
+
+    code = "USER_HAS_SESSIONS"
+
+    def __init__(self, message: str = "This user still teaches sessions."):
+        super().__init__(code=self.code, message=message)
+
+
 class FormationNotFound(AppError):
     """Levée lorsqu'aucune formation ne correspond à l'id demandé."""
 
@@ -61,6 +70,15 @@ class FormationTitleAlreadyUsed(AppError):
         super().__init__(code=self.code, message=message)
 
 
+class FormationHasSessions(AppError):
+    """Levée lors d'une suppression si des sessions de la formation existent encore."""
+
+    code = "FORMATION_HAS_SESSIONS"
+
+    def __init__(self, message: str = "This formation still has sessions."):
+        super().__init__(code=self.code, message=message)
+
+
 class TeacherNotFound(AppError):
     """Levée lorsqu'aucun formateur ne correspond à l'id demandé."""
 
@@ -85,22 +103,23 @@ class SessionStartDateAfterEndDate(AppError):
     def __init__(self, message: str = "Session start date must be before end date."):
         super().__init__(code=self.code, message=message)
 
-class SessionStartDateAlreadyExists(AppError):
-    """Levée lors d'une création ou mise à jour si la date de début existe déjà."""
+class SessionTeacherScheduleConflict(AppError):
+    """Levée lors d'une création ou mise à jour si le formateur anime déjà une session sur cette période."""
 
-    code = "SESSION_START_DATE_ALREADY_EXISTS"
+    code = "SESSION_TEACHER_SCHEDULE_CONFLICT"
 
-    def __init__(self, message: str = "Session start date already exists."):
+    def __init__(self, message: str = "Teacher already has a session during this period."):
         super().__init__(code=self.code, message=message)
 
-class SessionEndDateAlreadyExists(AppError):
-    """Levée lors d'une création ou mise à jour si la date de fin existe déjà."""
+class SessionCalendarRangeInvalid(AppError):
+    """Levée si la fenêtre du calendrier est vide, inversée ou trop longue."""
 
-    code = "SESSION_END_DATE_ALREADY_EXISTS"
+    code = "SESSION_CALENDAR_RANGE_INVALID"
 
-    def __init__(self, message: str = "Session end date already exists."):
+    def __init__(self, message: str = "Calendar range must satisfy from < to and span at most 366 days."):
         super().__init__(code=self.code, message=message)
 
+
 class SessionNotFound(AppError):
     """Levée lorsqu'aucune session ne correspond à l'id demandé."""
 
@@ -153,6 +172,15 @@ class GroupNotFound(AppError):
     def __init__(self, message: str = "Group not found."):
         super().__init__(code=self.code, message=message)
 
+
+class GroupSplitInvalid(AppError):
+    """Levée si la répartition automatique est impossible (aucun inscrit, plus de groupes que d'inscrits)."""
+
+    code = "GROUP_SPLIT_INVALID"
+
+    def __init__(self, message: str = "Cannot split the session's learners into these groups."):
+        super().__init__(code=self.code, message=message)
+
 class InvalidCredentials(AppError):
     """Levée lorsque les identifiants de connexion sont invalides."""
 
@@ -162,6 +190,34 @@ class InvalidCredentials(AppError):
         super().__init__(code=self.code, message=message)
 
 
+class LoginRateLimited(AppError):
+    """Levée lorsque trop de tentatives de connexion viennent de la même IP ou visent le même email."""
+
+    code = "LOGIN_RATE_LIMITED"
+
+    def __init__(self, retry_after: float, message: str = "Too many login attempts, retry later."):
+        self.retry_after = retry_after
+        super().__init__(code=self.code, message=message)
+
+
+class IdempotencyKeyReused(AppError):
+    """Levée si une clé d'idempotence déjà utilisée accompagne une requête différente."""
+
+    code = "IDEMPOTENCY_KEY_REUSED"
+
+    def __init__(self, message: str = "This Idempotency-Key was already used for a different request."):
+        super().__init__(code=self.code, message=message)
+
+
+class IdempotencyKeyInProgress(AppError):
+    """Levée si la requête d'origine d'une clé d'idempotence est toujours en cours après l'attente."""
+
+    code = "IDEMPOTENCY_KEY_IN_PROGRESS"
+
+    def __init__(self, message: str = "A request with this Idempotency-Key is still in progress, retry later."):
+        super().__init__(code=self.code, message=message)
+
+
 class SignatureNotFound(AppError):
     """Levée lorsqu'aucune signature ne correspond à l'id demandé."""
 
@@ -189,6 +245,15 @@ class SignatureDateOutsideSession(AppError):
         super().__init__(code=self.code, message=message)
 
 
+class AttendanceSlotInvalid(AppError):
+    """Levée si le créneau (matin / après-midi) manque en émargement par demi-journée, ou est fourni sinon."""
+
+    code = "ATTENDANCE_SLOT_INVALID"
+
+    def __init__(self, message: str = "Attendance slot does not match the configured slots per day."):
+        super().__init__(code=self.code, message=message)
+
+
 class UserNotEnrolledInSession(AppError):
     """Levée si l'utilisateur n'est pas inscrit à la session (réservé aux apprenants inscrits)."""
 
@@ -198,25 +263,42 @@ class UserNotEnrolledInSession(AppError):
         super().__init__(code=self.code, message=message)
 
 
+class ProfileNotFound(AppError):
+    """Levée si le profil demandé n'existe pas (jamais créé ou évincé du tampon)."""
+
+    code = "PROFILE_NOT_FOUND"
+
+    def __init__(self, message: str = "Profile not found."):
+        super().__init__(code=self.code, message=message)
+
+
 __all__ = [
     "AppError",
     "UserNotFound",
     "EmailAlreadyUsed",
+    "UserHasSessions",
     "FormationNotFound",
     "FormationTitleAlreadyUsed",
+    "FormationHasSessions",
     "TeacherNotFound",
     "SessionStartDateAfterEndDate",
-    "SessionStartDateAlreadyExists",
-    "SessionEndDateAlreadyExists",
+    "SessionTeacherScheduleConflict",
+    "SessionCalendarRangeInvalid",
     "SessionNotFound",
     "EnrollmentNotFound",
     "EnrollmentAlreadyExists",
     "EnrollmentSessionFull",
     "BriefNotFound",
     "GroupNotFound",
+    "GroupSplitInvalid",
     "InvalidCredentials",
+    "LoginRateLimited",
+    "IdempotencyKeyReused",
+    "IdempotencyKeyInProgress",
     "SignatureNotFound",
     "SignatureAlreadyExistsForDate",
     "SignatureDateOutsideSession",
+    "AttendanceSlotInvalid",
     "UserNotEnrolledInSession",
+    "ProfileNotFound",
 ]
@@ -0,0 +1,132 @@
+"""
+Dispatcher de l'outbox : diffuse les événements de changement aux abonnés du worker.
+
+Chaque worker démarre un dispatcher dans son lifespan (`app.state.outbox`). Un
+thread garde une connexion dédiée en `LISTEN outbox_events`, relit l'outbox à
+chaque notification (au plus tard toutes les OUTBOX_POLL_SECONDS secondes) et
+appelle les abonnés dans l'ordre des transactions. La diffusion est en mémoire :
+un abonné ne reçoit que les événements validés après son abonnement, pendant
+que le worker tourne. Si la connexion d'écoute tombe (redémarrage de la base),
+le thread la rouvre avec un délai croissant et rattrape les événements manqués.
+"""
+import logging
+import os
+import select
+import threading
+from typing import Callable, List, Optional
+
+from sqlalchemy.engine import Engine
+
+from app.db.outbox import OUTBOX_CHANNEL, Cursor, fetch_after, start_cursor
+from app.models.outbox import OutboxEvent
+
+logger = logging.getLogger(__name__)
+
+Subscriber = Callable[[OutboxEvent], None]
+
+# Attente avant de rouvrir la connexion d'écoute perdue (doublée à chaque échec).
+RECONNECT_MIN_SECONDS = 1.0
+RECONNECT_MAX_SECONDS = 30.0
+
+
+class OutboxDispatcher:
+    """Relit l'outbox après son curseur et appelle les abonnés pour chaque événement."""
+
+    def __init__(self, engine: Engine, poll_seconds: float, batch_size: int = 500):
+        self.engine = engine
+        self.poll_seconds = poll_seconds
+        self.batch_size = batch_size
+        self._subscribers: List[Subscriber] = []
+        self._lock = threading.Lock()
+        self._drain_lock = threading.Lock()
+        self._cursor: Optional[Cursor] = None
+        self._thread: Optional[threading.Thread] = None
+        self._backoff = RECONNECT_MIN_SECONDS
+        self._wake_r, self._wake_w = os.pipe()
+
+    def subscribe(self, subscriber: Subscriber) -> None:
+        with self._lock:
+            self._subscribers.append(subscriber)
+
+    def unsubscribe(self, subscriber: Subscriber) -> None:
+        with self._lock:
+            if subscriber in self._subscribers:
+                self._subscribers.remove(subscriber)
+
+    def _publish(self, event: OutboxEvent) -> None:
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for subscriber in subscribers:
+            try:
+                subscriber(event)
+            except Exception:
+                logger.exception("outbox subscriber failed on event %s", event.id)
+
+    def drain(self) -> int:
+        """Diffuse les événements validés depuis le dernier appel. Retourne leur nombre."""
+        delivered = 0
+        with self._drain_lock, self.engine.connect() as conn:
+            if self._cursor is None:
+                self._cursor = start_cursor(conn)
+            while True:
+                events = fetch_after(conn, self._cursor, self.batch_size)
+                for event in events:
+                    self._publish(event)
+                    self._cursor = (event.xid, event.id)
+                delivered += len(events)
+                if len(events) < self.batch_size:
+                    return delivered
+
+    def _listen(self) -> None:
+        """Boucle du thread : écoute, et reconnexion avec backoff si la connexion tombe."""
+        while True:
+            try:
+                self._listen_once()
+                return
+            except Exception:
+                logger.exception("outbox listener lost its connection, reconnecting in %.1fs", self._backoff)
+            ready, _, _ = select.select([self._wake_r], [], [], self._backoff)
+            if ready:
+                return
+            self._backoff = min(self._backoff * 2, RECONNECT_MAX_SECONDS)
+
+    def _listen_once(self) -> None:
+        """Écoute sur une connexion dédiée jusqu'à l'arrêt ; lève si la connexion tombe."""
+        raw = self.engine.raw_connection()
+        listener = raw.driver_connection
+        # Connexion retirée du pool (comptée à part dans le budget, voir serve.py).
+        raw.detach()
+        listener.autocommit = True
+        try:
+            with listener.cursor() as cursor:
+                cursor.execute(f"LISTEN {OUTBOX_CHANNEL}")
+            self._backoff = RECONNECT_MIN_SECONDS
+            while True:
+                # Relu aussi après une reconnexion : les événements manqués sont rattrapés depuis le curseur.
+                try:
+                    self.drain()
+                except Exception:
+                    logger.exception("outbox dispatch failed")
+                ready, _, _ = select.select([listener, self._wake_r], [], [], self.poll_seconds)
+                if self._wake_r in ready:
+                    return
+                if listener in ready:
+                    listener.poll()
+                    listener.notifies.clear()
+        finally:
+            raw.close()
+
+    def start(self) -> None:
+        """Fixe le curseur (événements à venir) puis lance le thread d'écoute."""
+        with self.engine.connect() as conn:
+            self._cursor = start_cursor(conn)
+        self._thread = threading.Thread(target=self._listen, name="outbox-dispatcher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            os.write(self._wake_w, b"x")
+            self._thread.join()
+            self._thread = None
+        os.close(self._wake_r)
+        os.close(self._wake_w)
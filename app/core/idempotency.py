@@ -0,0 +1,236 @@
+"""
+Clés d'idempotence des créations (`Idempotency-Key`).
+
+Un client qui perd la réponse d'un POST (Wi-Fi instable) peut le renvoyer avec
+le même en-tête `Idempotency-Key` : la première réponse (statut < 500) est
+enregistrée avec l'empreinte de la requête et rejouée telle quelle, avec
+`Idempotent-Replayed: true`, sans repasser par les routes ni les services.
+Un doublon qui arrive pendant l'exécution de l'original attend sa réponse
+(au plus IDEMPOTENCY_WAIT_SECONDS) au lieu de créer une seconde fois.
+
+La clé est propre au client (elle est combinée à l'en-tête Authorization) et
+conservée IDEMPOTENCY_TTL_HOURS heures. Réutilisée pour une autre requête, elle
+est refusée (422). Une réponse 5xx n'est pas conservée : le nouvel essai
+exécute réellement la requête.
+
+L'exécution qui détient la clé la rafraîchit (locked_at) tant qu'elle tourne ;
+seule une clé sans signe de vie depuis IDEMPOTENCY_LOCK_SECONDS (worker tombé)
+peut être reprise, et uniquement par la même requête. Chaque réservation porte
+un jeton : une exécution dont la clé a été reprise n'enregistre plus rien.
+"""
+import asyncio
+import hashlib
+import json
+import uuid
+from datetime import datetime, timedelta
+from time import monotonic
+from typing import Dict, List, Optional, Tuple
+
+from fastapi.concurrency import run_in_threadpool
+from sqlmodel import Session
+
+from app.core.config import get_settings
+from app.core.errors import AppError, IdempotencyKeyInProgress, IdempotencyKeyReused
+from app.db.session import get_engine
+from app.models.idempotency import IdempotencyKey
+from app.repositories.idempotency_repo import IdempotencyRepository
+
+IDEMPOTENCY_HEADER = b"idempotency-key"
+REPLAYED_HEADER = b"idempotent-replayed"
+MAX_KEY_LENGTH = 255
+# Créations concernées (POST sur la collection).
+IDEMPOTENT_PATHS = frozenset({"/api/v1/users", "/api/v1/enrollments", "/api/v1/signatures", "/api/v1/briefs"})
+# Intervalle de relecture d'une clé en cours d'exécution par un doublon.
+_POLL_SECONDS = 0.05
+
+
+def _hash(*parts: bytes) -> str:
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(len(part).to_bytes(8, "big"))
+        digest.update(part)
+    return digest.hexdigest()
+
+
+def purge_expired(now: Optional[datetime] = None) -> int:
+    """Supprime les clés expirées (démarrage d'un worker). Retourne leur nombre."""
+    with Session(get_engine()) as session:
+        return IdempotencyRepository(session).purge_expired(now or datetime.utcnow())
+
+
+def _claim(key: str, request_hash: str, token: str) -> Tuple[bool, Optional[IdempotencyKey]]:
+    settings = get_settings()
+    now = datetime.utcnow()
+    with Session(get_engine()) as session:
+        return IdempotencyRepository(session).claim(
+            key,
+            request_hash,
+            token,
+            now,
+            expires_at=now + timedelta(hours=settings.idempotency_ttl_hours),
+            stale_before=now - timedelta(seconds=settings.idempotency_lock_seconds),
+        )
+
+
+def _get(key: str) -> Optional[IdempotencyKey]:
+    with Session(get_engine()) as session:
+        return IdempotencyRepository(session).get(key)
+
+
+def _touch(key: str, token: str) -> bool:
+    with Session(get_engine()) as session:
+        return IdempotencyRepository(session).touch(key, token, datetime.utcnow())
+
+
+def _save(key: str, token: str, status_code: int, content_type: Optional[str], body: bytes) -> None:
+    with Session(get_engine()) as session:
+        IdempotencyRepository(session).save_response(key, token, status_code, content_type, body)
+
+
+def _release(key: str, token: str) -> None:
+    with Session(get_engine()) as session:
+        IdempotencyRepository(session).release(key, token)
+
+
+async def _heartbeat(key: str, token: str) -> None:
+    """Rafraîchit la clé tant que l'exécution tourne : une requête lente mais vivante n'est pas reprise."""
+    interval = get_settings().idempotency_lock_seconds / 3
+    while True:
+        await asyncio.sleep(interval)
+        if not await run_in_threadpool(_touch, key, token):
+            return
+
+
+class IdempotencyMiddleware:
+    """
+    Middleware ASGI : applique l'idempotence aux POST de IDEMPOTENT_PATHS portant
+    l'en-tête `Idempotency-Key` ; les autres requêtes passent sans coût.
+
+    Les erreurs de clé sont rendues ici en JSON { code, message } (le middleware est
+    hors de portée des handlers d'exceptions de l'application).
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        raw_key = self._raw_key(scope)
+        if raw_key is None:
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope["headers"])
+        body = await self._read_body(receive)
+        key = _hash(raw_key, headers.get(b"authorization", b""))
+        request_hash = _hash(scope["method"].encode(), scope["path"].encode(), scope["query_string"], body)
+
+        token = uuid.uuid4().hex
+        deadline = monotonic() + get_settings().idempotency_wait_seconds
+        while True:
+            claimed, row = await run_in_threadpool(_claim, key, request_hash, token)
+            if claimed:
+                await self._execute(scope, receive, send, key, token, body)
+                return
+            while row is not None and row.status_code is None and row.request_hash == request_hash:
+                if monotonic() >= deadline:
+                    break
+                await asyncio.sleep(_POLL_SECONDS)
+                row = await run_in_threadpool(_get, key)
+            if row is not None:
+                break
+            # Original échoué (5xx) : sa clé a été libérée, ce doublon la reprend.
+
+        if row.request_hash != request_hash:
+            await self._send_error(send, 422, IdempotencyKeyReused())
+        elif row.status_code is None:
+            await self._send_error(send, 409, IdempotencyKeyInProgress(), [(b"retry-after", b"1")])
+        else:
+            await self._send(send, row.status_code, row.content_type, row.body or b"", [(REPLAYED_HEADER, b"true")])
+
+    @staticmethod
+    def _raw_key(scope) -> Optional[bytes]:
+        if scope["type"] != "http" or scope["method"] != "POST":
+            return None
+        if scope["path"].rstrip("/") not in IDEMPOTENT_PATHS:
+            return None
+        for name, value in scope["headers"]:
+            if name == IDEMPOTENCY_HEADER:
+                value = value.strip()
+                return value if 0 < len(value) <= MAX_KEY_LENGTH else None
+        return None
+
+    @staticmethod
+    async def _read_body(receive) -> bytes:
+        chunks: List[bytes] = []
+        while True:
+            message = await receive()
+            if message["type"] != "http.request":
+                break
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body", False):
+                break
+        return b"".join(chunks)
+
+    async def _execute(self, scope, receive, send, key: str, token: str, body: bytes) -> None:
+        """
+        Exécute la requête réservée par `token`, en rafraîchissant la clé. La réponse est
+        enregistrée avant d'être envoyée : un doublon qui la lit ne peut pas précéder le
+        client d'origine.
+        """
+        body_sent = False
+
+        async def replay_receive():
+            nonlocal body_sent
+            if not body_sent:
+                body_sent = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            return await receive()
+
+        start: Dict = {}
+        chunks: List[bytes] = []
+
+        async def capture_send(message):
+            if message["type"] == "http.response.start":
+                start.update(message)
+                return
+            if message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+                if message.get("more_body", False):
+                    return
+            else:
+                await send(message)
+
+        heartbeat = asyncio.ensure_future(_heartbeat(key, token))
+        try:
+            await self.app(scope, replay_receive, capture_send)
+        except BaseException:
+            await run_in_threadpool(_release, key, token)
+            raise
+        finally:
+            heartbeat.cancel()
+
+        status = start.get("status", 500)
+        response_body = b"".join(chunks)
+        if status < 500:
+            content_type = dict(start.get("headers", [])).get(b"content-type")
+            await run_in_threadpool(
+                _save, key, token, status, content_type.decode("latin-1") if content_type else None, response_body
+            )
+        else:
+            await run_in_threadpool(_release, key, token)
+        await send({"type": "http.response.start", "status": status, "headers": start.get("headers", [])})
+        await send({"type": "http.response.body", "body": response_body})
+
+    @staticmethod
+    async def _send(
+        send, status: int, content_type: Optional[str], body: bytes, extra: List[Tuple[bytes, bytes]]
+    ) -> None:
+        headers = [(b"content-length", str(len(body)).encode())]
+        if content_type:
+            headers.append((b"content-type", content_type.encode("latin-1")))
+        await send({"type": "http.response.start", "status": status, "headers": headers + extra})
+        await send({"type": "http.response.body", "body": body})
+
+    async def _send_error(self, send, status: int, exc: AppError, extra: Optional[List] = None) -> None:
+        body = json.dumps({"code": exc.code, "message": exc.message}).encode()
+        await self._send(send, status, "application/json", body, extra or [])
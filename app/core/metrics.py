@@ -0,0 +1,301 @@
+"""
+Métriques applicatives au format texte Prometheus, servies par l'API elle-même.
+
+Compteurs, jauges et histogrammes minimalistes (sans dépendance externe), un
+middleware ASGI qui mesure chaque requête par gabarit de route (`/users/{id}`,
+jamais l'URL brute) et la fonction `render()` utilisée par la route `/metrics`.
+"""
+import threading
+from bisect import bisect_left
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from app.api.introspection import route_templates
+from app.db.instrumentation import begin_request_stats, end_request_stats
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Bornes (secondes) adaptées à une API CRUD : de 1 ms à 10 s.
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+STATEMENT_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 100)
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Tuple[str, ...], values: LabelValues, extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    """Base commune : nom, aide, noms de labels et verrou (routes sync exécutées en threadpool)."""
+
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._lock = threading.Lock()
+
+    def _header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+
+    def samples(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Compteur monotone, une série par combinaison de labels."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def value(self, *labels: str) -> float:
+        return self._values.get(labels, 0)
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(v)}" for labels, v in items]
+
+
+class Gauge(_Metric):
+    """
+    Jauge : valeur courante modifiée par inc/dec/set, ou lue à la demande
+    via `set_function` (état d'un pool, taille d'une file...).
+    """
+
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+        self._function: Optional[Callable[[], Dict[LabelValues, float]]] = None
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def dec(self, *labels: str, amount: float = 1) -> None:
+        self.inc(*labels, amount=-amount)
+
+    def set(self, value: float, *labels: str) -> None:
+        with self._lock:
+            self._values[labels] = value
+
+    def set_function(self, function: Callable[[], Dict[LabelValues, float]]) -> None:
+        """La fonction retourne {valeurs de labels: valeur} ; appelée à chaque collecte."""
+        self._function = function
+
+    def value(self, *labels: str) -> float:
+        return self._values.get(labels, 0)
+
+    def samples(self) -> List[str]:
+        if self._function is not None:
+            items = sorted(self._function().items())
+        else:
+            with self._lock:
+                items = sorted(self._values.items())
+        return [f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(v)}" for labels, v in items]
+
+
+class Histogram(_Metric):
+    """Histogramme à bornes fixes (comptes par bucket, somme et nombre d'observations)."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Tuple[str, ...] = (),
+        buckets: Tuple[float, ...] = LATENCY_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(buckets)
+        # Par série : [compte bucket 0, ..., compte +Inf, somme]
+        self._series: Dict[LabelValues, List[float]] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [0] * (len(self.buckets) + 2)
+            series[index] += 1
+            series[-1] += value
+
+    def count(self, *labels: str) -> int:
+        series = self._series.get(labels)
+        return int(sum(series[:-1])) if series else 0
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            items = sorted((labels, list(series)) for labels, series in self._series.items())
+        lines = []
+        for labels, series in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), series[:-1]):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, labels, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, labels)} {_format_value(series[-1])}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, labels)} {cumulative}")
+        return lines
+
+
+class Registry:
+    """Ensemble des métriques exposées par `/metrics`."""
+
+    def __init__(self) -> None:
+        self._metrics: Dict[str, _Metric] = {}
+
+    def register(self, metric: _Metric) -> _Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric already registered: {metric.name}")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric._header())
+            lines.extend(metric.samples())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+HTTP_REQUESTS = REGISTRY.register(
+    Counter("http_requests_total", "Requêtes HTTP traitées.", ("method", "route", "status"))
+)
+HTTP_LATENCY = REGISTRY.register(
+    Histogram(
+        "http_request_duration_seconds",
+        "Durée de traitement des requêtes HTTP.",
+        ("method", "route", "status"),
+    )
+)
+HTTP_IN_FLIGHT = REGISTRY.register(Gauge("http_requests_in_flight", "Requêtes HTTP en cours de traitement."))
+DB_STATEMENTS = REGISTRY.register(
+    Histogram(
+        "db_statements_per_request",
+        "Instructions SQL exécutées par requête HTTP.",
+        ("method", "route"),
+        buckets=STATEMENT_BUCKETS,
+    )
+)
+DB_TIME = REGISTRY.register(
+    Histogram("db_time_per_request_seconds", "Temps passé en base par requête HTTP.", ("method", "route"))
+)
+DB_POOL = REGISTRY.register(
+    Gauge("db_pool_connections", "Connexions du pool SQLAlchemy par état.", ("state",))
+)
+BCRYPT_IN_FLIGHT = REGISTRY.register(
+    Gauge("bcrypt_operations_in_flight", "Hachages / vérifications bcrypt en cours ou en attente de CPU.")
+)
+
+
+def track_pool(get_pool: Callable[[], Any]) -> None:
+    """
+    Expose l'état d'un QueuePool SQLAlchemy (lu à la collecte, sans coût par requête).
+
+    `get_pool` est rappelé à chaque collecte : `engine.dispose()` remplace le pool.
+    """
+
+    def collect() -> Dict[LabelValues, float]:
+        pool = get_pool()
+        values = {("checked_out",): pool.checkedout(), ("checked_in",): pool.checkedin()}
+        if hasattr(pool, "size"):
+            values[("size",)] = pool.size()
+            values[("overflow",)] = max(pool.overflow(), 0)
+        return values
+
+    DB_POOL.set_function(collect)
+
+
+def render() -> str:
+    """Sérialise toutes les métriques au format texte Prometheus."""
+    return REGISTRY.render()
+
+
+UNMATCHED_ROUTE = "unmatched"
+
+
+class MetricsMiddleware:
+    """
+    Middleware ASGI pur (pas de BaseHTTPMiddleware : ni copie du corps, ni tâche en plus).
+
+    Le gabarit de route est déduit de `scope["route"]`, renseigné par le routeur : les
+    404 hors route sont regroupés sous « unmatched » pour borner la cardinalité.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self._templates: Optional[Dict[Callable, str]] = None
+
+    def _route_template(self, scope) -> str:
+        """
+        Chemin complet (préfixe inclus) de la route servie.
+
+        Selon la version de FastAPI, `scope["route"]` peut être la route d'origine du
+        sous-routeur (sans le préfixe /api/v1) : on retrouve le chemin monté via l'endpoint.
+        """
+        route = scope.get("route")
+        if route is None:
+            return UNMATCHED_ROUTE
+        if self._templates is None:
+            self._templates = route_templates(scope["app"])
+        return self._templates.get(getattr(route, "endpoint", None), route.path)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        stats, token = begin_request_stats()
+        HTTP_IN_FLIGHT.inc()
+        started = perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = perf_counter() - started
+            HTTP_IN_FLIGHT.dec()
+            end_request_stats(token)
+            template = self._route_template(scope)
+            method = scope["method"]
+            code = str(status)
+            HTTP_REQUESTS.inc(method, template, code)
+            HTTP_LATENCY.observe(elapsed, method, template, code)
+            DB_STATEMENTS.observe(stats.statements, method, template)
+            DB_TIME.observe(stats.duration, method, template)
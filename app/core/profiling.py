@@ -0,0 +1,194 @@
+"""
+Profilage à la demande d'une requête HTTP (administrateurs uniquement).
+
+Déclenché par l'en-tête `X-Profile: 1` ou le paramètre `?profile=1` avec un JWT admin :
+un thread échantillonne les piles Python (`sys._current_frames`) pendant la requête
+et produit des piles repliées (« collapsed stacks », format flamegraph.pl /
+speedscope). Le profil est conservé dans un tampon circulaire et son id renvoyé
+dans l'en-tête `X-Profile-Id`. Sans déclencheur, le coût se limite à une
+recherche d'en-tête.
+"""
+import sys
+import threading
+import uuid
+from collections import Counter as Tally
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from time import perf_counter
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs
+
+from fastapi.concurrency import run_in_threadpool
+
+from app.core.config import get_settings
+from app.core.security import decode_token
+from app.utils.enum import Role
+
+PROFILE_HEADER = b"x-profile"
+PROFILE_ID_HEADER = b"x-profile-id"
+# Une pile n'est gardée que si elle traverse FastAPI ou le code de l'application, et
+# commence au premier de ces cadres : les threads inactifs (boucle d'événements en
+# attente, workers du threadpool libres) et le serveur lui-même sont ignorés.
+_TRACKED_MODULES = ("app.", "main:", "fastapi.")
+
+
+@dataclass
+class Profile:
+    """Résultat d'un profilage : piles repliées et nombre d'échantillons."""
+
+    id: str
+    method: str
+    path: str
+    created_at: datetime
+    duration_ms: float = 0.0
+    samples: int = 0
+    stacks: Dict[str, int] = field(default_factory=dict)
+
+    def collapsed(self) -> str:
+        """Une ligne par pile : `cadre;cadre;...;feuille N`, de la racine vers la feuille."""
+        lines = [f"{stack} {count}" for stack, count in sorted(self.stacks.items())]
+        return "\n".join(lines) + "\n" if lines else ""
+
+
+class _Sampler(threading.Thread):
+    """Échantillonne les piles de tous les threads à intervalle fixe jusqu'à `stop()`."""
+
+    def __init__(self, interval: float):
+        super().__init__(name="request-profiler", daemon=True)
+        self.interval = interval
+        self.stacks: Tally = Tally()
+        self.samples = 0
+        self._stopped = threading.Event()
+        self._labels: Dict[object, str] = {}
+
+    def _label(self, frame) -> str:
+        code = frame.f_code
+        label = self._labels.get(code)
+        if label is None:
+            module = frame.f_globals.get("__name__", "?")
+            label = self._labels[code] = f"{module}:{code.co_qualname}"
+        return label
+
+    def _collapse(self, frame) -> Optional[str]:
+        labels: List[str] = []
+        while frame is not None:
+            labels.append(self._label(frame))
+            frame = frame.f_back
+        labels.reverse()
+        for index, label in enumerate(labels):
+            if label.startswith(_TRACKED_MODULES):
+                return ";".join(labels[index:])
+        return None
+
+    def run(self) -> None:
+        own = threading.get_ident()
+        while not self._stopped.wait(self.interval):
+            self.samples += 1
+            for ident, frame in sys._current_frames().items():
+                if ident == own:
+                    continue
+                stack = self._collapse(frame)
+                if stack is not None:
+                    self.stacks[stack] += 1
+
+    def stop(self) -> None:
+        """Signale l'arrêt ; attendre la fin avec `join()` (hors boucle d'événements)."""
+        self._stopped.set()
+
+
+class ProfileStore:
+    """Tampon circulaire des derniers profils (les plus anciens sont évincés)."""
+
+    def __init__(self, size: Optional[int] = None):
+        self._size = size
+        self._profiles: "OrderedDict[str, Profile]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(self, profile: Profile) -> None:
+        with self._lock:
+            self._profiles[profile.id] = profile
+            while len(self._profiles) > self.size:
+                self._profiles.popitem(last=False)
+
+    @property
+    def size(self) -> int:
+        """Capacité : explicite, sinon PROFILE_STORE_SIZE (lu au premier profil)."""
+        if self._size is None:
+            self._size = get_settings().profile_store_size
+        return self._size
+
+    def get(self, profile_id: str) -> Optional[Profile]:
+        with self._lock:
+            return self._profiles.get(profile_id)
+
+
+store = ProfileStore()
+
+
+def _header(headers: List[Tuple[bytes, bytes]], name: bytes) -> Optional[bytes]:
+    for key, value in headers:
+        if key == name:
+            return value
+    return None
+
+
+def _requested(scope) -> bool:
+    value = _header(scope["headers"], PROFILE_HEADER)
+    if value is not None:
+        return value.strip().lower() in (b"1", b"true", b"yes")
+    query_string = scope.get("query_string", b"")
+    if b"profile=" not in query_string:
+        return False
+    return parse_qs(query_string.decode("latin-1")).get("profile", [""])[-1].lower() in ("1", "true", "yes")
+
+
+def _is_admin(scope) -> bool:
+    authorization = _header(scope["headers"], b"authorization")
+    if not authorization or not authorization.lower().startswith(b"bearer "):
+        return False
+    payload = decode_token(authorization[7:].strip().decode("latin-1"))
+    return bool(payload) and payload.get("role") == Role.ADMIN.value
+
+
+class ProfilingMiddleware:
+    """
+    Middleware ASGI : profile la requête si elle le demande et émane d'un admin.
+
+    L'échantillonnage voit tous les threads : des requêtes concurrentes sur le même
+    process peuvent apparaître dans le profil (à lancer sur une instance peu chargée).
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not _requested(scope) or not _is_admin(scope):
+            await self.app(scope, receive, send)
+            return
+
+        profile = Profile(
+            id=uuid.uuid4().hex,
+            method=scope["method"],
+            path=scope["path"],
+            created_at=datetime.utcnow(),
+        )
+
+        async def send_with_profile_id(message):
+            if message["type"] == "http.response.start":
+                message.setdefault("headers", [])
+                message["headers"] = list(message["headers"]) + [(PROFILE_ID_HEADER, profile.id.encode())]
+            await send(message)
+
+        sampler = _Sampler(get_settings().profile_sample_interval_ms / 1000)
+        started = perf_counter()
+        sampler.start()
+        try:
+            await self.app(scope, receive, send_with_profile_id)
+        finally:
+            sampler.stop()
+            await run_in_threadpool(sampler.join)
+            profile.duration_ms = round((perf_counter() - started) * 1000, 3)
+            profile.samples = sampler.samples
+            profile.stacks = dict(sampler.stacks)
+            store.add(profile)
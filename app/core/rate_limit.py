@@ -0,0 +1,94 @@
+"""
+Limitation des tentatives de connexion (seau à jetons en mémoire, par worker).
+
+Chaque tentative consomme un jeton du seau de l'adresse IP cliente puis de
+celui de l'email normalisé ; un seau se remplit de `limit` jetons par
+`window` secondes. La vérification a lieu avant toute lecture en base et tout
+calcul bcrypt : une rafale refusée ne coûte ni requête SQL ni CPU.
+
+Les seaux sont propres au worker : avec N workers, un client peut au pire
+obtenir N fois la limite.
+"""
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from app.core import metrics
+from app.core.config import get_settings
+from app.core.errors import LoginRateLimited
+
+# Au-delà, les seaux pleins (clients inactifs) sont oubliés.
+MAX_TRACKED_KEYS = 10_000
+
+LOGIN_RATE_LIMITED = metrics.REGISTRY.register(
+    metrics.Counter(
+        "login_rate_limited_total", "Tentatives de connexion refusées par le limiteur.", ("key",)
+    )
+)
+
+
+class TokenBuckets:
+    """Seaux à jetons indexés par clé ; thread-safe (routes sync en threadpool)."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        # clé -> (jetons restants, date de la dernière mise à jour)
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+
+    def take(self, key: str, limit: int, window: float, now: Optional[float] = None) -> float:
+        """
+        Consomme un jeton de `key`. Retourne 0 si accordé, sinon le délai (secondes)
+        avant le prochain jeton.
+        """
+        now = time.monotonic() if now is None else now
+        rate = limit / window
+        with self._lock:
+            tokens, updated = self._buckets.get(key, (float(limit), now))
+            tokens = min(float(limit), tokens + (now - updated) * rate)
+            if tokens < 1:
+                self._buckets[key] = (tokens, now)
+                return (1 - tokens) / rate
+            self._buckets[key] = (tokens - 1, now)
+            if len(self._buckets) > MAX_TRACKED_KEYS:
+                self._prune(now, limit, rate)
+            return 0.0
+
+    def _prune(self, now: float, limit: int, rate: float) -> None:
+        full = [key for key, (tokens, updated) in self._buckets.items() if tokens + (now - updated) * rate >= limit]
+        for key in full:
+            del self._buckets[key]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._buckets.clear()
+
+
+class LoginRateLimiter:
+    """Limites par IP et par email, lues dans les paramètres à chaque tentative (0 : limite désactivée)."""
+
+    def __init__(self) -> None:
+        self.by_ip = TokenBuckets()
+        self.by_email = TokenBuckets()
+
+    def check(self, client_ip: Optional[str], email: str) -> None:
+        """Consomme une tentative ; lève LoginRateLimited (avec retry_after) si une limite est atteinte."""
+        settings = get_settings()
+        window = settings.login_rate_limit_window_seconds
+        checks = (
+            ("ip", self.by_ip, client_ip, settings.login_rate_limit_per_ip),
+            ("email", self.by_email, email, settings.login_rate_limit_per_email),
+        )
+        for label, buckets, key, limit in checks:
+            if key is None or limit <= 0 or window <= 0:
+                continue
+            retry_after = buckets.take(key, limit, window)
+            if retry_after:
+                LOGIN_RATE_LIMITED.inc(label)
+                raise LoginRateLimited(retry_after)
+
+    def reset(self) -> None:
+        self.by_ip.reset()
+        self.by_email.reset()
+
+
+login_limiter = LoginRateLimiter()
@@ -0,0 +1,58 @@
+"""
+Planificateur en tâche de fond (démarré par le lifespan de chaque worker).
+
+Un thread par worker exécute `BriefDeadlineService.run_once` toutes les
+BRIEF_SCHEDULER_INTERVAL_SECONDS secondes dans sa propre session. Les workers
+se coordonnent par la base (verrou consultatif pour le balayage, SKIP LOCKED
+pour les tâches) : aucun n'a besoin d'être désigné comme planificateur.
+"""
+import logging
+import threading
+from datetime import timedelta
+from typing import Optional
+
+from sqlalchemy.engine import Engine
+from sqlmodel import Session
+
+from app.core.config import Settings
+from app.repositories.job_repo import JobRepository
+from app.services.brief_deadline_service import BriefDeadlineService
+
+logger = logging.getLogger(__name__)
+
+
+class BriefDeadlineScheduler:
+    """Thread démon périodique ; `stop` attend la fin du passage en cours."""
+
+    def __init__(self, engine: Engine, settings: Settings):
+        self.engine = engine
+        self.interval = settings.brief_scheduler_interval_seconds
+        self.lead = timedelta(hours=settings.brief_reminder_lead_hours)
+        self.lookback = timedelta(hours=settings.brief_deadline_lookback_hours)
+        self.batch_size = settings.brief_scheduler_batch_size
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def run_once(self) -> dict:
+        with Session(self.engine) as session:
+            service = BriefDeadlineService(JobRepository(session), self.lead, self.lookback, self.batch_size)
+            return service.run_once()
+
+    def _loop(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                counts = self.run_once()
+                if any(counts.values()):
+                    logger.info("brief deadlines: %s", counts)
+            except Exception:
+                logger.exception("brief deadline scheduler pass failed")
+            self._stopping.wait(self.interval)
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._loop, name="brief-deadline-scheduler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopping.set()
+        if self._thread is not None:
+            self._thread.join()
@@ -2,24 +2,50 @@
 Module de sécurité pour l'application.
 
 Gestion des hachages de mots de passe, des tokens JWT, etc.
+bcrypt et jose (backend cryptography) sont importés au premier usage, pas au
+démarrage du worker : `load_backends()` permet de les charger au préchauffage.
 """
 from datetime import datetime, timedelta
 from typing import Any
 
-import bcrypt
-from jose import JWTError, jwt
+from app.core.config import get_settings
+from app.core.metrics import BCRYPT_IN_FLIGHT
 
-from app.core.config import settings
+
+def load_backends() -> None:
+    """Importe bcrypt et jose (appelé par le préchauffage, sinon à la première requête)."""
+    import bcrypt  # noqa: F401
+    from jose import jwt  # noqa: F401
+
+
+def hash_password(password: str) -> str:
+    """Hash un mot de passe avec bcrypt (sel aléatoire)."""
+    import bcrypt
+
+    BCRYPT_IN_FLIGHT.inc()
+    try:
+        return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+    finally:
+        BCRYPT_IN_FLIGHT.dec()
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return bcrypt.checkpw(
-        plain_password.encode("utf-8"),
-        hashed_password.encode("utf-8"),
-    )
+    import bcrypt
+
+    BCRYPT_IN_FLIGHT.inc()
+    try:
+        return bcrypt.checkpw(
+            plain_password.encode("utf-8"),
+            hashed_password.encode("utf-8"),
+        )
+    finally:
+        BCRYPT_IN_FLIGHT.dec()
 
 
 def create_access_token(data: dict, expires_delta: timedelta | None = None) -> str:
+    from jose import jwt
+
+    settings = get_settings()
     to_encode = data.copy()
     expire = datetime.utcnow() + (
         expires_delta or timedelta(minutes=settings.access_token_expire_minutes)
@@ -32,6 +58,9 @@ def create_access_token(data: dict, expires_delta: timedelta | None = None) -> s
 
 def decode_token(token: str) -> dict[str, Any] | None:
     """Décode et valide un JWT. Retourne le payload ou None si invalide/expiré."""
+    from jose import JWTError, jwt
+
+    settings = get_settings()
     try:
         payload = jwt.decode(
             token, settings.secret_key, algorithms=[settings.algorithm]
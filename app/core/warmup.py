@@ -0,0 +1,51 @@
+"""
+Préchauffage d'un worker au démarrage (lifespan), avant sa première requête.
+
+Ce qui serait sinon payé par les premiers appels : connexions du pool, schéma
+OpenAPI, préparation des routes et de leurs sérialiseurs, import de bcrypt / jose.
+"""
+import logging
+from time import perf_counter
+from typing import Any, Dict, Sequence
+
+from sqlalchemy.engine import Engine
+
+from app.api.introspection import prime_routes
+from app.core.security import load_backends
+
+logger = logging.getLogger(__name__)
+
+
+def prefill_pool(engine: Engine, connections: int) -> int:
+    """Ouvre `connections` connexions simultanément puis les rend au pool."""
+    opened = []
+    try:
+        for _ in range(connections):
+            opened.append(engine.connect())
+    finally:
+        for connection in opened:
+            connection.close()
+    return len(opened)
+
+
+def _pool_size(engine: Engine) -> int:
+    return engine.pool.size() if hasattr(engine.pool, "size") else 1
+
+
+def warm_up(app: Any, engine: Engine, replicas: Sequence[Engine] = ()) -> Dict[str, float]:
+    """Exécute chaque étape du préchauffage ; retourne leur durée (ms) pour les logs."""
+    timings: Dict[str, float] = {}
+
+    def step(name: str, action) -> None:
+        started = perf_counter()
+        action()
+        timings[name] = round((perf_counter() - started) * 1000, 1)
+
+    step("pool", lambda: prefill_pool(engine, _pool_size(engine)))
+    if replicas:
+        step("replicas", lambda: [prefill_pool(replica, _pool_size(replica)) for replica in replicas])
+    step("routes", lambda: prime_routes(app))
+    step("openapi", app.openapi)
+    step("security", load_backends)
+    logger.info("Warm-up done: %s", ", ".join(f"{name}={ms}ms" for name, ms in timings.items()))
+    return timings
@@ -0,0 +1,95 @@
+"""
+Instrumentation des instructions SQL.
+
+Hooks `before/after_cursor_execute` posés une fois sur la classe `Engine` (donc
+valables pour tout moteur du process) : chaque instruction est chronométrée et
+comptée dans les statistiques de la requête HTTP en cours (contextvar), puis
+transmise aux observateurs enregistrés.
+"""
+from contextvars import ContextVar, Token
+from time import perf_counter
+from typing import Any, Callable, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# observateur(statement, parameters, durée en secondes, rowcount, contexte d'exécution)
+StatementObserver = Callable[[str, Any, float, int, Any], None]
+
+
+class RequestStats:
+    """Instructions SQL et temps base cumulés pour une requête HTTP."""
+
+    __slots__ = ("statements", "duration")
+
+    def __init__(self) -> None:
+        self.statements = 0
+        self.duration = 0.0
+
+
+_request_stats: ContextVar[Optional[RequestStats]] = ContextVar("request_stats", default=None)
+_observers: List[StatementObserver] = []
+
+
+def begin_request_stats() -> Tuple[RequestStats, Token]:
+    """
+    Ouvre les statistiques de la requête courante.
+
+    Les routes sync tournent dans le threadpool avec une copie du contexte :
+    l'objet est partagé, les compteurs remontent donc jusqu'au middleware.
+    """
+    stats = RequestStats()
+    return stats, _request_stats.set(stats)
+
+
+def end_request_stats(token: Token) -> None:
+    _request_stats.reset(token)
+
+
+def current_request_stats() -> Optional[RequestStats]:
+    return _request_stats.get()
+
+
+def add_statement_observer(observer: StatementObserver) -> None:
+    """Enregistre un observateur appelé après chaque instruction SQL."""
+    if observer not in _observers:
+        _observers.append(observer)
+
+
+def remove_statement_observer(observer: StatementObserver) -> None:
+    if observer in _observers:
+        _observers.remove(observer)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("statement_started", []).append(perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info["statement_started"].pop()
+    elapsed = perf_counter() - started
+    stats = _request_stats.get()
+    if stats is not None:
+        stats.statements += 1
+        stats.duration += elapsed
+    if _observers:
+        rowcount = cursor.rowcount if cursor.rowcount is not None else -1
+        for observer in _observers:
+            observer(statement, parameters, elapsed, rowcount, context)
+
+
+@event.listens_for(Engine, "handle_error")
+def _handle_error(exception_context):
+    """
+    Une instruction en échec ne passe pas par after_cursor_execute : on dépile son départ.
+
+    `exception_context.cursor` n'est pas renseigné par SQLAlchemy 2.0 (attribut absent) :
+    une instruction a été envoyée dès qu'un contexte d'exécution existe.
+    """
+    conn = exception_context.connection
+    if conn is not None and exception_context.execution_context is not None:
+        started = conn.info.get("statement_started")
+        if started:
+            started.pop()
@@ -0,0 +1,98 @@
+"""
+Chargement groupé et cache d'identité à l'échelle d'une requête.
+
+Une session SQLModel est ouverte par requête HTTP (`get_session`) ; le chargeur
+lui est attaché (`loader_for(session)`) et vit donc exactement le temps de la
+requête. Les repositories passent par lui, les services n'ont rien à changer :
+
+- `get` : un même id n'est lu qu'une fois par requête, y compris quand il est
+  absent (la map d'identité de SQLAlchemy ne retient que les lignes trouvées) ;
+- `get_many` : les ids inconnus d'un même type sont lus en une requête `IN` ;
+- `load_related` : une relation un-à-plusieurs est remplie pour toute une liste
+  de parents en une requête `IN`, au lieu d'un chargement paresseux par parent.
+
+Les absences mémorisées sont oubliées à chaque flush / rollback : une écriture
+de la requête peut créer la ligne.
+"""
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Type, TypeVar
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlmodel import Session, select
+
+T = TypeVar("T")
+
+_INFO_KEY = "request_loader"
+
+
+class RequestLoader:
+    """Cache d'identité et lectures groupées pour une session (donc une requête)."""
+
+    def __init__(self, session: Session):
+        self.session = session
+        self._missing: Set[Tuple[type, int]] = set()
+        event.listen(session, "after_flush", self._forget_missing)
+        event.listen(session, "after_soft_rollback", self._forget_missing)
+
+    def _forget_missing(self, *_: Any) -> None:
+        self._missing.clear()
+
+    def _cached(self, model: Type[T], id: int) -> Optional[T]:
+        """Instance déjà présente et à jour dans la map d'identité, sans requête."""
+        instance = self.session.identity_map.get(self.session.identity_key(model, id))
+        if instance is None or inspect(instance).expired:
+            return None
+        return instance
+
+    def get(self, model: Type[T], id: int) -> Optional[T]:
+        """Équivalent de `session.get` qui retient aussi les ids absents."""
+        if (model, id) in self._missing:
+            return None
+        instance = self.session.get(model, id)
+        if instance is None:
+            self._missing.add((model, id))
+        return instance
+
+    def get_many(self, model: Type[T], ids: Iterable[int]) -> Dict[int, T]:
+        """Instances trouvées par id ; les ids ni en cache ni connus absents sont lus en un seul `IN`."""
+        found: Dict[int, T] = {}
+        pending: List[int] = []
+        for id in dict.fromkeys(ids):
+            if (model, id) in self._missing:
+                continue
+            instance = self._cached(model, id)
+            if instance is None:
+                pending.append(id)
+            else:
+                found[id] = instance
+        if pending:
+            for instance in self.session.exec(select(model).where(model.id.in_(pending))).all():
+                found[instance.id] = instance
+            self._missing.update((model, id) for id in pending if id not in found)
+        return found
+
+    def load_related(self, parents: Iterable[Any], attr: str) -> None:
+        """
+        Remplit la relation un-à-plusieurs `attr` pour tous les `parents` qui ne l'ont
+        pas encore chargée, en une requête `IN` sur la clé étrangère.
+        """
+        pending = [parent for parent in parents if attr in inspect(parent).unloaded]
+        if not pending:
+            return
+        relationship = inspect(type(pending[0])).relationships[attr]
+        [(local, remote)] = relationship.local_remote_pairs
+        children = defaultdict(list)
+        keys = {getattr(parent, local.key) for parent in pending}
+        for child in self.session.exec(select(relationship.mapper.class_).where(remote.in_(keys))).all():
+            children[getattr(child, remote.key)].append(child)
+        for parent in pending:
+            set_committed_value(parent, attr, children.get(getattr(parent, local.key), []))
+
+
+def loader_for(session: Session) -> RequestLoader:
+    """Chargeur attaché à la session (créé au premier appel)."""
+    loader = session.info.get(_INFO_KEY)
+    if loader is None:
+        loader = session.info[_INFO_KEY] = RequestLoader(session)
+    return loader
@@ -0,0 +1,61 @@
+"""
+Écriture et relecture de l'outbox `outbox_events`.
+
+`append` ajoute les événements dans la transaction en cours de la session : ils
+sont validés (ou annulés) avec l'écriture qu'ils décrivent. Un trigger émet
+`NOTIFY outbox_events` par instruction ; la notification n'est délivrée qu'au
+commit, ce qui réveille le dispatcher de chaque worker.
+
+Les ids sont attribués à l'insertion, pas au commit : une transaction plus
+ancienne peut valider un id plus petit après une plus récente. `fetch_after` ne
+lit donc que les transactions terminées (xid inférieur au xmin du snapshot
+courant), triées par (xid, id) : aucun événement ne peut plus apparaître avant
+le curseur.
+"""
+from datetime import datetime
+from typing import Any, Dict, List, Sequence, Tuple
+
+from sqlalchemy import delete, insert, text
+from sqlalchemy.engine import Connection
+from sqlmodel import Session
+
+from app.models.outbox import OutboxEvent
+
+OUTBOX_CHANNEL = "outbox_events"
+
+# Curseur (xid, id) du dernier événement lu.
+Cursor = Tuple[int, int]
+
+_XMIN = "CAST(CAST(pg_snapshot_xmin(pg_current_snapshot()) AS text) AS bigint)"
+
+
+def append(session: Session, events: Sequence[Tuple[str, Dict[str, Any]]]) -> None:
+    """Ajoute les événements (sujet, payload) à la transaction de `session` (un INSERT)."""
+    if not events:
+        return
+    now = datetime.utcnow()
+    session.execute(
+        insert(OutboxEvent), [{"topic": topic, "payload": payload, "created_at": now} for topic, payload in events]
+    )
+
+
+def start_cursor(conn: Connection) -> Cursor:
+    """Curseur couvrant les transactions encore en cours ou à venir."""
+    return conn.execute(text(f"SELECT {_XMIN}")).scalar_one(), 0
+
+
+def fetch_after(conn: Connection, cursor: Cursor, limit: int) -> List[OutboxEvent]:
+    """Au plus `limit` événements validés après `cursor`, dans l'ordre des transactions."""
+    rows = conn.execute(
+        text(
+            "SELECT id, xid, topic, payload, created_at FROM outbox_events "
+            f"WHERE (xid, id) > (:xid, :id) AND xid < {_XMIN} ORDER BY xid, id LIMIT :limit"
+        ),
+        {"xid": cursor[0], "id": cursor[1], "limit": limit},
+    ).all()
+    return [OutboxEvent(**row._mapping) for row in rows]
+
+
+def purge(conn: Connection, before: datetime) -> int:
+    """Supprime les événements écrits avant `before`. Retourne le nombre supprimé."""
+    return conn.execute(delete(OutboxEvent).where(OutboxEvent.created_at < before)).rowcount
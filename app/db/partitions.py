@@ -0,0 +1,195 @@
+"""
+Partitionnement mensuel de `signatures` (PARTITION BY RANGE sur `date`).
+
+Une partition par mois, nommée `signatures_AAAA_MM`. Les partitions manquantes
+sont créées au démarrage (mois courant + `signature_partitions_ahead` mois) et à
+la demande avant chaque émargement ; un verrou consultatif sérialise les
+créations concurrentes. Les mois dont l'existence a été constatée sont gardés en
+mémoire : le chemin d'insertion n'interroge le catalogue qu'au premier jour signé
+d'un mois encore inconnu du worker. Les mois antérieurs à la rétention ne sont
+jamais tenus pour acquis : l'archivage (autre process) a pu les détacher.
+
+L'archivage détache les partitions plus anciennes que la rétention et les range
+dans le schéma `archive` (données conservées, hors des requêtes courantes). Un
+mois archivé deux fois (émargement antidaté après un premier archivage) y prend
+un suffixe : `signatures_AAAA_MM_1`, `_2`…
+
+    python -m app.db.partitions ensure --months-ahead 3
+    python -m app.db.partitions archive --retention-months 36 [--dry-run]
+"""
+import argparse
+import re
+from datetime import date
+from typing import List, Optional, Sequence, Set
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
+
+PARTITIONED_TABLE = "signatures"
+ARCHIVE_SCHEMA = "archive"
+# Clé de pg_advisory_xact_lock réservée à la création / au détachement de partitions.
+PARTITION_LOCK_KEY = 0x5167_0001
+
+_PARTITION_NAME = re.compile(rf"^{PARTITIONED_TABLE}_(\d{{4}})_(\d{{2}})$")
+_known_months: Set[date] = set()
+
+
+def month_start(day: date) -> date:
+    """Premier jour du mois de `day`."""
+    return date(day.year, day.month, 1)
+
+
+def add_months(month: date, count: int) -> date:
+    """Premier jour du mois situé `count` mois après (ou avant si négatif) celui de `month`."""
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    """Nom de la partition couvrant le mois de `month`."""
+    return f"{PARTITIONED_TABLE}_{month:%Y_%m}"
+
+
+def attached_months(conn: Connection) -> List[date]:
+    """Mois des partitions actuellement attachées à `signatures`, par ordre croissant."""
+    names = conn.execute(
+        text(
+            "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+            "WHERE i.inhparent = CAST(:table AS regclass)"
+        ),
+        {"table": PARTITIONED_TABLE},
+    ).scalars()
+    months = []
+    for name in names:
+        match = _PARTITION_NAME.match(name)
+        if match:
+            months.append(date(int(match.group(1)), int(match.group(2)), 1))
+    return sorted(months)
+
+
+def ensure_partitions(
+    conn: Connection, first: date, last: date, trusted_from: Optional[date] = None
+) -> List[str]:
+    """
+    Crée les partitions mensuelles manquantes couvrant [first, last] dans la
+    transaction de `conn`. Retourne les noms créés.
+
+    Seuls les mois constatés dans le catalogue sont mis en cache : une partition
+    créée dans une transaction finalement annulée sera simplement recréée. Les
+    mois antérieurs à `trusted_from` (coupure de rétention) sont toujours vérifiés
+    dans le catalogue.
+    """
+    months = []
+    month = month_start(first)
+    while month <= last:
+        months.append(month)
+        month = add_months(month, 1)
+    if all(month in _known_months and (trusted_from is None or month >= trusted_from) for month in months):
+        return []
+    conn.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": PARTITION_LOCK_KEY})
+    existing = set(attached_months(conn))
+    _known_months.update(existing)
+    created = []
+    for month in months:
+        if month in existing:
+            continue
+        name = partition_name(month)
+        conn.execute(
+            text(
+                f'CREATE TABLE "{name}" PARTITION OF {PARTITIONED_TABLE} '
+                f"FOR VALUES FROM ('{month.isoformat()}') TO ('{add_months(month, 1).isoformat()}')"
+            )
+        )
+        created.append(name)
+    return created
+
+
+def ensure_upcoming_partitions(engine: Engine, months_ahead: int, today: Optional[date] = None) -> List[str]:
+    """Partitions du mois courant et des `months_ahead` suivants (appelé au démarrage)."""
+    current = month_start(today or date.today())
+    with engine.begin() as conn:
+        return ensure_partitions(conn, current, add_months(current, months_ahead))
+
+
+def retention_cutoff(retention_months: int, today: Optional[date] = None) -> date:
+    """Premier jour conservé : les mois entièrement antérieurs sont archivables."""
+    return add_months(month_start(today or date.today()), -retention_months)
+
+
+def _rename_with_indexes(conn: Connection, name: str, target: str) -> None:
+    """Renomme la table et ses index (`name_...` -> `target_...`) : les index changent de schéma avec elle."""
+    indexes = conn.execute(
+        text(
+            "SELECT c.relname FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid "
+            "WHERE i.indrelid = CAST(:table AS regclass)"
+        ),
+        {"table": f'"{name}"'},
+    ).scalars().all()
+    for index in indexes:
+        renamed = target + index[len(name):] if index.startswith(name) else f"{index}_{target[len(name) + 1:]}"
+        conn.execute(text(f'ALTER INDEX "{index}" RENAME TO "{renamed}"'))
+    conn.execute(text(f'ALTER TABLE "{name}" RENAME TO "{target}"'))
+
+
+def archive_partitions(conn: Connection, before: date, dry_run: bool = False) -> List[str]:
+    """
+    Détache les partitions dont tout le mois précède `before` et les déplace dans
+    le schéma `archive`. Retourne leurs noms d'archive, suffixés si le mois y est
+    déjà (sans rien modifier si `dry_run` : noms actuels).
+    """
+    conn.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": PARTITION_LOCK_KEY})
+    expired = [month for month in attached_months(conn) if add_months(month, 1) <= before]
+    names = [partition_name(month) for month in expired]
+    if dry_run or not names:
+        return names
+    conn.execute(text(f'CREATE SCHEMA IF NOT EXISTS "{ARCHIVE_SCHEMA}"'))
+    archived_tables = set(
+        conn.execute(
+            text("SELECT tablename FROM pg_tables WHERE schemaname = :schema"), {"schema": ARCHIVE_SCHEMA}
+        ).scalars()
+    )
+    archived = []
+    for month, name in zip(expired, names):
+        target, suffix = name, 0
+        while target in archived_tables:
+            suffix += 1
+            target = f"{name}_{suffix}"
+        conn.execute(text(f'ALTER TABLE {PARTITIONED_TABLE} DETACH PARTITION "{name}"'))
+        if target != name:
+            _rename_with_indexes(conn, name, target)
+        conn.execute(text(f'ALTER TABLE "{target}" SET SCHEMA "{ARCHIVE_SCHEMA}"'))
+        archived_tables.add(target)
+        archived.append(target)
+        _known_months.discard(month)
+    return archived
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    from app.core.config import get_settings
+    from app.db.session import get_engine
+
+    settings = get_settings()
+    parser = argparse.ArgumentParser(description="Maintenance des partitions mensuelles de signatures.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    ensure = commands.add_parser("ensure", help="Crée les partitions du mois courant et des mois suivants.")
+    ensure.add_argument("--months-ahead", type=int, default=settings.signature_partitions_ahead)
+    archive = commands.add_parser("archive", help="Détache et archive les partitions hors rétention.")
+    archive.add_argument("--retention-months", type=int, default=settings.signature_retention_months)
+    archive.add_argument("--dry-run", action="store_true", help="Liste les partitions sans les détacher.")
+    args = parser.parse_args(argv)
+
+    engine = get_engine()
+    if args.command == "ensure":
+        names = ensure_upcoming_partitions(engine, args.months_ahead)
+        print(f"{len(names)} partition(s) créée(s) : {', '.join(names) or '-'}")
+        return 0
+    before = retention_cutoff(args.retention_months)
+    with engine.begin() as conn:
+        names = archive_partitions(conn, before, dry_run=args.dry_run)
+    action = "à archiver" if args.dry_run else f"archivée(s) dans le schéma {ARCHIVE_SCHEMA}"
+    print(f"{len(names)} partition(s) antérieure(s) au {before.isoformat()} {action} : {', '.join(names) or '-'}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,131 @@
+"""
+Agrégation des instructions SQL par empreinte et journal des requêtes lentes.
+
+Chaque instruction est normalisée en empreinte (littéraux et paramètres remplacés
+par `?`, listes IN repliées) ; on cumule par empreinte le nombre d'appels, le temps
+total et maximal, et les lignes. Au-delà de `slow_query_threshold_ms`, l'instruction
+est journalisée avec la méthode de repository appelante.
+"""
+import logging
+import re
+import sys
+import threading
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+from app.db.instrumentation import add_statement_observer, remove_statement_observer
+
+logger = logging.getLogger("app.db.slow_query")
+
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?\b")
+_PARAM = re.compile(r"%\(\w+\)s|%s|:\w+\b|\$\d+")
+_IN_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_VALUES = re.compile(r"VALUES\s*\(\s*\?[^)]*\)(?:\s*,\s*\(\s*\?[^)]*\))+", re.IGNORECASE)
+_SPACES = re.compile(r"\s+")
+
+REPOSITORY_PACKAGE = "app.repositories"
+
+
+@lru_cache(maxsize=2048)
+def fingerprint(statement: str) -> str:
+    """
+    Normalise une instruction SQL : deux requêtes qui ne diffèrent que par leurs
+    valeurs partagent la même empreinte. Mis en cache : SQLAlchemy réémet le même texte.
+    """
+    text = _STRING.sub("?", statement)
+    text = _PARAM.sub("?", text)
+    text = _NUMBER.sub("?", text)
+    text = _IN_LIST.sub("(?...)", text)
+    text = _VALUES.sub("VALUES (?...)...", text)
+    return _SPACES.sub(" ", text).strip()
+
+
+@dataclass
+class FingerprintStats:
+    """Cumul pour une empreinte (durées en secondes)."""
+
+    fingerprint: str
+    calls: int = 0
+    total: float = 0.0
+    max: float = 0.0
+    rows: int = 0
+
+
+def calling_repository_method() -> Optional[str]:
+    """
+    Premier cadre de la pile appartenant à `app.repositories` (ex.
+    `SessionRepository.get_by_teacher_id`). Parcours coûteux : réservé aux requêtes lentes.
+    """
+    frame = sys._getframe(1)
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "")
+        if module.startswith(REPOSITORY_PACKAGE):
+            return frame.f_code.co_qualname
+        frame = frame.f_back
+    return None
+
+
+class QueryStats:
+    """Observateur des instructions SQL : agrégat en mémoire et journal des lentes."""
+
+    def __init__(self, slow_threshold_ms: float):
+        self.slow_threshold = slow_threshold_ms / 1000
+        self._stats: Dict[str, FingerprintStats] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, statement: str, parameters: Any, duration: float, rowcount: int, context: Any) -> None:
+        key = fingerprint(statement)
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = FingerprintStats(key)
+            stats.calls += 1
+            stats.total += duration
+            if duration > stats.max:
+                stats.max = duration
+            if rowcount > 0:
+                stats.rows += rowcount
+        if duration >= self.slow_threshold:
+            logger.warning(
+                "slow query %.1f ms in %s: %s",
+                duration * 1000,
+                calling_repository_method() or "?",
+                key,
+            )
+
+    def top(self, limit: int = 20) -> List[FingerprintStats]:
+        """Les `limit` empreintes au temps total le plus élevé."""
+        with self._lock:
+            snapshot = [FingerprintStats(**vars(stats)) for stats in self._stats.values()]
+        return sorted(snapshot, key=lambda stats: stats.total, reverse=True)[:limit]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+
+_collector: Optional[QueryStats] = None
+
+
+def install(slow_threshold_ms: float) -> QueryStats:
+    """Branche le collecteur global sur les hooks SQL (idempotent, seuil mis à jour)."""
+    global _collector
+    if _collector is None:
+        _collector = QueryStats(slow_threshold_ms)
+        add_statement_observer(_collector)
+    else:
+        _collector.slow_threshold = slow_threshold_ms / 1000
+    return _collector
+
+
+def uninstall() -> None:
+    global _collector
+    if _collector is not None:
+        remove_statement_observer(_collector)
+        _collector = None
+
+
+def get_collector() -> Optional[QueryStats]:
+    return _collector
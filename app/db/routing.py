@@ -0,0 +1,64 @@
+"""
+Routage lecture/écriture entre le primaire et les réplicas (« read-your-writes »).
+
+Les réplicas ont un retard de réplication : un client qui vient d'écrire pourrait
+ne pas relire sa propre écriture. Après une écriture réussie, le middleware pose
+le cookie `db_primary_until` (horodatage d'expiration) ; tant qu'il est valide,
+les lectures de ce client restent sur le primaire. Un client sans cookies (API,
+scripts) peut envoyer `X-Read-Primary: 1` pour le même effet.
+"""
+from time import time
+from typing import Callable
+
+from fastapi import Request
+
+from app.core.config import get_settings
+
+PRIMARY_COOKIE = "db_primary_until"
+PRIMARY_HEADER = "X-Read-Primary"
+READ_METHODS = frozenset({"GET", "HEAD"})
+_SAFE_METHODS = READ_METHODS | {"OPTIONS"}
+
+
+def _pinned_until(value: str) -> float:
+    try:
+        return float(value)
+    except ValueError:
+        return 0.0
+
+
+def reads_from_replica(request: Request) -> bool:
+    """Vrai si la requête est une lecture et que le client n'est pas collé au primaire."""
+    if request.method not in READ_METHODS:
+        return False
+    if request.headers.get(PRIMARY_HEADER, "").strip().lower() in ("1", "true", "yes"):
+        return False
+    cookie = request.cookies.get(PRIMARY_COOKIE)
+    return cookie is None or _pinned_until(cookie) <= time()
+
+
+class ReadYourWritesMiddleware:
+    """
+    Middleware ASGI : après une écriture réussie (méthode non sûre, statut < 400),
+    colle le client au primaire pour `READ_YOUR_WRITES_SECONDS`.
+
+    `enabled` est évalué à chaque requête : sans réplica configuré, aucun cookie n'est posé.
+    """
+
+    def __init__(self, app, enabled: Callable[[], bool]):
+        self.app = app
+        self.enabled = enabled
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] in _SAFE_METHODS or not self.enabled():
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_cookie(message):
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                window = get_settings().read_your_writes_seconds
+                cookie = f"{PRIMARY_COOKIE}={time() + window:.3f}; Max-Age={int(window) or 1}; Path=/; HttpOnly; SameSite=Lax"
+                message["headers"] = list(message.get("headers", [])) + [(b"set-cookie", cookie.encode("latin-1"))]
+            await send(message)
+
+        await self.app(scope, receive, send_with_cookie)
@@ -1,15 +1,34 @@
 """
 Session de base de données SQLModel.
 
-Crée le moteur à partir de `settings.database_url` et, en contexte tests,
-de `settings.test_database_url` si disponible. Fournit un générateur
-`get_session()` pour l'injection de dépendances FastAPI.
+Le moteur est créé à la première utilisation (`get_engine()`), à partir de
+`settings.database_url` ou, en contexte tests, de `settings.test_database_url`
+si disponible : l'import de ce module ne lit pas la configuration et n'ouvre
+rien. Fournit un générateur `get_session()` pour l'injection de dépendances FastAPI.
+
+Si des réplicas en lecture sont configurés (`REPLICA_DATABASE_URLS`), les requêtes
+GET/HEAD y sont servies, sauf pour un client qui vient d'écrire : il reste sur le
+primaire pendant `READ_YOUR_WRITES_SECONDS` (voir `app.db.routing`).
 """
+import logging
 import os
+import random
+import threading
+from typing import Any, Dict, List, Optional
+
+from fastapi import Request
 
+from sqlalchemy.engine import Engine, make_url
 from sqlmodel import Session, create_engine
 
-from app.core.config import settings
+from app.core.config import get_settings
+from app.db.routing import reads_from_replica
+
+logger = logging.getLogger(__name__)
+
+_engine: Optional[Engine] = None
+_replica_engines: Optional[List[Engine]] = None
+_engine_lock = threading.Lock()
 
 
 def _get_engine_url() -> str:
@@ -20,26 +39,87 @@ def _get_engine_url() -> str:
     - Pendant les tests (env USE_TEST_DB=1) : `settings.test_database_url` si définie,
       sinon on retombe sur `database_url`.
     """
+    settings = get_settings()
     use_test_db = os.getenv("USE_TEST_DB") == "1"
     if use_test_db and settings.test_database_url:
         return settings.test_database_url
     return settings.database_url
 
 
-_ENGINE_URL = _get_engine_url()
+def _get_replica_urls() -> List[str]:
+    """URLs des réplicas, selon la même règle que `_get_engine_url()`."""
+    settings = get_settings()
+    if os.getenv("USE_TEST_DB") == "1" and settings.test_database_url:
+        return settings.test_replica_urls
+    return settings.replica_urls
+
+
+def _pool_options() -> Dict[str, Any]:
+    """Taille du pool par worker (DB_POOL_SIZE / DB_MAX_OVERFLOW), sinon valeurs SQLAlchemy."""
+    settings = get_settings()
+    options: Dict[str, Any] = {}
+    if settings.db_pool_size is not None:
+        options["pool_size"] = settings.db_pool_size
+    if settings.db_max_overflow is not None:
+        options["max_overflow"] = settings.db_max_overflow
+    return options
+
+
+def get_engine() -> Engine:
+    """Moteur SQLAlchemy du process, créé au premier appel (thread-safe)."""
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                url = _get_engine_url()
+                logger.info("Using database %s", make_url(url).render_as_string(hide_password=True))
+                _engine = create_engine(url, **_pool_options())
+    return _engine
+
+
+def get_replica_engines() -> List[Engine]:
+    """Moteurs des réplicas en lecture (liste vide sans réplica configuré)."""
+    global _replica_engines
+    if _replica_engines is None:
+        with _engine_lock:
+            if _replica_engines is None:
+                urls = _get_replica_urls()
+                for url in urls:
+                    logger.info("Using read replica %s", make_url(url).render_as_string(hide_password=True))
+                _replica_engines = [create_engine(url, **_pool_options()) for url in urls]
+    return _replica_engines
+
+
+def dispose_engine() -> None:
+    """Ferme les connexions des pools (arrêt de l'application) ; les moteurs restent réutilisables."""
+    if _engine is not None:
+        _engine.dispose()
+    for replica in _replica_engines or ():
+        replica.dispose()
+
+
+def __getattr__(name: str):
+    """Compatibilité : `from app.db.session import engine` crée le moteur à ce moment-là."""
+    if name == "engine":
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-# Info simple pour vérifier facilement l'URL utilisée (utile surtout en tests).
-print(f"[DB] Using engine URL: {_ENGINE_URL}")
 
-engine = create_engine(_ENGINE_URL)
+def engine_for(request: Optional[Request]) -> Engine:
+    """Moteur à utiliser pour la requête : un réplica au hasard pour une lecture, sinon le primaire."""
+    replicas = get_replica_engines()
+    if replicas and request is not None and reads_from_replica(request):
+        return random.choice(replicas)
+    return get_engine()
 
 
-def get_session():
+def get_session(request: Request = None):
     """
     Générateur de session SQLModel (context manager).
 
     À utiliser comme dépendance FastAPI : Depends(get_session).
-    Ferme automatiquement la session après la requête.
+    Ferme automatiquement la session après la requête. Hors requête HTTP
+    (`request` absent), la session porte toujours sur le primaire.
     """
-    with Session(engine) as session:
+    with Session(engine_for(request)) as session:
         yield session
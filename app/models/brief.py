@@ -24,8 +24,8 @@ class BriefStudent(SQLModel, table=True):
     )
 
     id: Optional[int] = Field(default=None, primary_key=True)
-    brief_id: int = Field(foreign_key="briefs.id")
-    student_id: int = Field(foreign_key="users.id")
+    brief_id: int = Field(foreign_key="briefs.id", ondelete="CASCADE")
+    student_id: int = Field(foreign_key="users.id", ondelete="CASCADE", index=True)
 
     student: User = Relationship(back_populates="brief_links")
 
@@ -33,15 +33,20 @@ class BriefStudent(SQLModel, table=True):
 class Brief(SQLModel, table=True):
     """
     Brief (devoir) d'une session, assignable à un ou plusieurs étudiants (ou un groupe).
+
+    `reminded_at` / `overdue_at` sont posés par le planificateur d'échéances
+    (rappel avant `delivery_deadline`, brief échu).
     """
     __tablename__ = "briefs"
 
     id: Optional[int] = Field(default=None, primary_key=True)
     title: str = Field(min_length=2, max_length=255)
     description: Optional[str] = Field(default=None)
-    delivery_deadline: datetime = Field()
+    delivery_deadline: datetime = Field(index=True)
     order: int = Field(default=0)
-    session_id: int = Field(foreign_key="sessions.id")
+    session_id: int = Field(foreign_key="sessions.id", ondelete="CASCADE")
+    reminded_at: Optional[datetime] = None
+    overdue_at: Optional[datetime] = None
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(
         default_factory=datetime.utcnow,
@@ -53,4 +58,4 @@ class Brief(SQLModel, table=True):
 
 # Relations many-to-many ajoutées après définition (évite résolution forward ref / List[])
 BriefStudent.brief = sa_relationship("Brief", back_populates="student_links")
-Brief.student_links = sa_relationship("BriefStudent", back_populates="brief")
+Brief.student_links = sa_relationship("BriefStudent", back_populates="brief", passive_deletes=True)
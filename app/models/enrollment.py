@@ -6,10 +6,11 @@ Contrainte unique (session_id, student_id) : une inscription par session et par
 """
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import date, datetime
 from typing import Optional
 
-from sqlalchemy import UniqueConstraint
+from sqlalchemy import Column, UniqueConstraint
+from sqlalchemy.dialects.postgresql import BIT
 from sqlmodel import SQLModel, Field, Relationship
 
 # Import à l'exécution pour que SQLAlchemy résolve les relations (évite KeyError "'Session'").
@@ -28,6 +29,9 @@ class Enrollment(SQLModel, table=True):
         id: Clé primaire.
         session_id, student_id: Clés étrangères.
         enrolled_at: Date d'inscription.
+        attendance: Émargement en stockage bitmap (BIT VARYING, un bit par jour ou
+            demi-journée depuis `attendance_origin`) ; None en stockage rows.
+        attendance_origin: Jour correspondant au bit 0.
         session, student: Relations.
     """
 
@@ -37,9 +41,11 @@ class Enrollment(SQLModel, table=True):
     )
 
     id: Optional[int] = Field(default=None, primary_key=True)
-    session_id: int = Field(foreign_key="sessions.id")
-    student_id: int = Field(foreign_key="users.id")
+    session_id: int = Field(foreign_key="sessions.id", ondelete="CASCADE")
+    student_id: int = Field(foreign_key="users.id", ondelete="CASCADE", index=True)
     enrolled_at: datetime = Field(default_factory=datetime.utcnow)
+    attendance: Optional[str] = Field(default=None, sa_column=Column(BIT(varying=True), nullable=True))
+    attendance_origin: Optional[date] = None
 
     session: Session = Relationship(back_populates="enrollments")
     student: User = Relationship(back_populates="enrollments")
@@ -28,7 +28,7 @@ class Group(SQLModel, table=True):
     __tablename__ = "groups"
 
     id: Optional[int] = Field(default=None, primary_key=True)
-    session_id: int = Field(foreign_key="sessions.id")
+    session_id: int = Field(foreign_key="sessions.id", ondelete="CASCADE")
     name: str = Field(min_length=1, max_length=255)
 
     session: Session = Relationship(back_populates="groups")
@@ -46,12 +46,12 @@ class GroupMember(SQLModel, table=True):
     )
 
     id: Optional[int] = Field(default=None, primary_key=True)
-    group_id: int = Field(foreign_key="groups.id")
-    student_id: int = Field(foreign_key="users.id")
+    group_id: int = Field(foreign_key="groups.id", ondelete="CASCADE")
+    student_id: int = Field(foreign_key="users.id", ondelete="CASCADE")
 
     student: User = Relationship(back_populates="group_memberships")
 
 
 # Relations ajoutées après (évite List[] / Optional[] dans les annotations)
-Group.members = sa_relationship("GroupMember", back_populates="group")
+Group.members = sa_relationship("GroupMember", back_populates="group", passive_deletes=True)
 GroupMember.group = sa_relationship("Group", back_populates="members")
@@ -0,0 +1,42 @@
+"""
+Modèle clé d'idempotence (table `idempotency_keys`).
+
+Réponse d'un POST rejouable (en-tête `Idempotency-Key`), conservée jusqu'à
+`expires_at` ; voir app/core/idempotency.py.
+"""
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import Column, LargeBinary
+from sqlmodel import SQLModel, Field
+
+
+class IdempotencyKey(SQLModel, table=True):
+    """
+    Première exécution d'une requête idempotente.
+
+    Attributes:
+        key: Empreinte (SHA-256) de l'en-tête Idempotency-Key et de l'en-tête Authorization.
+        request_hash: Empreinte de la requête (méthode, chemin, corps) : une clé
+            réutilisée pour une autre requête est refusée.
+        status_code, content_type, body: Réponse enregistrée ; None tant que la
+            requête d'origine est en cours.
+        claim_token: Jeton de l'exécution qui détient la clé : elle seule enregistre ou
+            libère la réponse.
+        locked_at: Dernier signe de vie de l'exécution en cours (reprise possible, pour
+            la même requête, si elle n'en donne plus).
+        created_at: Date de la première requête.
+        expires_at: Date au-delà de laquelle la clé est oubliée.
+    """
+
+    __tablename__ = "idempotency_keys"
+
+    key: str = Field(primary_key=True, max_length=64)
+    request_hash: str = Field(max_length=64)
+    status_code: Optional[int] = None
+    content_type: Optional[str] = Field(default=None, max_length=255)
+    body: Optional[bytes] = Field(default=None, sa_column=Column(LargeBinary, nullable=True))
+    claim_token: Optional[str] = Field(default=None, max_length=32)
+    locked_at: datetime
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    expires_at: datetime = Field(index=True)
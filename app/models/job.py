@@ -0,0 +1,52 @@
+"""
+Modèle tâche planifiée (table `jobs`).
+
+File de tâches du planificateur d'échéances de briefs : une tâche par (type,
+brief, échéance), exécutée une seule fois par le worker qui la réclame
+(`FOR UPDATE SKIP LOCKED`, voir app/repositories/job_repo.py).
+"""
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import Index, UniqueConstraint, text
+from sqlmodel import SQLModel, Field
+
+# Types de tâche.
+BRIEF_REMINDER = "brief_reminder"
+BRIEF_OVERDUE = "brief_overdue"
+# Statuts.
+JOB_PENDING = "pending"
+JOB_DONE = "done"
+JOB_STALE = "stale"
+
+
+class Job(SQLModel, table=True):
+    """
+    Tâche à exécuter à partir de `run_at`.
+
+    Attributes:
+        id: Clé primaire.
+        kind: Type de tâche (`brief_reminder`, `brief_overdue`).
+        brief_id: Brief concerné (supprimé avec lui).
+        deadline: Échéance du brief au moment de la planification ; une tâche dont
+            le brief a changé d'échéance est écartée (`stale`) à l'exécution.
+        run_at: Date à partir de laquelle la tâche peut être réclamée.
+        status: `pending`, `done` ou `stale`.
+        created_at: Date de planification.
+        done_at: Date d'exécution.
+    """
+
+    __tablename__ = "jobs"
+    __table_args__ = (
+        UniqueConstraint("kind", "brief_id", "deadline", name="uq_job_kind_brief_deadline"),
+        Index("ix_jobs_pending_run_at", "run_at", postgresql_where=text("status = 'pending'")),
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    kind: str = Field(max_length=50)
+    brief_id: int = Field(foreign_key="briefs.id", ondelete="CASCADE")
+    deadline: datetime
+    run_at: datetime
+    status: str = Field(default=JOB_PENDING, max_length=20)
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    done_at: Optional[datetime] = None
@@ -0,0 +1,53 @@
+"""
+Modèle événement de changement (table `outbox_events`).
+
+Outbox transactionnelle : chaque écriture d'inscription, d'émargement, de brief
+ou de groupe ajoute un événement dans la même transaction (voir app/db/outbox.py),
+relu dans l'ordre des transactions par le dispatcher (app/core/events.py).
+"""
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from sqlalchemy import BigInteger, Column, Index, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlmodel import SQLModel, Field
+
+# Sujets d'événements.
+ENROLLMENT_CREATED = "enrollment.created"
+ENROLLMENT_UPDATED = "enrollment.updated"
+ENROLLMENT_DELETED = "enrollment.deleted"
+SIGNATURE_CREATED = "signature.created"
+BRIEF_CREATED = "brief.created"
+BRIEF_UPDATED = "brief.updated"
+BRIEF_DELETED = "brief.deleted"
+GROUP_CREATED = "group.created"
+GROUP_UPDATED = "group.updated"
+GROUP_DELETED = "group.deleted"
+
+
+class OutboxEvent(SQLModel, table=True):
+    """
+    Événement écrit avec la modification qu'il décrit.
+
+    Attributes:
+        id: Clé primaire (ordre d'insertion, pas de commit).
+        xid: Identifiant de la transaction d'écriture (`pg_current_xact_id()`) : le
+            dispatcher ne lit que les transactions terminées, dans leur ordre.
+        topic: Sujet (`enrollment.created`, `brief.updated`, ...).
+        payload: Identifiants et champs utiles au consommateur (JSON).
+        created_at: Date d'écriture.
+    """
+
+    __tablename__ = "outbox_events"
+    __table_args__ = (Index("ix_outbox_events_xid_id", "xid", "id"),)
+
+    id: Optional[int] = Field(default=None, sa_column=Column(BigInteger, primary_key=True, autoincrement=True))
+    xid: Optional[int] = Field(
+        default=None,
+        sa_column=Column(
+            BigInteger, nullable=False, server_default=text("CAST(CAST(pg_current_xact_id() AS text) AS bigint)")
+        ),
+    )
+    topic: str = Field(max_length=50)
+    payload: Dict[str, Any] = Field(sa_column=Column(JSONB, nullable=False))
+    created_at: datetime = Field(default_factory=datetime.utcnow, index=True)
@@ -3,10 +3,15 @@ Modèle session (table `sessions`).
 
 Une session est une instance d'une formation, animée par un formateur,
 avec des dates, une capacité max et un statut. Les apprenants s'y inscrivent via Enrollment.
+Un formateur n'anime jamais deux sessions qui se chevauchent (contrainte d'exclusion GiST) ;
+la période seule est aussi indexée (GiST) pour les requêtes de calendrier.
 """
 from datetime import datetime
 from typing import TYPE_CHECKING, List, Optional
 
+from sqlalchemy import Index, text
+from sqlalchemy.dialects.postgresql import ExcludeConstraint
+
 from app.utils.enum import SessionStatus
 from sqlmodel import SQLModel, Field, Relationship
 
@@ -18,6 +23,16 @@ if TYPE_CHECKING:
     from app.models.user import User
 
 
+TEACHER_SCHEDULE_CONSTRAINT = "excl_sessions_teacher_schedule"
+# Clés étrangères restrictives : une formation ou un formateur ayant des sessions n'est pas supprimé.
+FORMATION_FOREIGN_KEY = "sessions_formation_id_fkey"
+TEACHER_FOREIGN_KEY = "sessions_teacher_id_fkey"
+# Expressions indexées par la contrainte : les requêtes de chevauchement les reprennent
+# telles quelles pour que le planificateur utilise l'index GiST.
+TEACHER_RANGE_SQL = "int4range(teacher_id, teacher_id, '[]')"
+PERIOD_RANGE_SQL = "tsrange(start_date, end_date)"
+
+
 def _formation_cls():
     from app.models.formation import Formation
     return Formation
@@ -50,6 +65,15 @@ class Session(SQLModel, table=True):
     """
 
     __tablename__ = "sessions"
+    __table_args__ = (
+        ExcludeConstraint(
+            (text(TEACHER_RANGE_SQL), "&&"),
+            (text(PERIOD_RANGE_SQL), "&&"),
+            name=TEACHER_SCHEDULE_CONSTRAINT,
+            using="gist",
+        ),
+        Index("ix_sessions_period", text(PERIOD_RANGE_SQL), postgresql_using="gist"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     formation_id: int = Field(foreign_key="formations.id")
@@ -62,6 +86,6 @@ class Session(SQLModel, table=True):
     # Callables pour résolution différée (évite KeyError "'Formation'" avec Python 3.14)
     formation: _formation_cls = Relationship(back_populates="sessions")
     teacher: _user_cls = Relationship(back_populates="taught_sessions")
-    enrollments: _enrollment_cls = Relationship(back_populates="session")
-    briefs: List["Brief"] = Relationship(back_populates="session")
-    groups: List["Group"] = Relationship(back_populates="session")
+    enrollments: _enrollment_cls = Relationship(back_populates="session", passive_deletes=True)
+    briefs: List["Brief"] = Relationship(back_populates="session", passive_deletes=True)
+    groups: List["Group"] = Relationship(back_populates="session", passive_deletes=True)
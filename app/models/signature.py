@@ -1,22 +1,28 @@
 from datetime import datetime
-from typing import Optional, Optional
+from typing import Optional
 from sqlmodel import SQLModel, Field
-    
+
 class Signature(SQLModel, table=True):
     """
     Signature d'émargement par un utilisateur.
 
+    La table est partitionnée par mois sur `date` (voir app/db/partitions.py) :
+    la clé primaire en base est (id, date), id restant unique (séquence) et
+    servant seul d'identité côté ORM.
+
     Attributes:
         id: Clé primaire.
         session_id: Session concernée.
         user_id: Utilisateur qui signe.
+        date: Jour signé (00:00:00), clé de partitionnement.
     """
 
     __tablename__ = "signatures"
-    
-    id: Optional[int] = Field(default=None, primary_key=True)
-    session_id: int = Field(foreign_key="sessions.id")
-    user_id: int = Field(foreign_key="users.id")
-    date: Optional[datetime] = None
-    
-    
\ No newline at end of file
+    __table_args__ = {"postgresql_partition_by": "RANGE (date)"}
+    __mapper_args__ = {"primary_key": ["id"]}
+
+    id: Optional[int] = Field(default=None, primary_key=True, sa_column_kwargs={"autoincrement": True})
+    session_id: int = Field(foreign_key="sessions.id", ondelete="CASCADE")
+    user_id: int = Field(foreign_key="users.id", ondelete="CASCADE", index=True)
+    date: datetime = Field(primary_key=True)
+
@@ -64,7 +64,7 @@ class User(SQLModel, table=True):
     role: Role = Field(default=Role.LEARNER)
 
     taught_sessions: _session_cls = Relationship(back_populates="teacher")
-    enrollments: _enrollment_cls = Relationship(back_populates="student")
-    brief_links: _brief_student_cls = Relationship(back_populates="student")
-    group_memberships: _group_member_cls = Relationship(back_populates="student")
+    enrollments: _enrollment_cls = Relationship(back_populates="student", passive_deletes=True)
+    brief_links: _brief_student_cls = Relationship(back_populates="student", passive_deletes=True)
+    group_memberships: _group_member_cls = Relationship(back_populates="student", passive_deletes=True)
     must_change_password: bool = Field(default=True)
@@ -0,0 +1,274 @@
+"""
+Émargement en bitmap par inscription (ATTENDANCE_STORAGE=bitmap).
+
+Au lieu d'une ligne `signatures` par apprenant et par jour, chaque inscription
+porte un BIT VARYING : un bit par jour (ATTENDANCE_SLOTS_PER_DAY=1) ou deux, matin
+puis après-midi (=2), le bit 0 correspondant à `attendance_origin`. Émarger est un
+seul UPDATE qui positionne le bit (et étend la chaîne au besoin) ; relire la
+présence d'une session revient à une petite ligne par apprenant.
+
+Le repository expose les méthodes de SignatureRepository utilisées par les
+services. Les émargements lus sont des `AttendanceMark` dont l'id encode
+(inscription, jour, créneau) : stable, et relu par `get_by_id` sans table dédiée.
+`backfill_from_signatures` recopie la table `signatures` en bits (bascule de
+stockage, jeu de données des benchmarks).
+"""
+from datetime import date, datetime, time, timedelta
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+from sqlmodel import Session, select
+
+from app.core.config import get_settings
+from app.db import outbox
+from app.db.loader import loader_for
+from app.models.enrollment import Enrollment
+from app.models.signature import Signature
+from app.models.user import User
+from app.repositories.signature_repo import SignatureRepository, signature_created_event
+from app.utils.enum import AttendanceSlot
+
+ATTENDANCE_STORAGES = ("rows", "bitmap")
+SLOTS = list(AttendanceSlot)
+# id = inscription << MARK_ID_SHIFT | (ordinal du jour << 1 | créneau) ; 2**23 couvre l'an 9999.
+MARK_ID_SHIFT = 23
+
+# Les expressions du SET voient l'ancienne ligne : `target` calcule l'origine après
+# signature (recul si le jour précède l'origine actuelle) et la chaîne décalée
+# d'autant ; le WHERE final écarte un bit déjà positionné (déjà signé).
+_SIGN = text(
+    """
+    WITH target AS (
+        SELECT id,
+               LEAST(COALESCE(attendance_origin, :day), :day) AS origin,
+               CAST(repeat('0', (COALESCE(attendance_origin, :day) - LEAST(COALESCE(attendance_origin, :day), :day))
+                                * :slots) AS varbit)
+                   || COALESCE(attendance, CAST('' AS varbit)) AS bits
+        FROM enrollments
+        WHERE session_id = :session_id AND student_id = :user_id
+        FOR UPDATE
+    ), placed AS (
+        SELECT id, origin, bits, (:day - origin) * :slots + :slot AS bit FROM target
+    )
+    UPDATE enrollments AS e
+    SET attendance_origin = p.origin,
+        attendance = set_bit(
+            p.bits || CAST(repeat('0', GREATEST(p.bit + 1 - length(p.bits), 0)) AS varbit), p.bit, 1
+        )
+    FROM placed AS p
+    WHERE e.id = p.id AND CASE WHEN p.bit < length(p.bits) THEN get_bit(p.bits, p.bit) = 0 ELSE true END
+    RETURNING e.id
+    """
+)
+
+# Un jour signé dans `signatures` remplit tous ses créneaux ; les jours entre le
+# premier et le dernier signés sans ligne restent à 0.
+_BACKFILL = text(
+    """
+    WITH spans AS (
+        SELECT session_id, user_id, MIN(date) AS first, MAX(date) AS last
+        FROM signatures GROUP BY session_id, user_id
+    ), days AS (
+        SELECT sp.session_id, sp.user_id, CAST(sp.first AS date) AS origin, d.day, s.id IS NOT NULL AS signed
+        FROM spans AS sp
+        CROSS JOIN LATERAL generate_series(sp.first, sp.last, interval '1 day') AS d(day)
+        LEFT JOIN signatures AS s ON s.session_id = sp.session_id AND s.user_id = sp.user_id AND s.date = d.day
+    ), bits AS (
+        SELECT session_id, user_id, origin,
+               string_agg(repeat(CASE WHEN signed THEN '1' ELSE '0' END, :slots), '' ORDER BY day) AS bits
+        FROM days GROUP BY session_id, user_id, origin
+    )
+    UPDATE enrollments AS e
+    SET attendance_origin = b.origin, attendance = CAST(b.bits AS varbit)
+    FROM bits AS b
+    WHERE e.session_id = b.session_id AND e.student_id = b.user_id
+    """
+)
+
+
+class AttendanceMark(NamedTuple):
+    """Un émargement lu depuis un bitmap (mêmes champs que SignatureRead)."""
+
+    id: int
+    session_id: int
+    user_id: int
+    date: datetime
+    slot: Optional[AttendanceSlot]
+
+
+SignatureRecord = Union[Signature, AttendanceMark]
+
+
+def mark_id(enrollment_id: int, day: date, slot_index: int) -> int:
+    return enrollment_id << MARK_ID_SHIFT | day.toordinal() << 1 | slot_index
+
+
+class AttendanceBitmapRepository:
+    """Accès données de l'émargement stocké en bits sur `enrollments`."""
+
+    def __init__(self, session: Session, slots_per_day: int = 1):
+        if slots_per_day not in (1, 2):
+            raise ValueError(f"slots_per_day must be 1 or 2, got {slots_per_day}")
+        self.session = session
+        self.slots_per_day = slots_per_day
+
+    def _marks(
+        self, enrollment_id: int, session_id: int, user_id: int, bits: Optional[str], origin: Optional[date]
+    ) -> Iterator[AttendanceMark]:
+        """Émargements d'une inscription, par jour puis créneau."""
+        if not bits:
+            return
+        for index, bit in enumerate(bits):
+            if bit != "1":
+                continue
+            day = origin + timedelta(days=index // self.slots_per_day)
+            slot_index = index % self.slots_per_day
+            yield AttendanceMark(
+                id=mark_id(enrollment_id, day, slot_index),
+                session_id=session_id,
+                user_id=user_id,
+                date=datetime.combine(day, time.min),
+                slot=SLOTS[slot_index] if self.slots_per_day == 2 else None,
+            )
+
+    def create(
+        self, session_id: int, user_id: int, sign_date: date, slot: Optional[AttendanceSlot] = None
+    ) -> Optional[AttendanceMark]:
+        """Positionne le bit du jour (et du créneau) en un UPDATE. None si déjà signé ou non inscrit."""
+        slot_index = SLOTS.index(slot) if slot is not None else 0
+        enrollment_id = self.session.execute(
+            _SIGN,
+            {
+                "session_id": session_id,
+                "user_id": user_id,
+                "day": sign_date,
+                "slots": self.slots_per_day,
+                "slot": slot_index,
+            },
+        ).scalar()
+        if enrollment_id is None:
+            self.session.commit()
+            return None
+        id = mark_id(enrollment_id, sign_date, slot_index)
+        outbox.append(self.session, [signature_created_event(id, session_id, user_id, sign_date, slot)])
+        self.session.commit()
+        return AttendanceMark(
+            id=id,
+            session_id=session_id,
+            user_id=user_id,
+            date=datetime.combine(sign_date, time.min),
+            slot=slot,
+        )
+
+    def get_by_id(self, id: int) -> Optional[AttendanceMark]:
+        """Émargement désigné par un id de `mark_id`, s'il est toujours positionné."""
+        enrollment = loader_for(self.session).get(Enrollment, id >> MARK_ID_SHIFT)
+        if enrollment is None:
+            return None
+        return next(
+            (
+                mark
+                for mark in self._marks(
+                    enrollment.id,
+                    enrollment.session_id,
+                    enrollment.student_id,
+                    enrollment.attendance,
+                    enrollment.attendance_origin,
+                )
+                if mark.id == id
+            ),
+            None,
+        )
+
+    def _session_rows(self, session_id: int, user_id: Optional[int] = None) -> List[Tuple[int, int, str, date]]:
+        """(inscription, apprenant, bits, origine) des inscrits ayant émargé, par apprenant."""
+        query = select(
+            Enrollment.id, Enrollment.student_id, Enrollment.attendance, Enrollment.attendance_origin
+        ).where(Enrollment.session_id == session_id, Enrollment.attendance.is_not(None))
+        if user_id is not None:
+            query = query.where(Enrollment.student_id == user_id)
+        return list(self.session.exec(query.order_by(Enrollment.student_id)).all())
+
+    def list_by_session_and_date(self, session_id: int, sign_date: date) -> List[AttendanceMark]:
+        """Émargements du jour pour la session (une ligne lue par apprenant)."""
+        return self.list_by_session_and_date_range(session_id, sign_date, sign_date)
+
+    def list_by_session_and_user(
+        self, session_id: int, user_id: int, start_date: date, end_date: date
+    ) -> List[AttendanceMark]:
+        """Historique d'un apprenant pour la session, par date puis créneau."""
+        return [
+            mark
+            for enrollment_id, student_id, bits, origin in self._session_rows(session_id, user_id)
+            for mark in self._marks(enrollment_id, session_id, student_id, bits, origin)
+            if start_date <= mark.date.date() <= end_date
+        ]
+
+    def list_by_session_and_date_range(self, session_id: int, start_date: date, end_date: date) -> List[AttendanceMark]:
+        """Émargements de la session entre deux jours inclus, par date puis apprenant."""
+        marks = [
+            mark
+            for enrollment_id, student_id, bits, origin in self._session_rows(session_id)
+            for mark in self._marks(enrollment_id, session_id, student_id, bits, origin)
+            if start_date <= mark.date.date() <= end_date
+        ]
+        return sorted(marks, key=lambda mark: (mark.date, mark.user_id, mark.id))
+
+    def _signed_days(self, bits: str) -> int:
+        step = self.slots_per_day
+        return sum("1" in bits[index : index + step] for index in range(0, len(bits), step))
+
+    def count_days_by_session_for_user(
+        self, user_id: int, session_ids: List[int], start_date: date, end_date: date
+    ) -> Dict[int, int]:
+        """
+        Nombre de jours signés (au moins un créneau) par session pour l'apprenant.
+        Même signature que SignatureRepository ; les bornes de dates sont sans objet ici.
+        """
+        if not session_ids:
+            return {}
+        rows = self.session.exec(
+            select(Enrollment.session_id, Enrollment.attendance).where(
+                Enrollment.student_id == user_id,
+                Enrollment.session_id.in_(session_ids),
+                Enrollment.attendance.is_not(None),
+            )
+        ).all()
+        return {session_id: self._signed_days(bits) for session_id, bits in rows if "1" in bits}
+
+    def list_signers_for_date(self, session_ids: List[int], sign_date: date) -> List[Tuple[int, User]]:
+        """(session_id, utilisateur) pour chaque inscrit ayant émargé ce jour-là (une requête, jointure users)."""
+        if not session_ids:
+            return []
+        rows = self.session.exec(
+            select(Enrollment.session_id, User, Enrollment.attendance, Enrollment.attendance_origin)
+            .join(User, User.id == Enrollment.student_id)
+            .where(
+                Enrollment.session_id.in_(session_ids),
+                Enrollment.attendance.is_not(None),
+                Enrollment.attendance_origin <= sign_date,
+            )
+            .order_by(Enrollment.session_id, User.last_name, User.first_name, User.id)
+        ).all()
+        signers = []
+        for session_id, user, bits, origin in rows:
+            start = (sign_date - origin).days * self.slots_per_day
+            if "1" in bits[start : start + self.slots_per_day]:
+                signers.append((session_id, user))
+        return signers
+
+
+def backfill_from_signatures(conn: Connection, slots_per_day: int = 1) -> int:
+    """Réécrit le bitmap de chaque inscription depuis `signatures`. Retourne le nombre d'inscriptions mises à jour."""
+    return conn.execute(_BACKFILL, {"slots": slots_per_day}).rowcount
+
+
+def get_signature_repository(session: Session) -> Union[SignatureRepository, AttendanceBitmapRepository]:
+    """Repository d'émargement selon ATTENDANCE_STORAGE ("rows" par défaut, ou "bitmap")."""
+    settings = get_settings()
+    if settings.attendance_storage not in ATTENDANCE_STORAGES:
+        raise ValueError(f"Unknown ATTENDANCE_STORAGE: {settings.attendance_storage}")
+    if settings.attendance_storage == "bitmap":
+        return AttendanceBitmapRepository(session, settings.attendance_slots_per_day)
+    return SignatureRepository(session)
@@ -2,14 +2,22 @@
 Repository CRUD pour l'entité Brief.
 
 Encapsule l'accès en base (création avec student_ids, lecture, mise à jour, suppression)
-et les listes par session_id / student_id.
+et les listes par session_id / student_id. Chaque écriture ajoute son événement
+à l'outbox dans la même transaction.
 """
-from typing import List, Optional
+from datetime import datetime
+from typing import List, Optional, Tuple
 
+from sqlalchemy import delete
 from sqlmodel import Session, select
 
+from app.db import outbox
+from app.db.loader import loader_for
 from app.models.brief import Brief
 from app.models.brief_student import BriefStudent
+from app.models.outbox import BRIEF_CREATED, BRIEF_DELETED, BRIEF_UPDATED
+from app.models.session import Session as SessionModel
+from app.repositories.membership import NO_CHANGE, MembershipChange, sync_members
 from app.schemas.brief import BriefCreate, BriefUpdate
 
 
@@ -29,63 +37,107 @@ class BriefRepository:
         payload = data.model_dump(exclude={"student_ids", "group_id"})
         brief = Brief(**payload)
         self.session.add(brief)
-        self.session.commit()
-        self.session.refresh(brief)
+        self.session.flush()
         for sid in student_ids:
             self.session.add(BriefStudent(brief_id=brief.id, student_id=sid))
-        if student_ids:
-            self.session.commit()
-            self.session.refresh(brief)
+        outbox.append(
+            self.session,
+            [(BRIEF_CREATED, {"id": brief.id, "session_id": brief.session_id, "student_ids": list(student_ids)})],
+        )
+        self.session.commit()
+        self.session.refresh(brief)
         return brief
 
     def get_by_id(self, id: int) -> Optional[Brief]:
-        return self.session.get(Brief, id)
+        return loader_for(self.session).get(Brief, id)
 
     def exists(self, id: int) -> bool:
         return self.get_by_id(id) is not None
 
+    def _with_students(self, briefs: List[Brief]) -> List[Brief]:
+        """Charge les liaisons brief_students de tous les briefs en une requête (pas de N+1)."""
+        loader_for(self.session).load_related(briefs, "student_links")
+        return briefs
+
     def list(self) -> List[Brief]:
-        return list(self.session.exec(select(Brief)).all())
+        return self._with_students(list(self.session.exec(select(Brief)).all()))
 
     def list_by_session_id(self, session_id: int) -> List[Brief]:
-        return list(
-            self.session.exec(select(Brief).where(Brief.session_id == session_id)).all()
+        return self._with_students(
+            list(self.session.exec(select(Brief).where(Brief.session_id == session_id)).all())
         )
 
     def list_by_student_id(self, student_id: int) -> List[Brief]:
+        return self._with_students(
+            list(
+                self.session.exec(
+                    select(Brief)
+                    .join(BriefStudent, Brief.id == BriefStudent.brief_id)
+                    .where(BriefStudent.student_id == student_id)
+                ).all()
+            )
+        )
+
+    def list_upcoming_by_student_id(self, student_id: int, after: datetime, limit: int) -> List[Brief]:
+        """Briefs assignés à l'étudiant dont l'échéance est postérieure à `after`, par échéance croissante."""
         return list(
             self.session.exec(
                 select(Brief)
                 .join(BriefStudent, Brief.id == BriefStudent.brief_id)
-                .where(BriefStudent.student_id == student_id)
+                .where(BriefStudent.student_id == student_id, Brief.delivery_deadline >= after)
+                .order_by(Brief.delivery_deadline, Brief.id)
+                .limit(limit)
             ).all()
         )
 
-    def update(self, id: int, data: BriefUpdate, student_ids: Optional[List[int]] = None) -> Optional[Brief]:
+    def list_due_for_teacher(self, teacher_id: int, start: datetime, end: datetime) -> List[Brief]:
+        """Briefs des sessions du formateur dont l'échéance tombe dans [start, end), par échéance."""
+        return list(
+            self.session.exec(
+                select(Brief)
+                .join(SessionModel, SessionModel.id == Brief.session_id)
+                .where(
+                    SessionModel.teacher_id == teacher_id,
+                    Brief.delivery_deadline >= start,
+                    Brief.delivery_deadline < end,
+                )
+                .order_by(Brief.delivery_deadline, Brief.id)
+            ).all()
+        )
+
+    def update(
+        self, id: int, data: BriefUpdate, student_ids: Optional[List[int]] = None
+    ) -> Optional[Tuple[Brief, MembershipChange]]:
+        """
+        Met à jour les champs fournis et, si `student_ids` est fourni, aligne les assignations
+        dessus (seule la différence est écrite). Retourne (brief, ajouts / retraits), None si absent.
+        """
         brief = self.get_by_id(id)
         if brief is None:
             return None
         payload = data.model_dump(exclude_unset=True, exclude={"student_ids", "group_id"})
         for key, value in payload.items():
             setattr(brief, key, value)
+        change = NO_CHANGE
         if student_ids is not None:
-            existing = list(
-                self.session.exec(select(BriefStudent).where(BriefStudent.brief_id == id))
-            )
-            for link in existing:
-                self.session.delete(link)
-            for sid in student_ids:
-                self.session.add(BriefStudent(brief_id=id, student_id=sid))
+            change = sync_members(self.session, BriefStudent, BriefStudent.brief_id, id, student_ids)
+        self.session.flush()
+        event = {
+            "id": id,
+            "session_id": brief.session_id,
+            "fields": sorted(payload),
+            "added_student_ids": change.added,
+            "removed_student_ids": change.removed,
+        }
+        outbox.append(self.session, [(BRIEF_UPDATED, event)])
         self.session.commit()
         self.session.refresh(brief)
-        return brief
+        return brief, change
 
     def delete(self, id: int) -> bool:
-        brief = self.get_by_id(id)
-        if brief is None:
-            return False
-        for link in self.session.exec(select(BriefStudent).where(BriefStudent.brief_id == id)).all():
-            self.session.delete(link)
-        self.session.delete(brief)
+        """Supprime le brief par id (liaisons apprenants supprimées en cascade par la base). Retourne True si supprimé, False si non trouvé."""
+        session_id = self.session.execute(delete(Brief).where(Brief.id == id).returning(Brief.session_id)).scalar()
+        if session_id is not None:
+            outbox.append(self.session, [(BRIEF_DELETED, {"id": id, "session_id": session_id})])
         self.session.commit()
-        return True
+        return session_id is not None
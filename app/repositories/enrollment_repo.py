@@ -2,16 +2,27 @@
 Repository CRUD pour l'entité Enrollment.
 
 Encapsule l'accès en base (création, lecture, mise à jour, suppression)
-et les listes par session_id / student_id.
+et les listes par session_id / student_id. Chaque écriture ajoute son événement
+à l'outbox dans la même transaction.
 """
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
+from sqlalchemy import delete, func
 from sqlmodel import Session, select
 
+from app.db import outbox
+from app.db.loader import loader_for
 from app.models.enrollment import Enrollment
+from app.models.formation import Formation
+from app.models.outbox import ENROLLMENT_CREATED, ENROLLMENT_DELETED, ENROLLMENT_UPDATED
+from app.models.session import Session as SessionModel
 from app.schemas.enrollement import EnrollmentCreate, EnrollmentUpdate
 
 
+def _event_payload(enrollment: Enrollment) -> dict:
+    return {"id": enrollment.id, "session_id": enrollment.session_id, "student_id": enrollment.student_id}
+
+
 class EnrollmentRepository:
     """
     Accès données pour les inscriptions.
@@ -28,13 +39,15 @@ class EnrollmentRepository:
         """Crée une inscription en base et retourne l'instance avec id rempli."""
         enrollment = Enrollment(**data.model_dump())
         self.session.add(enrollment)
+        self.session.flush()
+        outbox.append(self.session, [(ENROLLMENT_CREATED, _event_payload(enrollment))])
         self.session.commit()
         self.session.refresh(enrollment)
         return enrollment
 
     def get_by_id(self, id: int) -> Optional[Enrollment]:
         """Retourne l'inscription d'id donné ou None."""
-        return self.session.get(Enrollment, id)
+        return loader_for(self.session).get(Enrollment, id)
 
     def exists(self, id: int) -> bool:
         """Retourne True si une inscription avec cet id existe, False sinon."""
@@ -52,23 +65,37 @@ class EnrollmentRepository:
         payload = data.model_dump(exclude_unset=True)
         for key, value in payload.items():
             setattr(enrollment, key, value)
+        self.session.flush()
+        outbox.append(self.session, [(ENROLLMENT_UPDATED, {**_event_payload(enrollment), "fields": sorted(payload)})])
         self.session.commit()
         self.session.refresh(enrollment)
         return enrollment
 
     def delete(self, id: int) -> bool:
         """Supprime l'inscription par id. Retourne True si supprimée, False si non trouvée."""
-        enrollment = self.get_by_id(id)
-        if enrollment is None:
-            return False
-        self.session.delete(enrollment)
+        deleted = self.session.execute(
+            delete(Enrollment).where(Enrollment.id == id).returning(Enrollment.session_id, Enrollment.student_id)
+        ).first()
+        if deleted is not None:
+            outbox.append(
+                self.session,
+                [(ENROLLMENT_DELETED, {"id": id, "session_id": deleted.session_id, "student_id": deleted.student_id})],
+            )
         self.session.commit()
-        return True
+        return deleted is not None
 
     def list_by_session_id(self, session_id: int) -> List[Enrollment]:
         """Retourne toutes les inscriptions pour une session donnée."""
         return self.session.exec(select(Enrollment).where(Enrollment.session_id == session_id)).all()
 
+    def list_student_ids_by_session_id(self, session_id: int) -> List[int]:
+        """Ids des apprenants inscrits à la session, par id croissant (sans charger les inscriptions)."""
+        return list(
+            self.session.exec(
+                select(Enrollment.student_id).where(Enrollment.session_id == session_id).order_by(Enrollment.student_id)
+            ).all()
+        )
+
     def list_by_student_id(self, student_id: int) -> List[Enrollment]:
         """Retourne toutes les inscriptions pour un étudiant donné."""
         return self.session.exec(select(Enrollment).where(Enrollment.student_id == student_id)).all()
@@ -76,3 +103,28 @@ class EnrollmentRepository:
     def get_by_session_id_and_student_id(self, session_id: int, student_id: int) -> Optional[Enrollment]:
         """Retourne l'inscription pour une session et un étudiant donnés."""
         return self.session.exec(select(Enrollment).where(Enrollment.session_id == session_id, Enrollment.student_id == student_id)).first()
+
+    def list_with_session_and_formation_by_student_id(
+        self, student_id: int
+    ) -> List[Tuple[Enrollment, SessionModel, Formation]]:
+        """Inscriptions d'un apprenant avec leur session et leur formation (une requête, jointures), par date de début."""
+        return list(
+            self.session.exec(
+                select(Enrollment, SessionModel, Formation)
+                .join(SessionModel, SessionModel.id == Enrollment.session_id)
+                .join(Formation, Formation.id == SessionModel.formation_id)
+                .where(Enrollment.student_id == student_id)
+                .order_by(SessionModel.start_date, Enrollment.id)
+            ).all()
+        )
+
+    def count_by_session_ids(self, session_ids: List[int]) -> Dict[int, int]:
+        """Nombre d'inscrits par session (une requête GROUP BY) ; les sessions sans inscrit sont absentes."""
+        if not session_ids:
+            return {}
+        rows = self.session.exec(
+            select(Enrollment.session_id, func.count())
+            .where(Enrollment.session_id.in_(session_ids))
+            .group_by(Enrollment.session_id)
+        ).all()
+        return {session_id: count for session_id, count in rows}
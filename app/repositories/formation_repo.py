@@ -4,11 +4,14 @@ Repository CRUD pour l'entité Formation.
 Encapsule l'accès en base (création, lecture, mise à jour, suppression),
 la pagination et les filtres (niveau, recherche par titre).
 """
-from typing import List, Optional
+from typing import List, Optional, Sequence
 
+from sqlalchemy import Row, delete
 from sqlmodel import Session, select
 
+from app.db.loader import loader_for
 from app.models.formation import Formation
+from app.repositories import projection
 from app.schemas.formation import FormationCreate, FormationUpdate
 from app.utils.enum import Level
 
@@ -37,7 +40,7 @@ class FormationRepository:
 
     def get_by_id(self, id: int) -> Optional[Formation]:
         """Retourne la formation d'id donné ou None."""
-        return self.session.get(Formation, id)
+        return loader_for(self.session).get(Formation, id)
 
     def get_by_title(self, title: str) -> Optional[Formation]:
         """Retourne la formation avec ce titre (comparaison insensible à la casse) ou None."""
@@ -52,6 +55,28 @@ class FormationRepository:
         """Retourne True si une formation avec cet id existe, False sinon."""
         return self.get_by_id(id) is not None
 
+    def list_by_ids(self, ids: List[int]) -> List[Formation]:
+        """Retourne les formations dont l'id figure dans `ids` (au plus une requête IN ; ordre non garanti)."""
+        return list(loader_for(self.session).get_many(Formation, ids).values())
+
+    def list_columns(
+        self,
+        fields: Sequence[str],
+        *,
+        ids: Optional[List[int]] = None,
+        offset: int = 0,
+        limit: int = 100,
+    ) -> List[Row]:
+        """
+        Projection SQL : lignes ne portant que les colonnes `fields` (et l'id).
+
+        Avec `ids`, les formations de ces ids (une requête IN, sans pagination) ;
+        sinon la même page que list(). limit plafonné à MAX_PAGE_SIZE.
+        """
+        return projection.list_columns(
+            self.session, Formation, fields, ids=ids, offset=offset, limit=min(limit, MAX_PAGE_SIZE)
+        )
+
     def list(
         self,
         offset: int = 0,
@@ -90,9 +115,6 @@ class FormationRepository:
 
     def delete(self, id: int) -> bool:
         """Supprime la formation par id. Retourne True si supprimée, False si non trouvée."""
-        formation = self.get_by_id(id)
-        if formation is None:
-            return False
-        self.session.delete(formation)
+        result = self.session.execute(delete(Formation).where(Formation.id == id))
         self.session.commit()
-        return True
+        return result.rowcount > 0
@@ -1,11 +1,19 @@
 """
-Repository CRUD pour Group et GroupMember.
+Repository CRUD pour Group et GroupMember, et création en masse (répartition automatique).
+
+Chaque écriture ajoute ses événements à l'outbox dans la même transaction.
 """
-from typing import List, Optional
+from typing import List, Optional, Sequence, Tuple
 
+from sqlalchemy import delete, insert
+from sqlalchemy.orm import aliased
 from sqlmodel import Session, select
 
+from app.db import outbox
+from app.db.loader import loader_for
 from app.models.group import Group, GroupMember
+from app.models.outbox import GROUP_CREATED, GROUP_DELETED, GROUP_UPDATED
+from app.repositories.membership import NO_CHANGE, MembershipChange, sync_members
 from app.schemas.group import GroupCreate, GroupUpdate
 
 
@@ -16,22 +24,73 @@ class GroupRepository:
     def create(self, data: GroupCreate) -> Group:
         group = Group(session_id=data.session_id, name=data.name.strip())
         self.session.add(group)
-        self.session.commit()
-        self.session.refresh(group)
+        self.session.flush()
         student_ids = data.student_ids or []
         for sid in student_ids:
             self.session.add(GroupMember(group_id=group.id, student_id=sid))
-        if student_ids:
-            self.session.commit()
-            self.session.refresh(group)
+        outbox.append(
+            self.session,
+            [(GROUP_CREATED, {"id": group.id, "session_id": group.session_id, "student_ids": list(student_ids)})],
+        )
+        self.session.commit()
+        self.session.refresh(group)
         return group
 
     def get_by_id(self, id: int) -> Optional[Group]:
-        return self.session.get(Group, id)
+        return loader_for(self.session).get(Group, id)
 
     def list_by_session_id(self, session_id: int) -> List[Group]:
+        groups = list(self.session.exec(select(Group).where(Group.session_id == session_id)).all())
+        loader_for(self.session).load_related(groups, "members")
+        return groups
+
+    def bulk_create(self, session_id: int, groups: Sequence[Tuple[str, Sequence[int]]]) -> List[int]:
+        """
+        Crée les groupes `(nom, student_ids)` de la session en une transaction : un INSERT
+        multi-lignes pour les groupes (RETURNING id, dans l'ordre fourni), un pour les membres.
+        Retourne les ids des groupes créés, dans l'ordre de `groups`.
+        """
+        if not groups:
+            return []
+        group_ids = list(
+            self.session.execute(
+                insert(Group).returning(Group.id, sort_by_parameter_order=True),
+                [{"session_id": session_id, "name": name} for name, _ in groups],
+            ).scalars()
+        )
+        members = [
+            {"group_id": group_id, "student_id": student_id}
+            for group_id, (_, student_ids) in zip(group_ids, groups)
+            for student_id in student_ids
+        ]
+        if members:
+            self.session.execute(insert(GroupMember), members)
+        outbox.append(
+            self.session,
+            [
+                (GROUP_CREATED, {"id": group_id, "session_id": session_id, "student_ids": list(student_ids)})
+                for group_id, (_, student_ids) in zip(group_ids, groups)
+            ],
+        )
+        self.session.commit()
+        return group_ids
+
+    def list_pairs_grouped_together(self, student_ids: Sequence[int]) -> List[Tuple[int, int]]:
+        """Paires (a, b), a < b, de ces apprenants déjà membres d'un même groupe (toutes sessions)."""
+        if not student_ids:
+            return []
+        other = aliased(GroupMember)
         return list(
-            self.session.exec(select(Group).where(Group.session_id == session_id)).all()
+            self.session.exec(
+                select(GroupMember.student_id, other.student_id)
+                .join(other, other.group_id == GroupMember.group_id)
+                .where(
+                    GroupMember.student_id.in_(student_ids),
+                    other.student_id.in_(student_ids),
+                    GroupMember.student_id < other.student_id,
+                )
+                .distinct()
+            ).all()
         )
 
     def get_student_ids(self, group_id: int) -> List[int]:
@@ -41,30 +100,37 @@ class GroupRepository:
         ).all()
         return list(rows)
 
-    def update(self, id: int, data: GroupUpdate, student_ids: Optional[List[int]] = None) -> Optional[Group]:
+    def update(
+        self, id: int, data: GroupUpdate, student_ids: Optional[List[int]] = None
+    ) -> Optional[Tuple[Group, MembershipChange]]:
+        """
+        Met à jour le nom et, si `student_ids` est fourni, aligne les membres dessus
+        (seule la différence est écrite). Retourne (groupe, membres ajoutés / retirés), None si absent.
+        """
         group = self.get_by_id(id)
         if group is None:
             return None
         if data.name is not None:
             group.name = data.name.strip()
+        change = NO_CHANGE
         if student_ids is not None:
-            existing = list(
-                self.session.exec(select(GroupMember).where(GroupMember.group_id == id))
-            )
-            for m in existing:
-                self.session.delete(m)
-            for sid in student_ids:
-                self.session.add(GroupMember(group_id=id, student_id=sid))
+            change = sync_members(self.session, GroupMember, GroupMember.group_id, id, student_ids)
+        event = {
+            "id": id,
+            "session_id": group.session_id,
+            "fields": ["name"] if data.name is not None else [],
+            "added_student_ids": change.added,
+            "removed_student_ids": change.removed,
+        }
+        outbox.append(self.session, [(GROUP_UPDATED, event)])
         self.session.commit()
         self.session.refresh(group)
-        return group
+        return group, change
 
     def delete(self, id: int) -> bool:
-        group = self.get_by_id(id)
-        if group is None:
-            return False
-        for m in self.session.exec(select(GroupMember).where(GroupMember.group_id == id)).all():
-            self.session.delete(m)
-        self.session.delete(group)
+        """Supprime le groupe par id (membres supprimés en cascade par la base). Retourne True si supprimé, False si non trouvé."""
+        session_id = self.session.execute(delete(Group).where(Group.id == id).returning(Group.session_id)).scalar()
+        if session_id is not None:
+            outbox.append(self.session, [(GROUP_DELETED, {"id": id, "session_id": session_id})])
         self.session.commit()
-        return True
+        return session_id is not None
@@ -0,0 +1,116 @@
+"""
+Repository des clés d'idempotence (table `idempotency_keys`).
+
+La réservation d'une clé est un seul INSERT … ON CONFLICT : entre deux requêtes
+concurrentes portant la même clé, une seule obtient la ligne (et exécute la
+requête), l'autre lit la ligne existante et attend la réponse enregistrée. Une
+clé expirée peut être reprise par n'importe quelle requête ; une clé sans signe
+de vie de son exécution (worker tombé) seulement par la même requête (même
+empreinte). Chaque réservation porte un jeton : seule l'exécution qui le détient
+enregistre ou libère la réponse.
+"""
+from datetime import datetime
+from typing import Optional, Tuple
+
+from sqlalchemy import delete, text, update
+from sqlmodel import Session, select
+
+from app.models.idempotency import IdempotencyKey
+
+_CLAIM = text(
+    """
+    INSERT INTO idempotency_keys (key, request_hash, claim_token, locked_at, created_at, expires_at)
+    VALUES (:key, :request_hash, :token, :now, :now, :expires_at)
+    ON CONFLICT (key) DO UPDATE
+        SET request_hash = CASE WHEN idempotency_keys.expires_at <= :now
+                                THEN EXCLUDED.request_hash ELSE idempotency_keys.request_hash END,
+            claim_token = EXCLUDED.claim_token,
+            status_code = NULL,
+            content_type = NULL,
+            body = NULL,
+            locked_at = EXCLUDED.locked_at,
+            created_at = EXCLUDED.created_at,
+            expires_at = EXCLUDED.expires_at
+        WHERE idempotency_keys.expires_at <= :now
+           OR (idempotency_keys.status_code IS NULL
+               AND idempotency_keys.locked_at < :stale_before
+               AND idempotency_keys.request_hash = EXCLUDED.request_hash)
+    RETURNING key
+    """
+)
+
+
+class IdempotencyRepository:
+    """Accès données pour les clés d'idempotence (chaque méthode valide sa propre transaction)."""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def claim(
+        self, key: str, request_hash: str, token: str, now: datetime, expires_at: datetime, stale_before: datetime
+    ) -> Tuple[bool, Optional[IdempotencyKey]]:
+        """
+        Réserve `key` pour l'exécution `token`. Retourne (True, None) si la clé est
+        obtenue, sinon (False, ligne existante) ; la ligne peut avoir disparu entre-temps
+        (réponse 5xx oubliée) : (False, None), à retenter.
+        """
+        claimed = self.session.execute(
+            _CLAIM,
+            {
+                "key": key,
+                "request_hash": request_hash,
+                "token": token,
+                "now": now,
+                "expires_at": expires_at,
+                "stale_before": stale_before,
+            },
+        ).first()
+        self.session.commit()
+        if claimed is not None:
+            return True, None
+        return False, self.get(key)
+
+    def get(self, key: str) -> Optional[IdempotencyKey]:
+        row = self.session.exec(select(IdempotencyKey).where(IdempotencyKey.key == key)).first()
+        if row is not None:
+            self.session.expunge(row)
+        self.session.rollback()
+        return row
+
+    def touch(self, key: str, token: str, now: datetime) -> bool:
+        """Signe de vie de l'exécution `token` (locked_at). Faux si la clé ne lui appartient plus."""
+        touched = self.session.execute(
+            update(IdempotencyKey)
+            .where(IdempotencyKey.key == key, IdempotencyKey.claim_token == token)
+            .values(locked_at=now)
+        ).rowcount
+        self.session.commit()
+        return touched > 0
+
+    def save_response(
+        self, key: str, token: str, status_code: int, content_type: Optional[str], body: bytes
+    ) -> bool:
+        """
+        Enregistre la réponse de l'exécution `token` : les requêtes suivantes la rejoueront.
+        Faux (rien d'écrit) si la clé a été reprise entre-temps.
+        """
+        saved = self.session.execute(
+            update(IdempotencyKey)
+            .where(IdempotencyKey.key == key, IdempotencyKey.claim_token == token)
+            .values(status_code=status_code, content_type=content_type, body=body)
+        ).rowcount
+        self.session.commit()
+        return saved > 0
+
+    def release(self, key: str, token: str) -> None:
+        """Oublie une clé dont l'exécution `token` a échoué (5xx) : un nouvel essai la rejouera pour de bon."""
+        self.session.execute(
+            delete(IdempotencyKey).where(IdempotencyKey.key == key, IdempotencyKey.claim_token == token)
+        )
+        self.session.commit()
+
+    def purge_expired(self, now: datetime) -> int:
+        """Supprime les clés expirées. Retourne leur nombre."""
+        deleted = self.session.execute(delete(IdempotencyKey).where(IdempotencyKey.expires_at <= now)).rowcount
+        self.session.commit()
+        return deleted
@@ -0,0 +1,124 @@
+"""
+Repository de la file `jobs` (planificateur d'échéances de briefs).
+
+Plusieurs workers peuvent exécuter le planificateur en même temps :
+- le balayage des échéances est réservé au worker qui obtient le verrou
+  consultatif (`pg_try_advisory_xact_lock`), les autres passent leur tour ;
+- une tâche n'est créée qu'une fois par (type, brief, échéance) (contrainte unique) ;
+- les tâches dues sont réclamées avec `FOR UPDATE SKIP LOCKED` : un worker ne voit
+  pas celles qu'un autre est en train de traiter.
+
+Le balayage ne lit que les briefs dont l'échéance tombe dans la fenêtre
+[maintenant - lookback, maintenant + lead] (index sur `delivery_deadline`).
+"""
+from datetime import datetime, timedelta
+from typing import List
+
+from sqlalchemy import text, update
+from sqlmodel import Session, select
+
+from app.models.brief import Brief
+from app.models.job import BRIEF_OVERDUE, BRIEF_REMINDER, JOB_DONE, JOB_PENDING, JOB_STALE, Job
+
+# Clé de pg_try_advisory_xact_lock réservée au balayage des échéances.
+SWEEP_LOCK_KEY = 0x5167_0002
+
+# Rappel pour une échéance à venir (exécutable `lead` avant), retard pour une échéance
+# passée ; NOT EXISTS évite de consommer la séquence à chaque balayage, ON CONFLICT
+# couvre une tâche créée entre-temps.
+_ENQUEUE = text(
+    """
+    INSERT INTO jobs (kind, brief_id, deadline, run_at, status, created_at)
+    SELECT planned.kind, planned.brief_id, planned.deadline, planned.run_at, :pending, :now
+    FROM (
+        SELECT CASE WHEN b.delivery_deadline > :now THEN :reminder ELSE :overdue END AS kind,
+               b.id AS brief_id,
+               b.delivery_deadline AS deadline,
+               CASE WHEN b.delivery_deadline > :now THEN b.delivery_deadline - :lead ELSE b.delivery_deadline END
+                   AS run_at
+        FROM briefs AS b
+        WHERE b.delivery_deadline > :since AND b.delivery_deadline <= :until
+    ) AS planned
+    WHERE NOT EXISTS (
+        SELECT 1 FROM jobs AS j
+        WHERE j.kind = planned.kind AND j.brief_id = planned.brief_id AND j.deadline = planned.deadline
+    )
+    ON CONFLICT ON CONSTRAINT uq_job_kind_brief_deadline DO NOTHING
+    """
+)
+
+
+class JobRepository:
+    """Accès données pour la file `jobs`."""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def enqueue_deadline_jobs(self, now: datetime, lead: timedelta, lookback: timedelta) -> int:
+        """
+        Planifie rappels et retards des briefs de la fenêtre. Retourne le nombre de
+        tâches créées (0 si un autre worker balaie déjà).
+        """
+        locked = self.session.execute(
+            text("SELECT pg_try_advisory_xact_lock(:key)"), {"key": SWEEP_LOCK_KEY}
+        ).scalar()
+        if not locked:
+            self.session.rollback()
+            return 0
+        created = self.session.execute(
+            _ENQUEUE,
+            {
+                "now": now,
+                "lead": lead,
+                "since": now - lookback,
+                "until": now + lead,
+                "pending": JOB_PENDING,
+                "reminder": BRIEF_REMINDER,
+                "overdue": BRIEF_OVERDUE,
+            },
+        ).rowcount
+        self.session.commit()
+        return created
+
+    def claim_due(self, now: datetime, limit: int) -> List[Job]:
+        """
+        Réclame au plus `limit` tâches dues, verrouillées jusqu'au commit de
+        `complete` ; les tâches verrouillées par un autre worker sont sautées.
+        """
+        return list(
+            self.session.exec(
+                select(Job)
+                .where(Job.status == JOB_PENDING, Job.run_at <= now)
+                .order_by(Job.run_at, Job.id)
+                .limit(limit)
+                .with_for_update(skip_locked=True)
+            ).all()
+        )
+
+    def complete(self, jobs: List[Job], now: datetime) -> List[Job]:
+        """
+        Enregistre rappel / retard sur les briefs des tâches réclamées et clôt les
+        tâches (`done`, ou `stale` si l'échéance du brief a changé). Retourne les
+        tâches exécutées.
+        """
+        done_ids = set()
+        for kind, column in ((BRIEF_REMINDER, Brief.reminded_at), (BRIEF_OVERDUE, Brief.overdue_at)):
+            kind_jobs = [job for job in jobs if job.kind == kind]
+            if not kind_jobs:
+                continue
+            # updated_at inchangé : le planificateur ne modifie pas le contenu du brief.
+            done_ids.update(
+                self.session.execute(
+                    update(Brief)
+                    .where(Brief.id == Job.brief_id, Brief.delivery_deadline == Job.deadline)
+                    .where(Job.id.in_([job.id for job in kind_jobs]))
+                    .values({column: now, Brief.updated_at: Brief.updated_at})
+                    .returning(Job.id)
+                ).scalars()
+            )
+        for job in jobs:
+            job.status = JOB_DONE if job.id in done_ids else JOB_STALE
+            job.done_at = now
+            self.session.add(job)
+        self.session.commit()
+        return [job for job in jobs if job.id in done_ids]
@@ -0,0 +1,52 @@
+"""
+Synchronisation des tables de liaison apprenants (group_members, brief_students).
+
+Plutôt que supprimer toutes les liaisons puis tout recréer, on compare l'ensemble
+actuel à l'ensemble voulu et on n'applique que la différence : un DELETE groupé
+pour les retraits, un INSERT multi-lignes pour les ajouts. Le commit reste à la
+charge du repository appelant.
+"""
+from typing import Any, List, NamedTuple, Sequence
+
+from sqlalchemy import delete, insert
+from sqlmodel import Session, select
+
+
+class MembershipChange(NamedTuple):
+    """Ids d'apprenants ajoutés (ordre demandé) et retirés (ordre croissant)."""
+
+    added: List[int]
+    removed: List[int]
+
+
+NO_CHANGE = MembershipChange([], [])
+
+
+def sync_members(
+    session: Session,
+    link_model: Any,
+    owner_column: Any,
+    owner_id: int,
+    student_ids: Sequence[int],
+) -> MembershipChange:
+    """
+    Aligne les liaisons `link_model` de `owner_id` (colonne `owner_column`) sur `student_ids`.
+
+    Une lecture des student_id actuels, puis au plus un DELETE et un INSERT ;
+    les doublons de `student_ids` sont ignorés.
+    """
+    desired = list(dict.fromkeys(student_ids))
+    current = set(session.exec(select(link_model.student_id).where(owner_column == owner_id)).all())
+    added = [student_id for student_id in desired if student_id not in current]
+    removed = sorted(current.difference(desired))
+    if removed:
+        session.execute(
+            delete(link_model).where(owner_column == owner_id, link_model.student_id.in_(removed)),
+            execution_options={"synchronize_session": False},
+        )
+    if added:
+        session.execute(
+            insert(link_model),
+            [{owner_column.key: owner_id, "student_id": student_id} for student_id in added],
+        )
+    return MembershipChange(added, removed)
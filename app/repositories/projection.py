@@ -0,0 +1,35 @@
+"""
+Projection SQL partagée des repositories users / formations / sessions (`?fields=`).
+
+Seules les colonnes demandées (et l'id) sont lues ; le schéma de réponse réduit
+est construit côté API (app/api/fields.py).
+"""
+from typing import Any, List, Optional, Sequence
+
+from sqlalchemy import Row
+from sqlmodel import Session, select
+
+
+def list_columns(
+    session: Session,
+    model: Any,
+    fields: Sequence[str],
+    *,
+    ids: Optional[List[int]] = None,
+    offset: int = 0,
+    limit: int = 100,
+) -> List[Row]:
+    """
+    Lignes de `model` ne portant que les colonnes `fields` (et l'id).
+
+    Avec `ids`, les lignes de ces ids (une requête IN, sans pagination) ; sinon la
+    page [offset, offset + limit) (plafond de page à la charge de l'appelant).
+    """
+    columns = [getattr(model, name) for name in dict.fromkeys(("id", *fields))]
+    statement = select(*columns)
+    if ids is not None:
+        statement = statement.where(model.id.in_(ids))
+    else:
+        statement = statement.offset(offset).limit(limit)
+    # execute (et non exec) : des Row même quand seule la colonne id est demandée.
+    return list(session.execute(statement).all())
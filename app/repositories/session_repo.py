@@ -2,15 +2,20 @@
 Repository CRUD pour l'entité Session.
 
 Encapsule l'accès en base (création, lecture, mise à jour, suppression)
-et la pagination. Méthodes de liste par formation_id / teacher_id.
+et la pagination. Méthodes de liste par formation_id / teacher_id et détection
+des chevauchements de planning d'un formateur (index GiST de la contrainte d'exclusion).
 """
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Sequence
 
+from sqlalchemy import Row, delete, func
 from sqlmodel import Session, select
 
+from app.db.loader import loader_for
 from app.models.session import Session as SessionModel
+from app.repositories import projection
 from app.schemas.session import SessionCreate, SessionUpdate
+from app.utils.enum import SessionStatus
 
 MAX_PAGE_SIZE = 100
 
@@ -37,12 +42,34 @@ class SessionRepository:
 
     def get_by_id(self, id: int) -> Optional[SessionModel]:
         """Retourne la session d'id donné ou None."""
-        return self.session.get(SessionModel, id)
+        return loader_for(self.session).get(SessionModel, id)
 
     def exists(self, id: int) -> bool:
         """Retourne True si une session avec cet id existe, False sinon."""
         return self.get_by_id(id) is not None
 
+    def list_by_ids(self, ids: List[int]) -> List[SessionModel]:
+        """Retourne les sessions dont l'id figure dans `ids` (au plus une requête IN ; ordre non garanti)."""
+        return list(loader_for(self.session).get_many(SessionModel, ids).values())
+
+    def list_columns(
+        self,
+        fields: Sequence[str],
+        *,
+        ids: Optional[List[int]] = None,
+        offset: int = 0,
+        limit: int = 100,
+    ) -> List[Row]:
+        """
+        Projection SQL : lignes ne portant que les colonnes `fields` (et l'id).
+
+        Avec `ids`, les sessions de ces ids (une requête IN, sans pagination) ;
+        sinon la même page que list(). limit plafonné à MAX_PAGE_SIZE.
+        """
+        return projection.list_columns(
+            self.session, SessionModel, fields, ids=ids, offset=offset, limit=min(limit, MAX_PAGE_SIZE)
+        )
+
     def list(self, offset: int = 0, limit: int = 100) -> List[SessionModel]:
         """Liste paginée de sessions. limit est plafonné à MAX_PAGE_SIZE."""
         limit = min(limit, MAX_PAGE_SIZE)
@@ -65,13 +92,10 @@ class SessionRepository:
         return session
 
     def delete(self, id: int) -> bool:
-        """Supprime la session par id. Retourne True si supprimée, False si non trouvée."""
-        session = self.get_by_id(id)
-        if session is None:
-            return False
-        self.session.delete(session)
+        """Supprime la session par id ; inscriptions, signatures, groupes et briefs suivent par ON DELETE CASCADE. Retourne True si supprimée, False si non trouvée."""
+        result = self.session.execute(delete(SessionModel).where(SessionModel.id == id))
         self.session.commit()
-        return True
+        return result.rowcount > 0
 
     def list_by_formation_id(self, formation_id: int) -> List[SessionModel]:
         """Retourne toutes les sessions pour une formation donnée."""
@@ -113,6 +137,58 @@ class SessionRepository:
             select(SessionModel).where(SessionModel.end_date == end_date)
         ).first()
 
+    def find_teacher_overlap(
+        self,
+        teacher_id: int,
+        start_date: datetime,
+        end_date: datetime,
+        exclude_id: Optional[int] = None,
+    ) -> Optional[SessionModel]:
+        """
+        Retourne une session du formateur dont la période [start, end) chevauche celle donnée, ou None.
+
+        Mêmes expressions que la contrainte `excl_sessions_teacher_schedule` : recherche
+        par l'index GiST (logarithmique), sans parcours de la table.
+        """
+        statement = select(SessionModel).where(
+            func.int4range(SessionModel.teacher_id, SessionModel.teacher_id, "[]").op("&&")(
+                func.int4range(teacher_id, teacher_id, "[]")
+            ),
+            func.tsrange(SessionModel.start_date, SessionModel.end_date).op("&&")(
+                func.tsrange(start_date, end_date)
+            ),
+        )
+        if exclude_id is not None:
+            statement = statement.where(SessionModel.id != exclude_id)
+        return self.session.exec(statement.limit(1)).first()
+
+    def list_overlapping(
+        self,
+        date_from: datetime,
+        date_to: datetime,
+        teacher_id: Optional[int] = None,
+        formation_id: Optional[int] = None,
+        status: Optional[SessionStatus] = None,
+    ) -> List[SessionModel]:
+        """
+        Sessions dont la période chevauche [date_from, date_to), triées par date de début.
+
+        Prédicat `tsrange(start_date, end_date) && tsrange(...)` servi par l'index GiST
+        `ix_sessions_period` : le coût dépend de la fenêtre, pas de l'historique.
+        """
+        statement = select(SessionModel).where(
+            func.tsrange(SessionModel.start_date, SessionModel.end_date).op("&&")(
+                func.tsrange(date_from, date_to)
+            )
+        )
+        if teacher_id is not None:
+            statement = statement.where(SessionModel.teacher_id == teacher_id)
+        if formation_id is not None:
+            statement = statement.where(SessionModel.formation_id == formation_id)
+        if status is not None:
+            statement = statement.where(SessionModel.status == status)
+        return list(self.session.exec(statement.order_by(SessionModel.start_date, SessionModel.id)).all())
+
     def get_by_formation_id_and_teacher_id(
         self, formation_id: int, teacher_id: int
     ) -> Optional[SessionModel]:
@@ -3,13 +3,38 @@ Repository pour l'émargement (signatures).
 
 Création, lecture, listes par session+date et par session+user.
 Vérification d'existence (session_id, user_id, date) pour éviter les doublons.
+Chaque émargement ajoute un événement `signature.created` à l'outbox dans sa transaction.
+La table est partitionnée par mois sur `date` : les lectures portent une borne de
+date pour que Postgres n'examine que les partitions concernées.
 """
 from datetime import date, datetime, time
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+from sqlalchemy import func
 from sqlmodel import Session, select
 
+from app.db import outbox
+from app.db.loader import loader_for
+from app.core.config import get_settings
+from app.db.partitions import ensure_partitions, retention_cutoff
+from app.models.outbox import SIGNATURE_CREATED
 from app.models.signature import Signature
+from app.models.user import User
+from app.utils.enum import AttendanceSlot
+
+
+def signature_created_event(
+    id: int, session_id: int, user_id: int, sign_date: date, slot: Optional[AttendanceSlot]
+) -> Tuple[str, Dict[str, Any]]:
+    """Événement d'outbox d'un émargement (mêmes champs que SignatureRead)."""
+    payload = {
+        "id": id,
+        "session_id": session_id,
+        "user_id": user_id,
+        "date": sign_date.isoformat(),
+        "slot": slot.value if slot is not None else None,
+    }
+    return SIGNATURE_CREATED, payload
 
 
 class SignatureRepository:
@@ -19,21 +44,39 @@ class SignatureRepository:
     Une signature = un jour signé pour (session_id, user_id).
     """
 
+    # Une signature par jour : pas de créneau matin / après-midi (voir attendance_repo).
+    slots_per_day = 1
+
     def __init__(self, session: Session):
         self.session = session
 
-    def create(self, session_id: int, user_id: int, sign_date: date) -> Signature:
-        """Crée une signature (date stockée à 00:00:00). Retourne l'instance avec id."""
+    def create(
+        self, session_id: int, user_id: int, sign_date: date, slot: Optional[AttendanceSlot] = None
+    ) -> Optional[Signature]:
+        """
+        Crée une signature (date stockée à 00:00:00), partition du mois créée au besoin.
+        Retourne l'instance avec id, ou None si le jour est déjà signé.
+        """
+        if self.exists_for_date(session_id, user_id, sign_date):
+            return None
         dt = datetime.combine(sign_date, time.min)
+        ensure_partitions(
+            self.session.connection(),
+            sign_date,
+            sign_date,
+            trusted_from=retention_cutoff(get_settings().signature_retention_months),
+        )
         sig = Signature(session_id=session_id, user_id=user_id, date=dt)
         self.session.add(sig)
+        self.session.flush()
+        outbox.append(self.session, [signature_created_event(sig.id, session_id, user_id, sign_date, None)])
         self.session.commit()
         self.session.refresh(sig)
         return sig
 
     def get_by_id(self, id: int) -> Optional[Signature]:
         """Retourne la signature d'id donné ou None."""
-        return self.session.get(Signature, id)
+        return loader_for(self.session).get(Signature, id)
 
     def exists_for_date(self, session_id: int, user_id: int, sign_date: date) -> bool:
         """True si une signature existe déjà pour (session_id, user_id, sign_date)."""
@@ -61,15 +104,75 @@ class SignatureRepository:
             ).all()
         )
 
-    def list_by_session_and_user(self, session_id: int, user_id: int) -> List[Signature]:
-        """Liste toutes les dates signées par un utilisateur pour une session (historique pad)."""
+    def list_by_session_and_user(
+        self, session_id: int, user_id: int, start_date: date, end_date: date
+    ) -> List[Signature]:
+        """
+        Liste les dates signées par un utilisateur pour une session (historique pad).
+
+        [start_date, end_date] est la période de la session : les signatures y sont
+        toutes, et la borne limite le parcours aux partitions de ces mois.
+        """
         return list(
             self.session.exec(
                 select(Signature)
                 .where(
                     Signature.session_id == session_id,
                     Signature.user_id == user_id,
+                    Signature.date >= datetime.combine(start_date, time.min),
+                    Signature.date <= datetime.combine(end_date, time.min),
                 )
                 .order_by(Signature.date)
             ).all()
         )
+
+    def list_by_session_and_date_range(self, session_id: int, start_date: date, end_date: date) -> List[Signature]:
+        """Liste les signatures d'une session entre deux jours inclus, par date puis utilisateur."""
+        return list(
+            self.session.exec(
+                select(Signature)
+                .where(
+                    Signature.session_id == session_id,
+                    Signature.date >= datetime.combine(start_date, time.min),
+                    Signature.date <= datetime.combine(end_date, time.min),
+                )
+                .order_by(Signature.date, Signature.user_id)
+            ).all()
+        )
+
+    def count_days_by_session_for_user(
+        self, user_id: int, session_ids: List[int], start_date: date, end_date: date
+    ) -> Dict[int, int]:
+        """
+        Nombre de jours signés par l'utilisateur, par session (une requête agrégée).
+
+        [start_date, end_date] couvre les périodes des sessions `session_ids` : la
+        borne limite le parcours aux partitions de ces mois.
+        """
+        if not session_ids:
+            return {}
+        rows = self.session.exec(
+            select(Signature.session_id, func.count(func.distinct(func.date(Signature.date))))
+            .where(
+                Signature.user_id == user_id,
+                Signature.session_id.in_(session_ids),
+                Signature.date >= datetime.combine(start_date, time.min),
+                Signature.date <= datetime.combine(end_date, time.min),
+            )
+            .group_by(Signature.session_id)
+        ).all()
+        return {session_id: days for session_id, days in rows}
+
+    def list_signers_for_date(self, session_ids: List[int], sign_date: date) -> List[Tuple[int, User]]:
+        """(session_id, utilisateur) pour chaque signature du jour sur ces sessions (une requête, jointure users)."""
+        if not session_ids:
+            return []
+        dt = datetime.combine(sign_date, time.min)
+        return list(
+            self.session.exec(
+                select(Signature.session_id, User)
+                .join(User, User.id == Signature.user_id)
+                .where(Signature.session_id.in_(session_ids), Signature.date == dt)
+                .order_by(Signature.session_id, User.last_name, User.first_name, User.id)
+            ).all()
+        )
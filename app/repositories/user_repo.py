@@ -4,11 +4,14 @@ Repository CRUD pour l'entité User.
 Encapsule l'accès en base (création, lecture, mise à jour, suppression)
 et la pagination de la liste (MAX_PAGE_SIZE).
 """
-from typing import List, Optional
+from typing import List, Optional, Sequence
 
+from sqlalchemy import Row, delete
 from sqlmodel import Session, select
 
+from app.db.loader import loader_for
 from app.models.user import User
+from app.repositories import projection
 from app.schemas.user import UserCreate, UserUpdate
 
 MAX_PAGE_SIZE = 100
@@ -38,13 +41,35 @@ class UserRepository:
 
     def get_by_id(self, id: int) -> Optional[User]:
         """Retourne l'utilisateur d'id donné ou None."""
-        return self.session.get(User, id)
+        return loader_for(self.session).get(User, id)
 
     def get_by_email(self, email: str) -> Optional[User]:
         """Retourne l'utilisateur avec cet email (normalisé minuscules) ou None."""
         email = email.lower().strip()
         return self.session.exec(select(User).where(User.email == email)).first()
 
+    def list_by_ids(self, ids: List[int]) -> List[User]:
+        """Retourne les utilisateurs dont l'id figure dans `ids` (au plus une requête IN ; ordre non garanti)."""
+        return list(loader_for(self.session).get_many(User, ids).values())
+
+    def list_columns(
+        self,
+        fields: Sequence[str],
+        *,
+        ids: Optional[List[int]] = None,
+        offset: int = 0,
+        limit: int = 100,
+    ) -> List[Row]:
+        """
+        Projection SQL : lignes ne portant que les colonnes `fields` (et l'id).
+
+        Avec `ids`, les utilisateurs de ces ids (une requête IN, sans pagination) ;
+        sinon la même page que list(). limit plafonné à MAX_PAGE_SIZE.
+        """
+        return projection.list_columns(
+            self.session, User, fields, ids=ids, offset=offset, limit=min(limit, MAX_PAGE_SIZE)
+        )
+
     def list(self, offset: int = 0, limit: int = 100) -> List[User]:
         """Liste paginée d'utilisateurs. limit plafonné à MAX_PAGE_SIZE."""
         limit = min(limit, MAX_PAGE_SIZE)
@@ -70,10 +95,7 @@ class UserRepository:
         return user
 
     def delete(self, id: int) -> bool:
-        """Supprime l'utilisateur par id. Retourne True si supprimé, False si non trouvé."""
-        user = self.get_by_id(id)
-        if user is None:
-            return False
-        self.session.delete(user)
+        """Supprime l'utilisateur par id (inscriptions, signatures et liaisons supprimées en cascade par la base). Retourne True si supprimé, False si non trouvé."""
+        result = self.session.execute(delete(User).where(User.id == id))
         self.session.commit()
-        return True
+        return result.rowcount > 0
@@ -37,12 +37,20 @@ class BriefRead(BaseModel):
     order: int
     session_id: int
     student_ids: List[int] = []
+    reminded_at: Optional[datetime] = None
+    overdue_at: Optional[datetime] = None
     created_at: datetime
     updated_at: datetime
 
     model_config = ConfigDict(from_attributes=True)
 
 
+class BriefUpdateRead(BriefRead):
+    """Réponse de mise à jour : le brief et les étudiants assignés / désassignés par la requête."""
+    added_student_ids: List[int] = []
+    removed_student_ids: List[int] = []
+
+
 class BriefUpdate(BaseModel):
     """Payload de mise à jour partielle (tous les champs optionnels)."""
     title: Optional[str] = None
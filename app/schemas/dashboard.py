@@ -0,0 +1,79 @@
+"""
+Schémas Pydantic des tableaux de bord (apprenant, digest quotidien du formateur).
+
+Sortie seule. Apprenant : inscriptions (session et formation incluses), briefs à
+rendre et taux de présence par session. Formateur : sessions du jour avec inscrits
+et émargements, briefs dus dans la semaine.
+"""
+from datetime import date as Date, datetime
+from typing import List, Optional
+
+from pydantic import BaseModel, ConfigDict
+
+from app.schemas.formation import FormationRead
+from app.schemas.session import SessionRead
+
+
+class AttendanceRead(BaseModel):
+    """
+    Présence d'un apprenant sur une session.
+
+    elapsed_days: jours de session écoulés (aujourd'hui compris), 0 si la session n'a pas commencé.
+    rate: signed_days / elapsed_days, None tant qu'aucun jour n'est écoulé.
+    """
+    signed_days: int
+    elapsed_days: int
+    rate: Optional[float] = None
+
+
+class DashboardEnrollmentRead(BaseModel):
+    """Inscription avec sa session, sa formation et la présence de l'apprenant."""
+    id: int
+    enrolled_at: datetime
+    session: SessionRead
+    formation: FormationRead
+    attendance: AttendanceRead
+
+
+class DashboardBriefRead(BaseModel):
+    """Brief à rendre (sans la liste des étudiants assignés)."""
+    id: int
+    title: str
+    delivery_deadline: datetime
+    order: int
+    session_id: int
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class LearnerDashboardRead(BaseModel):
+    """Tableau de bord d'un apprenant : inscriptions (par date de début) et briefs à venir (par échéance)."""
+    user_id: int
+    enrollments: List[DashboardEnrollmentRead]
+    upcoming_briefs: List[DashboardBriefRead]
+
+
+class DigestSignerRead(BaseModel):
+    """Apprenant ayant émargé le jour du digest."""
+    id: int
+    first_name: str
+    last_name: str
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class DigestSessionRead(BaseModel):
+    """Session du jour : nombre d'inscrits et apprenants ayant déjà signé."""
+    session: SessionRead
+    enrolled_count: int
+    signed_count: int
+    signers: List[DigestSignerRead]
+
+
+class TrainerDigestRead(BaseModel):
+    """Digest quotidien d'un formateur : sessions du jour et briefs dus sur 7 jours à partir de `date`."""
+    teacher_id: int
+    # Alias Date : un champ nommé `date` masquerait le type dans l'annotation.
+    date: Date
+    sessions: List[DigestSessionRead]
+    briefs_due: List[DashboardBriefRead]
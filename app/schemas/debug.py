@@ -0,0 +1,16 @@
+"""
+Schémas Pydantic des routes de diagnostic (réservées aux administrateurs).
+
+Lecture seule : agrégats d'instructions SQL par empreinte.
+"""
+from pydantic import BaseModel
+
+
+class QueryFingerprintRead(BaseModel):
+    """Cumul des exécutions d'une empreinte SQL depuis le démarrage du process (durées en ms)."""
+    fingerprint: str
+    calls: int
+    total_ms: float
+    mean_ms: float
+    max_ms: float
+    rows: int
@@ -4,7 +4,7 @@ Schémas Pydantic pour Group et GroupMember.
 from typing import List, Optional
 
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 
 class GroupCreate(BaseModel):
@@ -26,9 +26,38 @@ class GroupRead(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class GroupUpdateRead(GroupRead):
+    """Réponse de mise à jour : le groupe et les membres ajoutés / retirés par la requête."""
+    added_student_ids: List[int] = []
+    removed_student_ids: List[int] = []
+
+
 class GroupUpdate(BaseModel):
     """Mise à jour partielle."""
     name: Optional[str] = None
     student_ids: Optional[List[int]] = None
 
     model_config = ConfigDict(str_strip_whitespace=True)
+
+
+class GroupAutoCreate(BaseModel):
+    """
+    Répartition automatique des inscrits d'une session : `group_count` groupes,
+    ou des groupes d'au plus `group_size` apprenants (exactement l'un des deux).
+
+    `stratify` sépare autant que possible les apprenants déjà réunis dans un
+    groupe existant ; `seed` rend le tirage reproductible.
+    """
+    group_count: Optional[int] = Field(default=None, ge=1)
+    group_size: Optional[int] = Field(default=None, ge=1)
+    name_prefix: str = Field(default="Groupe", min_length=1, max_length=200)
+    stratify: bool = False
+    seed: Optional[int] = None
+
+    model_config = ConfigDict(str_strip_whitespace=True)
+
+    @model_validator(mode="after")
+    def check_one_split_mode(self) -> "GroupAutoCreate":
+        if (self.group_count is None) == (self.group_size is None):
+            raise ValueError("exactly one of group_count or group_size is required")
+        return self
@@ -1,13 +1,13 @@
 """
 Schémas Pydantic pour l'entité Session.
 
-DTOs de validation entrée (création, mise à jour) et sortie (lecture).
+DTOs de validation entrée (création, mise à jour) et sortie (lecture, calendrier).
 Contrôle de l'ordre des dates (start_date < end_date) dans les validateurs.
 """
-from datetime import datetime
-from typing import Any, Optional
+from datetime import date, datetime
+from typing import Any, List, Optional
 
-from pydantic import BaseModel, ConfigDict, model_validator
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 from app.utils.enum import SessionStatus
 
@@ -90,4 +90,21 @@ class SessionRead(BaseModel):
     capacity_max: int
     status: SessionStatus
 
-    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
+
+class CalendarDay(BaseModel):
+    """Nombre de sessions en cours un jour donné de la fenêtre du calendrier."""
+    date: date
+    count: int
+
+
+class SessionCalendarRead(BaseModel):
+    """
+    Vue calendrier : sessions qui chevauchent la fenêtre [from, to) et comptage par jour.
+
+    `days` couvre chaque jour de la fenêtre (0 compris) pour construire la grille sans calcul côté client.
+    """
+    date_from: datetime = Field(serialization_alias="from")
+    date_to: datetime = Field(serialization_alias="to")
+    sessions: List[SessionRead]
+    days: List[CalendarDay]
@@ -1,13 +1,16 @@
 """
 Schémas Pydantic pour l'émargement (signature).
 
-Création (session_id, user_id, date optionnelle = aujourd'hui) et lecture.
+Création (session_id, user_id, date optionnelle = aujourd'hui, créneau en
+émargement par demi-journée) et lecture.
 """
-from datetime import date, datetime
+from datetime import date as Date, datetime
 from typing import Optional
 
 from pydantic import BaseModel, ConfigDict
 
+from app.utils.enum import AttendanceSlot
+
 
 class SignatureCreate(BaseModel):
     """
@@ -16,10 +19,13 @@ class SignatureCreate(BaseModel):
     session_id: Session de formation.
     user_id: Apprenant qui signe.
     date: Jour d'émargement (optionnel, défaut = aujourd'hui).
+    slot: Créneau matin / après-midi, requis si ATTENDANCE_SLOTS_PER_DAY=2 (interdit sinon).
     """
     session_id: int
     user_id: int
-    date: Optional[date] = None 
+    # Alias Date : un champ nommé `date` masquerait le type dans l'annotation.
+    date: Optional[Date] = None
+    slot: Optional[AttendanceSlot] = None
 
     model_config = ConfigDict(str_strip_whitespace=True)
 
@@ -30,5 +36,6 @@ class SignatureRead(BaseModel):
     session_id: int
     user_id: int
     date: datetime
+    slot: Optional[AttendanceSlot] = None
 
     model_config = ConfigDict(from_attributes=True)
@@ -1,12 +1,14 @@
 """
 Service d'authentification.
 
-Connexion (vérification identifiants + émission JWT), changement de mot de passe.
+Connexion (limitation des tentatives, vérification identifiants + émission JWT),
+changement de mot de passe.
 """
-import bcrypt
+from typing import Optional
 
 from app.core.errors import InvalidCredentials
-from app.core.security import create_access_token, verify_password
+from app.core.rate_limit import LoginRateLimiter
+from app.core.security import create_access_token, hash_password, verify_password
 from app.models.user import User
 from app.repositories.user_repo import UserRepository
 from app.schemas.auth import ChangePasswordRequest, LoginRequest, TokenResponse
@@ -14,17 +16,23 @@ from app.schemas.user import UserUpdate
 
 
 class AuthService:
-    def __init__(self, repo: UserRepository):
+    def __init__(self, repo: UserRepository, limiter: Optional[LoginRateLimiter] = None):
         self.repo = repo
+        self.limiter = limiter
 
-    def login(self, request: LoginRequest) -> TokenResponse:
-        """Vérifie email/password et renvoie un token + must_change_password."""
+    def login(self, request: LoginRequest, client_ip: Optional[str] = None) -> TokenResponse:
+        """
+        Vérifie email/password et renvoie un token + must_change_password.
+        Lève LoginRateLimited (avant toute lecture et tout bcrypt), InvalidCredentials.
+        """
         email = request.email.lower().strip()
+        if self.limiter is not None:
+            self.limiter.check(client_ip, email)
         user = self.repo.get_by_email(email)
         if not user or not verify_password(request.password, user.hashed_password):
             raise InvalidCredentials()
         token = create_access_token(
-            data={"sub": user.id, "role": user.role.value}
+            data={"sub": str(user.id), "role": user.role.value}
         )
         return TokenResponse(
             access_token=token,
@@ -34,9 +42,7 @@ class AuthService:
 
     def _hash_password(self, password: str) -> str:
         """Hash un mot de passe en utilisant bcrypt."""
-        return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode(
-            "utf-8"
-        )
+        return hash_password(password)
 
     def change_password(self, user: User, request: ChangePasswordRequest) -> None:
         """
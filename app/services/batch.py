@@ -0,0 +1,18 @@
+"""
+Lectures groupées par ids (`?ids=3,1,2`) : remise dans l'ordre demandé.
+
+Le repository lit les ids en une requête IN, sans ordre garanti ; les services
+users / formations / sessions rétablissent ici l'ordre de la requête et
+relèvent les ids introuvables (en-tête X-Missing-Ids).
+"""
+from typing import Iterable, List, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+def order_by_ids(items: Iterable[T], ids: List[int]) -> Tuple[List[T], List[int]]:
+    """(éléments dans l'ordre de `ids`, ids sans élément). Chaque élément porte un attribut `id`."""
+    by_id = {item.id: item for item in items}
+    found = [by_id[id] for id in ids if id in by_id]
+    missing = [id for id in ids if id not in by_id]
+    return found, missing
@@ -0,0 +1,36 @@
+"""
+Service métier du planificateur d'échéances de briefs.
+
+Un passage balaie les échéances proches (rappel à enregistrer) ou dépassées
+(brief échu), puis exécute les tâches dues réclamées par ce worker. Les
+horodatages `reminded_at` / `overdue_at` du brief sont posés une seule fois par
+échéance, quel que soit le nombre de workers.
+"""
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+
+from app.models.job import BRIEF_OVERDUE, BRIEF_REMINDER
+from app.repositories.job_repo import JobRepository
+
+
+class BriefDeadlineService:
+    """Orchestre le balayage des échéances et l'exécution des tâches dues."""
+
+    def __init__(self, job_repo: JobRepository, lead: timedelta, lookback: timedelta, batch_size: int):
+        self.job_repo = job_repo
+        self.lead = lead
+        self.lookback = lookback
+        self.batch_size = batch_size
+
+    def run_once(self, now: Optional[datetime] = None) -> Dict[str, int]:
+        """Un passage : planification puis exécution d'un lot. Retourne les compteurs."""
+        now = now or datetime.utcnow()
+        enqueued = self.job_repo.enqueue_deadline_jobs(now, self.lead, self.lookback)
+        claimed = self.job_repo.claim_due(now, self.batch_size)
+        done = self.job_repo.complete(claimed, now)
+        return {
+            "enqueued": enqueued,
+            "reminded": sum(job.kind == BRIEF_REMINDER for job in done),
+            "overdue": sum(job.kind == BRIEF_OVERDUE for job in done),
+            "stale": len(claimed) - len(done),
+        }
@@ -10,7 +10,7 @@ from app.models.brief import Brief
 from app.repositories.brief_repo import BriefRepository
 from app.repositories.group_repo import GroupRepository
 from app.repositories.session_repo import SessionRepository
-from app.schemas.brief import BriefCreate, BriefRead, BriefUpdate
+from app.schemas.brief import BriefCreate, BriefRead, BriefUpdate, BriefUpdateRead
 
 
 def _brief_to_read(brief: Brief) -> BriefRead:
@@ -24,6 +24,8 @@ def _brief_to_read(brief: Brief) -> BriefRead:
         order=brief.order,
         session_id=brief.session_id,
         student_ids=student_ids,
+        reminded_at=brief.reminded_at,
+        overdue_at=brief.overdue_at,
         created_at=brief.created_at,
         updated_at=brief.updated_at,
     )
@@ -74,7 +76,7 @@ class BriefService:
         briefs = self.brief_repo.list_by_student_id(student_id)
         return [_brief_to_read(b) for b in briefs]
 
-    def update(self, id: int, data: BriefUpdate) -> BriefRead:
+    def update(self, id: int, data: BriefUpdate) -> BriefUpdateRead:
         brief = self.brief_repo.get_by_id(id)
         if brief is None:
             raise BriefNotFound()
@@ -86,9 +88,15 @@ class BriefService:
         updated = self.brief_repo.update(id, data, student_ids=student_ids)
         if updated is None:
             raise BriefNotFound()
-        return _brief_to_read(updated)
+        brief, change = updated
+        return BriefUpdateRead(
+            **_brief_to_read(brief).model_dump(),
+            added_student_ids=change.added,
+            removed_student_ids=change.removed,
+        )
 
     def delete(self, id: int) -> bool:
-        if not self.brief_repo.exists(id):
+        deleted = self.brief_repo.delete(id)
+        if not deleted:
             raise BriefNotFound()
-        return self.brief_repo.delete(id)
+        return deleted
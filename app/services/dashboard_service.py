@@ -0,0 +1,132 @@
+"""
+Service des tableaux de bord (apprenant, digest quotidien du formateur).
+
+Assemble en un nombre fixe de requêtes ce que les pages d'accueil obtenaient en
+plusieurs appels et autant de listes complètes :
+- apprenant : utilisateur, inscriptions jointes aux sessions et formations,
+  briefs à venir, jours signés agrégés par session ;
+- formateur : sessions du jour, inscrits (GROUP BY), émargements du jour
+  (jointure users), briefs dus dans la semaine.
+"""
+from datetime import date, datetime, time, timedelta
+from typing import Dict, List, Optional, Union
+
+from app.core.errors import UserNotFound, UserNotTrainer
+from app.models.session import Session
+from app.repositories.brief_repo import BriefRepository
+from app.repositories.enrollment_repo import EnrollmentRepository
+from app.repositories.session_repo import SessionRepository
+from app.repositories.attendance_repo import AttendanceBitmapRepository
+from app.repositories.signature_repo import SignatureRepository
+from app.repositories.user_repo import UserRepository
+from app.schemas.dashboard import (
+    AttendanceRead,
+    DashboardBriefRead,
+    DashboardEnrollmentRead,
+    DigestSessionRead,
+    DigestSignerRead,
+    LearnerDashboardRead,
+    TrainerDigestRead,
+)
+from app.schemas.formation import FormationRead
+from app.schemas.session import SessionRead
+from app.utils.enum import Role
+
+UPCOMING_BRIEFS_LIMIT = 20
+DIGEST_BRIEFS_DAYS = 7
+
+
+def attendance(session: Session, signed_days: int, today: date) -> AttendanceRead:
+    """Jours signés rapportés aux jours de session écoulés (de start_date à min(end_date, today))."""
+    first_day = session.start_date.date()
+    last_day = min(session.end_date.date(), today)
+    elapsed_days = max(0, (last_day - first_day).days + 1)
+    rate: Optional[float] = round(signed_days / elapsed_days, 3) if elapsed_days else None
+    return AttendanceRead(signed_days=signed_days, elapsed_days=elapsed_days, rate=rate)
+
+
+class DashboardService:
+    """Orchestre les repositories user, session, enrollment, brief et signature pour les tableaux de bord."""
+
+    def __init__(
+        self,
+        user_repo: UserRepository,
+        enrollment_repo: EnrollmentRepository,
+        brief_repo: BriefRepository,
+        signature_repo: Union[SignatureRepository, AttendanceBitmapRepository],
+        session_repo: SessionRepository,
+    ):
+        self.user_repo = user_repo
+        self.enrollment_repo = enrollment_repo
+        self.brief_repo = brief_repo
+        self.signature_repo = signature_repo
+        self.session_repo = session_repo
+
+    def learner_dashboard(self, user_id: int, now: Optional[datetime] = None) -> LearnerDashboardRead:
+        """
+        Tableau de bord de l'apprenant `user_id` (au plus 4 requêtes quel que soit le nombre d'inscriptions).
+        Lève UserNotFound si l'utilisateur n'existe pas.
+        """
+        if self.user_repo.get_by_id(user_id) is None:
+            raise UserNotFound()
+        now = now or datetime.utcnow()
+        rows = self.enrollment_repo.list_with_session_and_formation_by_student_id(user_id)
+        briefs = self.brief_repo.list_upcoming_by_student_id(user_id, now, UPCOMING_BRIEFS_LIMIT)
+        sessions = [session for _, session, _ in rows]
+        signed = self.signature_repo.count_days_by_session_for_user(
+            user_id,
+            [session.id for session in sessions],
+            min((session.start_date.date() for session in sessions), default=now.date()),
+            max((session.end_date.date() for session in sessions), default=now.date()),
+        )
+        return LearnerDashboardRead(
+            user_id=user_id,
+            enrollments=[
+                DashboardEnrollmentRead(
+                    id=enrollment.id,
+                    enrolled_at=enrollment.enrolled_at,
+                    session=SessionRead.model_validate(session),
+                    formation=FormationRead.model_validate(formation),
+                    attendance=attendance(session, signed.get(session.id, 0), now.date()),
+                )
+                for enrollment, session, formation in rows
+            ],
+            upcoming_briefs=[DashboardBriefRead.model_validate(brief) for brief in briefs],
+        )
+
+    def trainer_digest(self, teacher_id: int, day: Optional[date] = None) -> TrainerDigestRead:
+        """
+        Digest du jour `day` (défaut : aujourd'hui) pour le formateur `teacher_id` :
+        5 requêtes au plus, quel que soit le nombre de sessions.
+        Lève UserNotFound si l'utilisateur n'existe pas, UserNotTrainer s'il n'est pas formateur.
+        """
+        user = self.user_repo.get_by_id(teacher_id)
+        if user is None:
+            raise UserNotFound()
+        if user.role != Role.TRAINER:
+            raise UserNotTrainer()
+        day = day or date.today()
+        day_start = datetime.combine(day, time.min)
+        sessions = self.session_repo.list_overlapping(day_start, day_start + timedelta(days=1), teacher_id=teacher_id)
+        session_ids = [session.id for session in sessions]
+        enrolled = self.enrollment_repo.count_by_session_ids(session_ids)
+        signers: Dict[int, List[DigestSignerRead]] = {session_id: [] for session_id in session_ids}
+        for session_id, signer in self.signature_repo.list_signers_for_date(session_ids, day):
+            signers[session_id].append(DigestSignerRead.model_validate(signer))
+        briefs = self.brief_repo.list_due_for_teacher(
+            teacher_id, day_start, day_start + timedelta(days=DIGEST_BRIEFS_DAYS)
+        )
+        return TrainerDigestRead(
+            teacher_id=teacher_id,
+            date=day,
+            sessions=[
+                DigestSessionRead(
+                    session=SessionRead.model_validate(session),
+                    enrolled_count=enrolled.get(session.id, 0),
+                    signed_count=len(signers[session.id]),
+                    signers=signers[session.id],
+                )
+                for session in sessions
+            ],
+            briefs_due=[DashboardBriefRead.model_validate(brief) for brief in briefs],
+        )
@@ -3,12 +3,17 @@ Service métier pour les formations.
 
 Orchestre le repository et applique les règles métier (unicité du titre, levée d'exceptions).
 """
-from typing import List, Optional
+from typing import List, Optional, Sequence, Tuple, Union
 
-from app.core.errors import FormationNotFound, FormationTitleAlreadyUsed
+from sqlalchemy import Row
+from sqlalchemy.exc import IntegrityError
+
+from app.core.errors import FormationHasSessions, FormationNotFound, FormationTitleAlreadyUsed
 from app.models.formation import Formation
+from app.models.session import FORMATION_FOREIGN_KEY
 from app.repositories.formation_repo import FormationRepository
 from app.schemas.formation import FormationCreate, FormationUpdate
+from app.services.batch import order_by_ids
 from app.utils.enum import Level
 
 
@@ -41,6 +46,25 @@ class FormationService:
             raise FormationNotFound()
         return formation
 
+    def get_fields(self, id: int, fields: Sequence[str]) -> Row:
+        """Projection de la formation d'id donné sur `fields` (et l'id) ; lève FormationNotFound si absente."""
+        rows = self.repo.list_columns(fields, ids=[id])
+        if not rows:
+            raise FormationNotFound()
+        return rows[0]
+
+    def get_many(
+        self, ids: List[int], fields: Optional[Sequence[str]] = None
+    ) -> Tuple[List[Union[Formation, Row]], List[int]]:
+        """
+        Lecture groupée : (formations trouvées dans l'ordre de `ids`, ids introuvables).
+
+        Une seule requête quel que soit le nombre d'ids ; pas d'exception si certains manquent.
+        Avec `fields`, des lignes de projection (colonnes demandées) au lieu des entités.
+        """
+        items = self.repo.list_by_ids(ids) if fields is None else self.repo.list_columns(fields, ids=ids)
+        return order_by_ids(items, ids)
+
     def list(
         self,
         offset: int = 0,
@@ -56,6 +80,10 @@ class FormationService:
             title_contains=title_contains,
         )
 
+    def list_fields(self, fields: Sequence[str], offset: int = 0, limit: int = 100) -> List[Row]:
+        """Page de list() projetée sur `fields` (et l'id)."""
+        return self.repo.list_columns(fields, offset=offset, limit=limit)
+
     def update(self, id: int, data: FormationUpdate) -> Formation:
         """Met à jour une formation. Lève FormationNotFound si absente, FormationTitleAlreadyUsed si le nouveau titre est déjà pris."""
         formation = self.get_by_id(id)
@@ -71,8 +99,17 @@ class FormationService:
         return updated
 
     def delete(self, id: int) -> bool:
-        """Supprime la formation par id. Lève FormationNotFound si absente."""
-        deleted = self.repo.delete(id)
+        """
+        Supprime la formation par id. Lève FormationNotFound si absente,
+        FormationHasSessions si des sessions la référencent encore.
+        """
+        try:
+            deleted = self.repo.delete(id)
+        except IntegrityError as exc:
+            self.repo.session.rollback()
+            if getattr(getattr(exc.orig, "diag", None), "constraint_name", None) == FORMATION_FOREIGN_KEY:
+                raise FormationHasSessions() from exc
+            raise
         if not deleted:
             raise FormationNotFound()
         return deleted
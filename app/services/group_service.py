@@ -1,13 +1,20 @@
 """
 Service métier pour les groupes.
+
+Inclut la répartition automatique des inscrits d'une session en groupes équilibrés
+(tailles à une unité près), éventuellement stratifiée par l'historique des groupes.
 """
-from typing import List
+import random
+from collections import defaultdict
+from math import ceil
+from typing import Dict, List, Optional, Sequence, Set
 
-from app.core.errors import GroupNotFound, SessionNotFound
+from app.core.errors import GroupNotFound, GroupSplitInvalid, SessionNotFound
 from app.models.group import Group
+from app.repositories.enrollment_repo import EnrollmentRepository
 from app.repositories.group_repo import GroupRepository
 from app.repositories.session_repo import SessionRepository
-from app.schemas.group import GroupCreate, GroupRead, GroupUpdate
+from app.schemas.group import GroupAutoCreate, GroupCreate, GroupRead, GroupUpdate, GroupUpdateRead
 
 
 def _group_to_read(group: Group) -> GroupRead:
@@ -21,14 +28,59 @@ def _group_to_read(group: Group) -> GroupRead:
     )
 
 
+def split_sizes(total: int, group_count: Optional[int] = None, group_size: Optional[int] = None) -> List[int]:
+    """
+    Tailles de groupes équilibrées pour `total` apprenants : `group_count` groupes, ou le
+    moins de groupes possible d'au plus `group_size`. Deux tailles diffèrent d'au plus 1.
+    """
+    count = group_count if group_count is not None else ceil(total / group_size)
+    base, extra = divmod(total, count)
+    return [base + 1 if index < extra else base for index in range(count)]
+
+
+def assign_groups(
+    student_ids: Sequence[int],
+    sizes: Sequence[int],
+    together: Optional[Dict[int, Set[int]]] = None,
+    rng: Optional[random.Random] = None,
+) -> List[List[int]]:
+    """
+    Répartit les apprenants (ordre aléatoire) dans des groupes de tailles `sizes`.
+
+    Avec `together` (apprenant -> apprenants déjà réunis avec lui), chaque apprenant,
+    du plus contraint au moins contraint, rejoint le groupe non plein où il retrouve
+    le moins d'anciens partenaires (puis le moins rempli) : glouton en O(n × k).
+    """
+    order = list(student_ids)
+    (rng or random.Random()).shuffle(order)
+    if not together:
+        groups, start = [], 0
+        for size in sizes:
+            groups.append(order[start:start + size])
+            start += size
+        return groups
+    order.sort(key=lambda student_id: -len(together.get(student_id, ())))
+    groups = [[] for _ in sizes]
+    for student_id in order:
+        past = together.get(student_id, set())
+        best = min(
+            (index for index, size in enumerate(sizes) if len(groups[index]) < size),
+            key=lambda index: (sum(1 for member in groups[index] if member in past), len(groups[index]) / sizes[index]),
+        )
+        groups[best].append(student_id)
+    return groups
+
+
 class GroupService:
     def __init__(
         self,
         group_repo: GroupRepository,
         session_repo: SessionRepository,
+        enrollment_repo: EnrollmentRepository,
     ):
         self.group_repo = group_repo
         self.session_repo = session_repo
+        self.enrollment_repo = enrollment_repo
 
     def create(self, data: GroupCreate) -> GroupRead:
         if self.session_repo.get_by_id(data.session_id) is None:
@@ -36,6 +88,33 @@ class GroupService:
         group = self.group_repo.create(data)
         return _group_to_read(group)
 
+    def auto_create(self, session_id: int, data: GroupAutoCreate) -> List[GroupRead]:
+        """
+        Répartit les inscrits de la session en groupes équilibrés nommés `<prefix> 1..k`,
+        créés en masse dans une transaction. Les groupes existants sont conservés.
+        Lève SessionNotFound, GroupSplitInvalid (aucun inscrit, plus de groupes que d'inscrits).
+        """
+        if self.session_repo.get_by_id(session_id) is None:
+            raise SessionNotFound()
+        student_ids = self.enrollment_repo.list_student_ids_by_session_id(session_id)
+        if not student_ids:
+            raise GroupSplitInvalid("The session has no enrolled learners.")
+        if data.group_count is not None and data.group_count > len(student_ids):
+            raise GroupSplitInvalid(f"Cannot split {len(student_ids)} learners into {data.group_count} groups.")
+        together: Dict[int, Set[int]] = defaultdict(set)
+        if data.stratify:
+            for first, second in self.group_repo.list_pairs_grouped_together(student_ids):
+                together[first].add(second)
+                together[second].add(first)
+        sizes = split_sizes(len(student_ids), data.group_count, data.group_size)
+        members = assign_groups(student_ids, sizes, together, random.Random(data.seed))
+        names = [f"{data.name_prefix} {index}" for index in range(1, len(members) + 1)]
+        group_ids = self.group_repo.bulk_create(session_id, list(zip(names, members)))
+        return [
+            GroupRead(id=group_id, session_id=session_id, name=name, student_ids=sorted(student_ids))
+            for group_id, name, student_ids in zip(group_ids, names, members)
+        ]
+
     def get_by_id(self, id: int) -> GroupRead:
         group = self.group_repo.get_by_id(id)
         if group is None:
@@ -46,7 +125,7 @@ class GroupService:
         groups = self.group_repo.list_by_session_id(session_id)
         return [_group_to_read(g) for g in groups]
 
-    def update(self, id: int, data: GroupUpdate) -> GroupRead:
+    def update(self, id: int, data: GroupUpdate) -> GroupUpdateRead:
         group = self.group_repo.get_by_id(id)
         if group is None:
             raise GroupNotFound()
@@ -54,9 +133,15 @@ class GroupService:
         updated = self.group_repo.update(id, data, student_ids=student_ids)
         if updated is None:
             raise GroupNotFound()
-        return _group_to_read(updated)
+        group, change = updated
+        return GroupUpdateRead(
+            **_group_to_read(group).model_dump(),
+            added_student_ids=change.added,
+            removed_student_ids=change.removed,
+        )
 
     def delete(self, id: int) -> bool:
-        if not self.group_repo.get_by_id(id):
+        deleted = self.group_repo.delete(id)
+        if not deleted:
             raise GroupNotFound()
-        return self.group_repo.delete(id)
+        return deleted
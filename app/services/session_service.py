@@ -2,26 +2,47 @@
 Service métier pour les sessions.
 
 Orchestre le repository session et applique les règles métier :
-vérification formation / formateur existants, ordre des dates, levée d'exceptions.
+vérification formation / formateur existants, ordre des dates, planning du
+formateur sans chevauchement, levée d'exceptions.
 """
-from datetime import datetime
-from typing import List
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+from sqlalchemy import Row
+from sqlalchemy.exc import IntegrityError
 
 from app.core.errors import (
     FormationNotFound,
+    SessionCalendarRangeInvalid,
     SessionNotFound,
     SessionStartDateAfterEndDate,
-    SessionStartDateAlreadyExists,
-    SessionEndDateAlreadyExists,
+    SessionTeacherScheduleConflict,
     TeacherNotFound,
     UserNotTrainer,
 )
-from app.models.session import Session
+from app.models.session import TEACHER_SCHEDULE_CONSTRAINT, Session
 from app.repositories.formation_repo import FormationRepository
 from app.repositories.session_repo import SessionRepository
 from app.repositories.user_repo import UserRepository
-from app.schemas.session import SessionCreate, SessionUpdate
-from app.utils.enum import Role
+from app.schemas.session import (
+    CalendarDay,
+    SessionCalendarRead,
+    SessionCreate,
+    SessionRead,
+    SessionUpdate,
+)
+from app.services.batch import order_by_ids
+from app.utils.enum import Role, SessionStatus
+
+# Fenêtre maximale du calendrier (une année) : borne le coût d'une requête.
+CALENDAR_MAX_DAYS = 366
+
+
+def _naive_utc(value: datetime) -> datetime:
+    """Datetime naïf en UTC : les dates stockées sont sans fuseau."""
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
 
 
 class SessionService:
@@ -38,12 +59,37 @@ class SessionService:
         self.formation_repo = formation_repo
         self.user_repo = user_repo
 
+    def _check_teacher_schedule(
+        self,
+        teacher_id: int,
+        start_date: datetime,
+        end_date: datetime,
+        exclude_id: Optional[int] = None,
+    ) -> None:
+        """Lève SessionTeacherScheduleConflict si le formateur a déjà une session sur [start_date, end_date)."""
+        if self.repo.find_teacher_overlap(teacher_id, start_date, end_date, exclude_id) is not None:
+            raise SessionTeacherScheduleConflict()
+
+    def _save(self, write):
+        """
+        Exécute l'écriture ; une violation de la contrainte d'exclusion (session concurrente
+        créée entre la vérification et le commit) devient SessionTeacherScheduleConflict.
+        """
+        try:
+            return write()
+        except IntegrityError as exc:
+            self.repo.session.rollback()
+            diag = getattr(exc.orig, "diag", None)
+            if getattr(diag, "constraint_name", None) == TEACHER_SCHEDULE_CONSTRAINT:
+                raise SessionTeacherScheduleConflict() from exc
+            raise
+
     def create(self, data: SessionCreate) -> Session:
         """
         Crée une session.
         Lève FormationNotFound si la formation n'existe pas, TeacherNotFound si le formateur n'existe pas,
         SessionStartDateAfterEndDate si start_date >= end_date,
-        SessionStartDateAlreadyExists / SessionEndDateAlreadyExists si une session existe déjà avec ces dates.
+        SessionTeacherScheduleConflict si le formateur anime déjà une session qui chevauche ces dates.
         """
         if self.formation_repo.get_by_id(data.formation_id) is None:
             raise FormationNotFound()
@@ -53,11 +99,8 @@ class SessionService:
             raise UserNotTrainer()
         if data.start_date >= data.end_date:
             raise SessionStartDateAfterEndDate()
-        if self.repo.get_by_start_date(data.start_date) is not None:
-            raise SessionStartDateAlreadyExists()
-        if self.repo.get_by_end_date(data.end_date) is not None:
-            raise SessionEndDateAlreadyExists()
-        return self.repo.create(data)
+        self._check_teacher_schedule(data.teacher_id, data.start_date, data.end_date)
+        return self._save(lambda: self.repo.create(data))
 
     def get_by_id(self, id: int) -> Session:
         """Retourne la session d'id donné ou lève SessionNotFound."""
@@ -66,15 +109,39 @@ class SessionService:
             raise SessionNotFound()
         return session
 
+    def get_fields(self, id: int, fields: Sequence[str]) -> Row:
+        """Projection de la session d'id donné sur `fields` (et l'id) ; lève SessionNotFound si absente."""
+        rows = self.repo.list_columns(fields, ids=[id])
+        if not rows:
+            raise SessionNotFound()
+        return rows[0]
+
+    def get_many(
+        self, ids: List[int], fields: Optional[Sequence[str]] = None
+    ) -> Tuple[List[Union[Session, Row]], List[int]]:
+        """
+        Lecture groupée : (sessions trouvées dans l'ordre de `ids`, ids introuvables).
+
+        Une seule requête quel que soit le nombre d'ids ; pas d'exception si certains manquent.
+        Avec `fields`, des lignes de projection (colonnes demandées) au lieu des entités.
+        """
+        items = self.repo.list_by_ids(ids) if fields is None else self.repo.list_columns(fields, ids=ids)
+        return order_by_ids(items, ids)
+
     def list(self, offset: int = 0, limit: int = 100) -> List[Session]:
         """Liste paginée de sessions (délègue au repo, pas d'exception si vide)."""
         return self.repo.list(offset=offset, limit=limit)
 
+    def list_fields(self, fields: Sequence[str], offset: int = 0, limit: int = 100) -> List[Row]:
+        """Page de list() projetée sur `fields` (et l'id)."""
+        return self.repo.list_columns(fields, offset=offset, limit=limit)
+
     def update(self, id: int, data: SessionUpdate) -> Session:
         """
         Met à jour une session (champs fournis uniquement).
         Lève SessionNotFound si absente, FormationNotFound/TeacherNotFound si ids invalides,
-        SessionStartDateAfterEndDate si ordre des dates invalide.
+        SessionStartDateAfterEndDate si ordre des dates invalide,
+        SessionTeacherScheduleConflict si la nouvelle période chevauche une autre session du formateur.
         """
         session = self.repo.get_by_id(id)
         if session is None:
@@ -92,7 +159,14 @@ class SessionService:
         elif data.end_date is not None:
             if session.start_date >= data.end_date:
                 raise SessionStartDateAfterEndDate()
-        updated = self.repo.update(id, data)
+        if data.teacher_id is not None or data.start_date is not None or data.end_date is not None:
+            self._check_teacher_schedule(
+                data.teacher_id if data.teacher_id is not None else session.teacher_id,
+                data.start_date if data.start_date is not None else session.start_date,
+                data.end_date if data.end_date is not None else session.end_date,
+                exclude_id=id,
+            )
+        updated = self._save(lambda: self.repo.update(id, data))
         if updated is None:
             raise SessionNotFound()
         return updated
@@ -104,6 +178,47 @@ class SessionService:
             raise SessionNotFound()
         return deleted
 
+    def calendar(
+        self,
+        date_from: datetime,
+        date_to: datetime,
+        teacher_id: Optional[int] = None,
+        formation_id: Optional[int] = None,
+        status: Optional[SessionStatus] = None,
+    ) -> SessionCalendarRead:
+        """
+        Sessions qui chevauchent [date_from, date_to) et nombre de sessions en cours par jour.
+        Une seule requête indexée ; le comptage par jour est fait sur le résultat.
+        Lève SessionCalendarRangeInvalid si date_from >= date_to ou si la fenêtre dépasse CALENDAR_MAX_DAYS.
+        Des bornes avec fuseau (ex. `...Z` envoyé par `toISOString()`) sont ramenées en UTC
+        naïf, comme les dates des sessions.
+        """
+        date_from, date_to = _naive_utc(date_from), _naive_utc(date_to)
+        if date_from >= date_to or date_to - date_from > timedelta(days=CALENDAR_MAX_DAYS):
+            raise SessionCalendarRangeInvalid()
+        sessions = self.repo.list_overlapping(date_from, date_to, teacher_id, formation_id, status)
+
+        first_day = date_from.date()
+        last_day = (date_to - timedelta(microseconds=1)).date()
+        counts: Dict = {}
+        for session in sessions:
+            day = max(session.start_date, date_from).date()
+            end = min(session.end_date - timedelta(microseconds=1), date_to - timedelta(microseconds=1)).date()
+            while day <= end:
+                counts[day] = counts.get(day, 0) + 1
+                day += timedelta(days=1)
+        days = []
+        day = first_day
+        while day <= last_day:
+            days.append(CalendarDay(date=day, count=counts.get(day, 0)))
+            day += timedelta(days=1)
+        return SessionCalendarRead(
+            date_from=date_from,
+            date_to=date_to,
+            sessions=[SessionRead.model_validate(s) for s in sessions],
+            days=days,
+        )
+
     def list_by_formation_id(self, formation_id: int) -> List[Session]:
         """Retourne toutes les sessions pour une formation donnée (liste vide si aucune)."""
         return self.repo.list_by_formation_id(formation_id)
@@ -2,18 +2,21 @@
 Service métier pour l'émargement (pad signature).
 
 Règles : session existante, utilisateur inscrit (enrollment), date dans la période
-session (start_date..end_date), au plus une signature par (session, user, date).
+session (start_date..end_date), au plus une signature par (session, user, date) —
+par créneau en émargement par demi-journée. Le stockage (table `signatures` ou
+bitmap par inscription) est celui du repository injecté.
 """
 from datetime import date
-from typing import List
+from typing import List, Union
 
 from app.core.errors import (
+    AttendanceSlotInvalid,
     SessionNotFound,
     SignatureAlreadyExistsForDate,
     SignatureDateOutsideSession,
     UserNotEnrolledInSession,
 )
-from app.models.signature import Signature
+from app.repositories.attendance_repo import AttendanceBitmapRepository, SignatureRecord
 from app.repositories.enrollment_repo import EnrollmentRepository
 from app.repositories.session_repo import SessionRepository
 from app.repositories.signature_repo import SignatureRepository
@@ -25,7 +28,7 @@ class SignatureService:
 
     def __init__(
         self,
-        signature_repo: SignatureRepository,
+        signature_repo: Union[SignatureRepository, AttendanceBitmapRepository],
         session_repo: SessionRepository,
         enrollment_repo: EnrollmentRepository,
     ):
@@ -33,12 +36,14 @@ class SignatureService:
         self.session_repo = session_repo
         self.enrollment_repo = enrollment_repo
 
-    def sign(self, data: SignatureCreate) -> Signature:
+    def sign(self, data: SignatureCreate) -> SignatureRecord:
         """
         Enregistre un émargement (un jour signé).
-        Lève SessionNotFound, UserNotEnrolledInSession, SignatureDateOutsideSession,
-        SignatureAlreadyExistsForDate.
+        Lève AttendanceSlotInvalid, SessionNotFound, UserNotEnrolledInSession,
+        SignatureDateOutsideSession, SignatureAlreadyExistsForDate.
         """
+        if (data.slot is not None) != (self.signature_repo.slots_per_day == 2):
+            raise AttendanceSlotInvalid()
         session = self.session_repo.get_by_id(data.session_id)
         if session is None:
             raise SessionNotFound()
@@ -55,12 +60,12 @@ class SignatureService:
         if enrollment is None:
             raise UserNotEnrolledInSession()
 
-        if self.signature_repo.exists_for_date(data.session_id, data.user_id, sign_date):
+        signature = self.signature_repo.create(data.session_id, data.user_id, sign_date, data.slot)
+        if signature is None:
             raise SignatureAlreadyExistsForDate()
+        return signature
 
-        return self.signature_repo.create(data.session_id, data.user_id, sign_date)
-
-    def get_by_id(self, id: int) -> Signature:
+    def get_by_id(self, id: int) -> SignatureRecord:
         """Retourne une signature par id. Lève SignatureNotFound si absente."""
         from app.core.errors import SignatureNotFound
 
@@ -71,7 +76,7 @@ class SignatureService:
 
     def list_by_session_and_date(
         self, session_id: int, sign_date: date
-    ) -> List[Signature]:
+    ) -> List[SignatureRecord]:
         """Liste les signatures pour une session et un jour (qui a signé ce jour-là)."""
         if self.session_repo.get_by_id(session_id) is None:
             raise SessionNotFound()
@@ -79,15 +84,18 @@ class SignatureService:
 
     def list_by_session_and_user(
         self, session_id: int, user_id: int
-    ) -> List[Signature]:
+    ) -> List[SignatureRecord]:
         """Liste les dates signées par un utilisateur pour une session (historique pad)."""
-        if self.session_repo.get_by_id(session_id) is None:
+        session = self.session_repo.get_by_id(session_id)
+        if session is None:
             raise SessionNotFound()
-        return self.signature_repo.list_by_session_and_user(session_id, user_id)
+        return self.signature_repo.list_by_session_and_user(
+            session_id, user_id, session.start_date.date(), session.end_date.date()
+        )
 
     def list_by_session_and_date_range(
         self, session_id: int, start_date: date, end_date: date
-    ) -> List[Signature]:
+    ) -> List[SignatureRecord]:
         """Liste les signatures pour une session et une période (dates signées)."""
         if self.session_repo.get_by_id(session_id) is None:
             raise SessionNotFound()
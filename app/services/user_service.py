@@ -3,15 +3,18 @@ Service métier pour les utilisateurs.
 
 Orchestre le repository et applique les règles métier (unicité email, levée d'exceptions).
 """
-from typing import List, Optional
+from typing import List, Optional, Sequence, Tuple, Union
 
 from pydantic import EmailStr
+from sqlalchemy import Row
 from sqlalchemy.exc import IntegrityError
-import bcrypt
-from app.core.errors import EmailAlreadyUsed, UserNotFound
+from app.core.errors import EmailAlreadyUsed, UserHasSessions, UserNotFound
+from app.core.security import hash_password
+from app.models.session import TEACHER_FOREIGN_KEY
 from app.models.user import User
 from app.repositories.user_repo import UserRepository
 from app.schemas.user import UserCreate, UserUpdate
+from app.services.batch import order_by_ids
 
 
 class UserService:
@@ -45,6 +48,13 @@ class UserService:
             raise UserNotFound()
         return user
 
+    def get_fields(self, id: int, fields: Sequence[str]) -> Row:
+        """Projection de l'utilisateur d'id donné sur `fields` (et l'id) ; lève UserNotFound si absent."""
+        rows = self.repo.list_columns(fields, ids=[id])
+        if not rows:
+            raise UserNotFound()
+        return rows[0]
+
     def get_by_email(self, email: EmailStr) -> User:
         """Retourne l'utilisateur avec cet email ou lève UserNotFound."""
         email = email.lower().strip()
@@ -53,10 +63,26 @@ class UserService:
             raise UserNotFound()
         return user
 
+    def get_many(
+        self, ids: List[int], fields: Optional[Sequence[str]] = None
+    ) -> Tuple[List[Union[User, Row]], List[int]]:
+        """
+        Lecture groupée : (utilisateurs trouvés dans l'ordre de `ids`, ids introuvables).
+
+        Une seule requête quel que soit le nombre d'ids ; pas d'exception si certains manquent.
+        Avec `fields`, des lignes de projection (colonnes demandées) au lieu des entités.
+        """
+        items = self.repo.list_by_ids(ids) if fields is None else self.repo.list_columns(fields, ids=ids)
+        return order_by_ids(items, ids)
+
     def list(self, offset: int = 0, limit: int = 100) -> List[User]:
         """Liste paginée d'utilisateurs (délègue au repo, pas d'exception si vide)."""
         return self.repo.list(offset=offset, limit=limit)
 
+    def list_fields(self, fields: Sequence[str], offset: int = 0, limit: int = 100) -> List[Row]:
+        """Page de list() projetée sur `fields` (et l'id)."""
+        return self.repo.list_columns(fields, offset=offset, limit=limit)
+
     def update(self, id: int, data: UserUpdate) -> User:
         """Met à jour l'utilisateur par id. Lève UserNotFound si absent, EmailAlreadyUsed si nouvel email déjà pris."""
         user = self.repo.get_by_id(id)
@@ -80,12 +106,18 @@ class UserService:
         return updated
 
     def delete(self, id: int) -> bool:
-        """Supprime l'utilisateur par id. Lève UserNotFound si absent."""
-        deleted = self.repo.delete(id)
+        """Supprime l'utilisateur par id. Lève UserNotFound si absent, UserHasSessions s'il anime des sessions."""
+        try:
+            deleted = self.repo.delete(id)
+        except IntegrityError as exc:
+            self.repo.session.rollback()
+            if getattr(getattr(exc.orig, "diag", None), "constraint_name", None) == TEACHER_FOREIGN_KEY:
+                raise UserHasSessions() from exc
+            raise
         if not deleted:
             raise UserNotFound()
         return deleted
 
     def hash_password(self, password: str) -> str: 
         """Hash un mot de passe en utilisant bcrypt."""
-        return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
\ No newline at end of file
+        return hash_password(password)
\ No newline at end of file
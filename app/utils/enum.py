@@ -28,3 +28,10 @@ class SessionStatus(str, Enum):
     ONGOING = "ongoing"
     COMPLETED = "completed"
 
+
+
+class AttendanceSlot(str, Enum):
+    """Créneau d'émargement par demi-journée (feuilles de présence matin / après-midi)."""
+
+    MORNING = "morning"
+    AFTERNOON = "afternoon"
@@ -0,0 +1,6 @@
+"""
+Benchmarks de performance de l'API GestSimplon.
+
+Outils hors suite de tests : jeu de données réaliste, mesure de latence par route
+et comparaison à une baseline JSON versionnée.
+"""
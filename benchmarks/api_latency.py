@@ -0,0 +1,525 @@
+"""
+Benchmark de latence des endpoints de l'API (in-process, via l'app ASGI).
+
+Charge le jeu de données de `benchmarks.dataset`, appelle chaque route de
+`app/api/v1/router.py` avec TestClient, mesure p50/p95/p99 et le nombre de requêtes
+SQL par appel, puis compare à une baseline JSON.
+
+Usage :
+    BENCH_DATABASE_URL=postgresql://... python -m benchmarks.api_latency [--scale 1.0] [--update-baseline]
+
+Code de sortie : 0 si OK, 1 si régression par rapport à la baseline, 2 si une route
+n'a pas de scénario.
+"""
+import argparse
+import itertools
+import os
+import random
+import sys
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from benchmarks.common import (
+    DEFAULT_TOLERANCE,
+    QueryCounter,
+    compare_to_baseline,
+    load_baseline,
+    summarize,
+    use_bench_database,
+    write_report,
+)
+from benchmarks.dataset import BRIEFS_PER_SESSION, GROUPS_PER_SESSION, PASSWORD, Dataset
+
+API = "/api/v1"
+DEFAULT_BASELINE = Path(__file__).parent / "baseline.json"
+# Dates des sessions créées par le benchmark : après le jeu de données (et après les runs précédents).
+BENCH_EPOCH = datetime(2099, 1, 4, 9, 0, 0)
+# Taille des lectures groupées (`?ids=`) : l'équivalent d'une page hydratée côté client.
+BATCH_IDS = 100
+
+Call = Tuple[str, Optional[Dict[str, Any]]]
+
+
+@dataclass
+class Scenario:
+    """Route mesurée : `build(ctx)` prépare l'appel (hors chrono) et retourne (url, json)."""
+
+    method: str
+    path: str
+    build: Callable[["BenchContext"], Call]
+    expect: int = 200
+    admin: bool = False
+
+    @property
+    def name(self) -> str:
+        return f"{self.method} {self.path}"
+
+
+class BenchContext:
+    """Ids du jeu de données et helpers de préparation (appels non chronométrés)."""
+
+    def __init__(self, client: Any, data: Dataset, seed: int, epoch: datetime = BENCH_EPOCH):
+        self.client = client
+        self.epoch = epoch
+        self.run_tag = uuid.uuid4().hex[:8]
+        self.rng = random.Random(seed)
+        self.sequence = itertools.count(1)
+        self.sessions = data.sessions
+        self.formation_count = data.formation_count
+        self.trainer_ids = data.trainer_ids
+        self.learner_ids = data.learner_ids
+        self.admin_ids = data.admin_ids
+        self.students_by_session = data.students_by_session
+        self.enrollment_count = sum(len(s) for s in data.students_by_session.values())
+        self.free_learners = iter(self.rng.sample(self.learner_ids, len(self.learner_ids)))
+        self.bench_session_id = 0
+        self.token = ""
+        self.admin_token = ""
+
+    def prepare(self) -> None:
+        """Crée la session « bac à sable » des scénarios d'écriture et les tokens apprenant / admin."""
+        self.bench_session_id = self.post(
+            "/sessions",
+            {
+                "formation_id": 1,
+                "teacher_id": self.trainer_ids[0],
+                "start_date": self.epoch.isoformat(),
+                "end_date": (self.epoch + timedelta(days=300)).isoformat(),
+                "capacity_max": 1_000_000,
+                "status": "scheduled",
+            },
+        )
+        self.token = self.login(self.learner_email(self.learner_ids[0]))
+        self.admin_token = self.login(self.admin_email(self.admin_ids[0]))
+
+    def login(self, email: str) -> str:
+        response = self.client.post(f"{API}/auth/login", json={"email": email, "password": PASSWORD})
+        if response.status_code != 200:
+            raise RuntimeError(f"setup login {email} failed: {response.status_code} {response.text}")
+        return response.json()["access_token"]
+
+    def post(self, path: str, payload: Dict[str, Any]) -> int:
+        """POST de préparation ; retourne l'id créé."""
+        response = self.client.post(f"{API}{path}", json=payload)
+        if response.status_code != 201:
+            raise RuntimeError(f"setup POST {path} failed: {response.status_code} {response.text}")
+        return response.json()["id"]
+
+    def unique(self) -> int:
+        return next(self.sequence)
+
+    def learner_email(self, user_id: int) -> str:
+        return f"learner{user_id}@bench-gestsimplon.com"
+
+    def admin_email(self, user_id: int) -> str:
+        return f"admin{user_id}@bench-gestsimplon.com"
+
+    def session(self) -> Dict[str, Any]:
+        return self.rng.choice(self.sessions)
+
+    def session_id(self) -> int:
+        return self.session()["id"]
+
+    def formation_id(self) -> int:
+        return self.rng.randint(1, self.formation_count)
+
+    def learner_id(self) -> int:
+        return self.rng.choice(self.learner_ids)
+
+    def enrollment_id(self) -> int:
+        return self.rng.randint(1, self.enrollment_count)
+
+    def group_id(self) -> int:
+        return self.rng.randint(1, len(self.sessions) * GROUPS_PER_SESSION)
+
+    def group_of(self, session_id: int) -> int:
+        """Id d'un groupe généré pour cette session (ids consécutifs par session)."""
+        return (session_id - 1) * GROUPS_PER_SESSION + self.rng.randint(1, GROUPS_PER_SESSION)
+
+    def brief_id(self) -> int:
+        return self.rng.randint(1, len(self.sessions) * BRIEFS_PER_SESSION)
+
+    def enrolled_learner(self) -> Tuple[int, int]:
+        session = self.session()
+        return session["id"], self.rng.choice(self.students_by_session[session["id"]])
+
+    def enroll(self, student_id: int) -> int:
+        """Inscrit un apprenant à la session bac à sable ; retourne l'id d'inscription."""
+        return self.post("/enrollments", {"session_id": self.bench_session_id, "student_id": student_id})
+
+    def user_payload(self) -> Dict[str, Any]:
+        return {
+            "email": f"bench_{self.run_tag}_{self.unique()}@bench-gestsimplon.com",
+            "first_name": "Bench",
+            "last_name": "User",
+            "password": PASSWORD,
+            "role": "learner",
+        }
+
+    def formation_payload(self) -> Dict[str, Any]:
+        return {
+            "title": f"Bench formation {self.run_tag} {self.unique()}",
+            "duration_hours": 35,
+            "level": "1",
+        }
+
+    def session_payload(self) -> Dict[str, Any]:
+        start = self.epoch + timedelta(days=400 + 2 * self.unique(), minutes=self.rng.randint(0, 59))
+        return {
+            "formation_id": self.formation_id(),
+            "teacher_id": self.rng.choice(self.trainer_ids),
+            "start_date": start.isoformat(),
+            "end_date": (start + timedelta(hours=8)).isoformat(),
+            "capacity_max": 30,
+            "status": "scheduled",
+        }
+
+    def brief_payload(self, session_id: int, group_id: Optional[int] = None) -> Dict[str, Any]:
+        return {
+            "title": f"Bench brief {self.unique()}",
+            "delivery_deadline": (self.epoch + timedelta(days=30)).isoformat(),
+            "session_id": session_id,
+            "group_id": group_id,
+        }
+
+
+def _by_formation_and_teacher(c: BenchContext) -> Call:
+    session = c.session()
+    return f"{API}/sessions/formation/{session['formation_id']}/teacher/{session['teacher_id']}", None
+
+
+def _calendar_month(c: BenchContext) -> Call:
+    """Vue mois autour d'une session du jeu de données (toutes sessions, sans filtre)."""
+    start = c.session()["start_date"].replace(day=1, hour=0, minute=0, second=0)
+    end = (start + timedelta(days=32)).replace(day=1)
+    return f"{API}/sessions/calendar?from={start.isoformat()}&to={end.isoformat()}", None
+
+
+def _ids(pick: Callable[[], int], count: int = BATCH_IDS) -> str:
+    return ",".join(str(pick()) for _ in range(count))
+
+
+def _trainer_digest(c: BenchContext) -> Call:
+    """Digest du formateur d'une session du jeu de données, le jour de son début."""
+    session = c.session()
+    return f"{API}/users/{session['teacher_id']}/digest?date={session['start_date'].date().isoformat()}", None
+
+
+def _patch_session(c: BenchContext) -> Call:
+    session = c.session()
+    return f"{API}/sessions/{session['id']}", {"capacity_max": session["capacity_max"]}
+
+
+def _sign(c: BenchContext) -> Call:
+    student_id = next(c.free_learners)
+    c.enroll(student_id)
+    payload = {
+        "session_id": c.bench_session_id,
+        "user_id": student_id,
+        "date": c.epoch.date().isoformat(),
+    }
+    return f"{API}/signatures", payload
+
+
+def _signatures_by_date(c: BenchContext) -> Call:
+    session = c.session()
+    return f"{API}/signatures/session/{session['id']}/date/{session['start_date'].date().isoformat()}", None
+
+
+def _signatures_by_user(c: BenchContext) -> Call:
+    session_id, student_id = c.enrolled_learner()
+    return f"{API}/signatures/session/{session_id}/user/{student_id}", None
+
+
+def _signature_by_id(c: BenchContext) -> Call:
+    """Id lu via l'historique d'un inscrit (hors chrono) : valable quel que soit ATTENDANCE_STORAGE."""
+    while True:
+        path, _ = _signatures_by_user(c)
+        signatures = c.client.get(path).json()
+        if signatures:
+            return f"{API}/signatures/{c.rng.choice(signatures)['id']}", None
+
+
+def _create_brief(c: BenchContext) -> Call:
+    session_id = c.session_id()
+    return f"{API}/briefs", c.brief_payload(session_id, group_id=c.group_of(session_id))
+
+
+def _delete_brief(c: BenchContext) -> Call:
+    return f"{API}/briefs/{c.post('/briefs', c.brief_payload(c.bench_session_id))}", None
+
+
+def _create_group(c: BenchContext) -> Call:
+    session_id = c.session_id()
+    payload = {
+        "session_id": session_id,
+        "name": f"Bench {c.unique()}",
+        "student_ids": c.students_by_session[session_id][:10],
+    }
+    return f"{API}/groups", payload
+
+
+def _delete_group(c: BenchContext) -> Call:
+    group_id = c.post("/groups", {"session_id": c.bench_session_id, "name": "Bench"})
+    return f"{API}/groups/{group_id}", None
+
+
+def _get_profile(c: BenchContext) -> Call:
+    response = c.client.get(
+        f"{API}/formations/{c.formation_id()}",
+        headers={"Authorization": f"Bearer {c.admin_token}", "X-Profile": "1"},
+    )
+    return f"{API}/debug/profiles/{response.headers['X-Profile-Id']}", None
+
+
+def _scenarios() -> List[Scenario]:
+    """Un scénario par (méthode, route) de api_router."""
+    s = Scenario
+    return [
+        # auth
+        s("POST", f"{API}/auth/login", lambda c: (
+            f"{API}/auth/login", {"email": c.learner_email(c.learner_id()), "password": PASSWORD},
+        )),
+        s("POST", f"{API}/auth/change-password", lambda c: (
+            f"{API}/auth/change-password", {"new_password": PASSWORD},
+        ), expect=204),
+        # users
+        s("POST", f"{API}/users", lambda c: (f"{API}/users", c.user_payload()), expect=201),
+        s("GET", f"{API}/users", lambda c: (f"{API}/users?offset={c.rng.randint(0, 9000)}&limit=100", None)),
+        s("GET", f"{API}/users?ids", lambda c: (f"{API}/users?ids={_ids(c.learner_id)}", None)),
+        s("GET", f"{API}/users?fields", lambda c: (
+            f"{API}/users?offset={c.rng.randint(0, 9000)}&limit=100&fields=id,first_name,last_name", None,
+        )),
+        s("GET", f"{API}/users/{{id}}", lambda c: (f"{API}/users/{c.learner_id()}", None)),
+        s("GET", f"{API}/users/{{id}}/dashboard", lambda c: (
+            f"{API}/users/{c.enrolled_learner()[1]}/dashboard", None,
+        )),
+        s("GET", f"{API}/users/{{id}}/digest", _trainer_digest),
+        s("PATCH", f"{API}/users/{{id}}", lambda c: (
+            f"{API}/users/{c.learner_id()}", {"first_name": f"Prenom{c.unique()}"},
+        )),
+        s("DELETE", f"{API}/users/{{id}}", lambda c: (
+            f"{API}/users/{c.post('/users', c.user_payload())}", None,
+        ), expect=204),
+        # formations
+        s("POST", f"{API}/formations", lambda c: (f"{API}/formations", c.formation_payload()), expect=201),
+        s("GET", f"{API}/formations", lambda c: (f"{API}/formations?offset={c.rng.randint(0, 400)}", None)),
+        s("GET", f"{API}/formations?ids", lambda c: (f"{API}/formations?ids={_ids(c.formation_id)}", None)),
+        s("GET", f"{API}/formations/{{id}}", lambda c: (f"{API}/formations/{c.formation_id()}", None)),
+        s("PATCH", f"{API}/formations/{{id}}", lambda c: (
+            f"{API}/formations/{c.formation_id()}", {"description": f"Description {c.unique()}"},
+        )),
+        s("DELETE", f"{API}/formations/{{id}}", lambda c: (
+            f"{API}/formations/{c.post('/formations', c.formation_payload())}", None,
+        ), expect=204),
+        # sessions
+        s("POST", f"{API}/sessions", lambda c: (f"{API}/sessions", c.session_payload()), expect=201),
+        s("GET", f"{API}/sessions", lambda c: (f"{API}/sessions?offset={c.rng.randint(0, 1900)}", None)),
+        s("GET", f"{API}/sessions?ids", lambda c: (f"{API}/sessions?ids={_ids(c.session_id)}", None)),
+        s("GET", f"{API}/sessions/formation/{{formation_id}}", lambda c: (
+            f"{API}/sessions/formation/{c.session()['formation_id']}", None,
+        )),
+        s("GET", f"{API}/sessions/teacher/{{teacher_id}}", lambda c: (
+            f"{API}/sessions/teacher/{c.rng.choice(c.trainer_ids)}", None,
+        )),
+        s("GET", f"{API}/sessions/formation/{{formation_id}}/teacher/{{teacher_id}}", _by_formation_and_teacher),
+        s("GET", f"{API}/sessions/start_date/{{start_date_str}}", lambda c: (
+            f"{API}/sessions/start_date/{c.session()['start_date'].isoformat()}", None,
+        )),
+        s("GET", f"{API}/sessions/end_date/{{end_date_str}}", lambda c: (
+            f"{API}/sessions/end_date/{c.session()['end_date'].isoformat()}", None,
+        )),
+        s("GET", f"{API}/sessions/calendar", _calendar_month),
+        s("GET", f"{API}/sessions/{{id}}", lambda c: (f"{API}/sessions/{c.session_id()}", None)),
+        s("PATCH", f"{API}/sessions/{{id}}", _patch_session),
+        s("DELETE", f"{API}/sessions/{{id}}", lambda c: (
+            f"{API}/sessions/{c.post('/sessions', c.session_payload())}", None,
+        ), expect=204),
+        # signatures
+        s("POST", f"{API}/signatures", _sign, expect=201),
+        s("GET", f"{API}/signatures/session/{{session_id}}/date/{{date_str}}", _signatures_by_date),
+        s("GET", f"{API}/signatures/session/{{session_id}}/date/{{date_str}}/stream", lambda c: (
+            f"{_signatures_by_date(c)[0]}/stream", None,
+        )),
+        s("GET", f"{API}/signatures/session/{{session_id}}/user/{{user_id}}", _signatures_by_user),
+        s("GET", f"{API}/signatures/{{id}}", _signature_by_id),
+        # enrollments
+        s("POST", f"{API}/enrollments", lambda c: (
+            f"{API}/enrollments", {"session_id": c.bench_session_id, "student_id": next(c.free_learners)},
+        ), expect=201),
+        s("GET", f"{API}/enrollments", lambda c: (f"{API}/enrollments", None)),
+        s("GET", f"{API}/enrollments/session/{{session_id}}", lambda c: (
+            f"{API}/enrollments/session/{c.session_id()}", None,
+        )),
+        s("GET", f"{API}/enrollments/student/{{student_id}}", lambda c: (
+            f"{API}/enrollments/student/{c.learner_id()}", None,
+        )),
+        s("GET", f"{API}/enrollments/{{id}}", lambda c: (f"{API}/enrollments/{c.enrollment_id()}", None)),
+        s("PATCH", f"{API}/enrollments/{{id}}", lambda c: (f"{API}/enrollments/{c.enrollment_id()}", {})),
+        s("DELETE", f"{API}/enrollments/{{id}}", lambda c: (
+            f"{API}/enrollments/{c.enroll(next(c.free_learners))}", None,
+        ), expect=204),
+        # briefs
+        s("POST", f"{API}/briefs", _create_brief, expect=201),
+        s("GET", f"{API}/briefs", lambda c: (f"{API}/briefs", None)),
+        s("GET", f"{API}/briefs/session/{{session_id}}", lambda c: (
+            f"{API}/briefs/session/{c.session_id()}", None,
+        )),
+        s("GET", f"{API}/briefs/student/{{student_id}}", lambda c: (
+            f"{API}/briefs/student/{c.learner_id()}", None,
+        )),
+        s("GET", f"{API}/briefs/{{id}}", lambda c: (f"{API}/briefs/{c.brief_id()}", None)),
+        s("PATCH", f"{API}/briefs/{{id}}", lambda c: (
+            f"{API}/briefs/{c.brief_id()}", {"title": f"Brief {c.unique()}"},
+        )),
+        s("DELETE", f"{API}/briefs/{{id}}", _delete_brief, expect=204),
+        # groups
+        s("POST", f"{API}/groups", _create_group, expect=201),
+        s("POST", f"{API}/groups/session/{{session_id}}/auto", lambda c: (
+            f"{API}/groups/session/{c.session_id()}/auto", {"group_size": 5, "stratify": True},
+        ), expect=201),
+        s("GET", f"{API}/groups/session/{{session_id}}", lambda c: (
+            f"{API}/groups/session/{c.session_id()}", None,
+        )),
+        s("GET", f"{API}/groups/{{id}}", lambda c: (f"{API}/groups/{c.group_id()}", None)),
+        s("PATCH", f"{API}/groups/{{id}}", lambda c: (
+            f"{API}/groups/{c.group_id()}", {"name": f"Groupe {c.unique()}"},
+        )),
+        s("DELETE", f"{API}/groups/{{id}}", _delete_group, expect=204),
+        # debug
+        s("GET", f"{API}/debug/queries", lambda c: (f"{API}/debug/queries?limit=20", None), admin=True),
+        s("GET", f"{API}/debug/profiles/{{profile_id}}", _get_profile, admin=True),
+    ]
+
+
+def _api_routes(app: Any) -> List[str]:
+    """Liste « MÉTHODE chemin » de toutes les routes montées sous /api/v1."""
+    from app.api.introspection import api_operations
+
+    return list(api_operations(app, API))
+
+
+def run(
+    client: Any,
+    ctx: BenchContext,
+    scenarios: List[Scenario],
+    *,
+    iterations: int,
+    warmup: int,
+    only: Optional[str] = None,
+) -> Dict[str, Dict[str, float]]:
+    """Exécute chaque scénario (warmup puis `iterations` appels chronométrés)."""
+    results: Dict[str, Dict[str, float]] = {}
+    headers = {"Authorization": f"Bearer {ctx.token}"}
+    admin_headers = {"Authorization": f"Bearer {ctx.admin_token}"}
+    with QueryCounter() as counter:
+        for scenario in scenarios:
+            if only and only not in scenario.name:
+                continue
+            durations: List[float] = []
+            queries: List[int] = []
+            for i in range(warmup + iterations):
+                url, payload = scenario.build(ctx)
+                counter.reset()
+                started = time.perf_counter()
+                response = client.request(
+                    scenario.method, url, json=payload, headers=admin_headers if scenario.admin else headers
+                )
+                elapsed = (time.perf_counter() - started) * 1000
+                if response.status_code != scenario.expect:
+                    raise RuntimeError(
+                        f"{scenario.name} -> {response.status_code} (expected {scenario.expect}): {response.text[:200]}"
+                    )
+                if i >= warmup:
+                    durations.append(elapsed)
+                    queries.append(counter.count)
+            results[scenario.name] = summarize(durations, queries)
+            print(f"{scenario.name:<75} p50={results[scenario.name]['p50_ms']:>9.2f}ms "
+                  f"p95={results[scenario.name]['p95_ms']:>9.2f}ms q={results[scenario.name]['queries_per_call']}")
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", type=float, default=1.0, help="Facteur d'échelle du jeu de données (1.0 = 10k users).")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--reuse-data",
+        action="store_true",
+        help="Réutiliser la base déjà peuplée (même --scale / --seed) au lieu de la recharger.",
+    )
+    parser.add_argument("--iterations", type=int, default=30)
+    parser.add_argument("--warmup", type=int, default=3)
+    parser.add_argument("--only", help="Ne mesurer que les routes dont le nom contient cette chaîne.")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--update-baseline", action="store_true", help="Écrire les résultats comme nouvelle baseline.")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    parser.add_argument("--output", type=Path, help="Écrire aussi les résultats dans ce fichier JSON.")
+    args = parser.parse_args(argv)
+
+    use_bench_database()
+    # QueryCounter compte tout le process : threads de fond (planificateur, outbox) coupés.
+    os.environ.setdefault("BRIEF_SCHEDULER_INTERVAL_SECONDS", "0")
+    os.environ.setdefault("OUTBOX_POLL_SECONDS", "0")
+    # Flux SSE fermé après le snapshot : on mesure la connexion d'un formateur.
+    os.environ.setdefault("SIGNATURE_STREAM_MAX_SECONDS", "0")
+    # Toutes les connexions viennent du même client : limiteur actif mais hors d'atteinte.
+    os.environ.setdefault("LOGIN_RATE_LIMIT_PER_IP", "1000000")
+    os.environ.setdefault("LOGIN_RATE_LIMIT_PER_EMAIL", "1000000")
+    from fastapi.testclient import TestClient
+    from sqlalchemy import text
+
+    from app.db.session import get_engine
+    from benchmarks.dataset import seed
+    from main import app
+
+    engine = get_engine()
+    scenarios = _scenarios()
+    missing = sorted(set(_api_routes(app)) - {s.name for s in scenarios})
+    if missing:
+        print("Routes sans scénario de benchmark :\n  " + "\n  ".join(missing), file=sys.stderr)
+        return 2
+
+    if not args.reuse_data:
+        started = time.perf_counter()
+        counts = seed(engine, scale=args.scale, seed=args.seed)
+        print(f"Seed: {counts} en {time.perf_counter() - started:.1f}s")
+    with engine.connect() as conn:
+        last_end = conn.execute(text("SELECT MAX(end_date) FROM sessions")).scalar()
+    epoch = max(BENCH_EPOCH, (last_end or BENCH_EPOCH) + timedelta(days=7))
+    data = Dataset(scale=args.scale, seed=args.seed)
+    data.index()
+
+    with TestClient(app) as client:
+        ctx = BenchContext(client, data, seed=args.seed, epoch=epoch)
+        ctx.prepare()
+        results = run(client, ctx, scenarios, iterations=args.iterations, warmup=args.warmup, only=args.only)
+
+    report = {
+        "meta": {"scale": args.scale, "seed": args.seed, "iterations": args.iterations},
+        "routes": results,
+    }
+    if args.output:
+        write_report(args.output, report)
+    if args.update_baseline:
+        write_report(args.baseline, report)
+        print(f"Baseline écrite : {args.baseline}")
+        return 0
+    baseline = load_baseline(args.baseline)
+    if baseline is None:
+        print(f"Pas de baseline ({args.baseline}) : relancer avec --update-baseline.")
+        return 0
+    if baseline.get("meta", {}).get("scale") != args.scale:
+        print("Attention : baseline mesurée à une autre échelle, comparaison indicative.", file=sys.stderr)
+    regressions = compare_to_baseline(results, baseline["routes"], tolerance=args.tolerance)
+    for line in regressions:
+        print(f"REGRESSION {line}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,129 @@
+"""
+Utilitaires partagés par les benchmarks.
+
+Percentiles, comptage des requêtes SQL (hook `before_cursor_execute`)
+et lecture / écriture / comparaison de baselines JSON.
+"""
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+DEFAULT_TOLERANCE = 0.25
+# En dessous de ce delta (ms), un écart de latence est considéré comme du bruit.
+DEFAULT_NOISE_FLOOR_MS = 1.0
+
+
+def use_bench_database() -> str:
+    """
+    Pointe l'application vers la base de benchmark (BENCH_DATABASE_URL).
+
+    À appeler avant le premier `get_settings()` / `get_engine()` (mis en cache ensuite).
+    Refuse de tourner sans base dédiée (le seed vide les tables).
+    """
+    url = os.getenv("BENCH_DATABASE_URL")
+    if not url:
+        raise SystemExit("BENCH_DATABASE_URL must point to a dedicated database (it gets truncated).")
+    os.environ["DATABASE_URL"] = url
+    os.environ.pop("USE_TEST_DB", None)
+    return url
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Percentile par interpolation linéaire sur une liste déjà triée."""
+    if not sorted_values:
+        return 0.0
+    if len(sorted_values) == 1:
+        return sorted_values[0]
+    rank = (len(sorted_values) - 1) * pct / 100.0
+    low = int(rank)
+    high = min(low + 1, len(sorted_values) - 1)
+    return sorted_values[low] + (sorted_values[high] - sorted_values[low]) * (rank - low)
+
+
+def summarize(durations_ms: List[float], queries: List[int]) -> Dict[str, float]:
+    """Résume une série de mesures : p50/p95/p99 (ms) et requêtes SQL moyennes par appel."""
+    values = sorted(durations_ms)
+    return {
+        "calls": len(values),
+        "p50_ms": round(percentile(values, 50), 3),
+        "p95_ms": round(percentile(values, 95), 3),
+        "p99_ms": round(percentile(values, 99), 3),
+        "queries_per_call": round(sum(queries) / len(queries), 2) if queries else 0.0,
+    }
+
+
+class QueryCounter:
+    """
+    Compte les requêtes SQL exécutées par tous les moteurs SQLAlchemy du process.
+
+    Usage : `with QueryCounter() as counter: ...` puis `counter.count`.
+    """
+
+    def __init__(self) -> None:
+        self.count = 0
+
+    def _on_execute(self, *args: Any, **kwargs: Any) -> None:
+        self.count += 1
+
+    def reset(self) -> None:
+        self.count = 0
+
+    def __enter__(self) -> "QueryCounter":
+        event.listen(Engine, "before_cursor_execute", self._on_execute)
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        event.remove(Engine, "before_cursor_execute", self._on_execute)
+
+
+def load_baseline(path: Path) -> Optional[Dict[str, Any]]:
+    """Charge une baseline JSON, ou None si le fichier n'existe pas."""
+    if not path.exists():
+        return None
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def write_report(path: Path, report: Dict[str, Any]) -> None:
+    """Écrit un rapport / une baseline JSON (clés triées pour des diffs lisibles)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def compare_to_baseline(
+    results: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Dict[str, float]],
+    *,
+    tolerance: float = DEFAULT_TOLERANCE,
+    noise_floor_ms: float = DEFAULT_NOISE_FLOOR_MS,
+    metrics: tuple = ("p50_ms", "p95_ms", "p99_ms"),
+) -> List[str]:
+    """
+    Compare des résultats à une baseline et retourne la liste des régressions.
+
+    Une latence régresse si elle dépasse baseline × (1 + tolerance) et que l'écart absolu
+    dépasse noise_floor_ms. Le nombre de requêtes SQL par appel est déterministe :
+    toute hausse est une régression.
+    """
+    regressions = []
+    for name, current in sorted(results.items()):
+        reference = baseline.get(name)
+        if reference is None:
+            continue
+        for metric in metrics:
+            if metric not in current or metric not in reference:
+                continue
+            limit = reference[metric] * (1 + tolerance)
+            if current[metric] > limit and current[metric] - reference[metric] > noise_floor_ms:
+                regressions.append(
+                    f"{name}: {metric} {current[metric]:.2f} > {reference[metric]:.2f} (+{tolerance:.0%})"
+                )
+        if "queries_per_call" in current and "queries_per_call" in reference:
+            if current["queries_per_call"] > reference["queries_per_call"]:
+                regressions.append(
+                    f"{name}: queries_per_call {current['queries_per_call']} > {reference['queries_per_call']}"
+                )
+    return regressions
@@ -0,0 +1,524 @@
+"""
+Jeu de données réaliste pour les benchmarks.
+
+Volumes de référence (scale=1) : 10k utilisateurs, 500 formations, 2k sessions,
+100k inscriptions, ~1M signatures, plus groupes et briefs. Les lignes sont générées
+de façon déterministe (graine) et respectent les règles métier : sessions animées par
+des formateurs sans chevauchement, inscriptions ≤ capacity_max, signatures dans les
+dates de session, briefs assignés aux membres d'un groupe.
+
+Chargement par COPY (défaut) ou INSERT multi-lignes. En ligne de commande :
+
+    BENCH_DATABASE_URL=... python -m benchmarks.dataset --scale 10 --seed 42 --check
+"""
+import argparse
+import random
+import sys
+import time as timer
+from datetime import date, datetime, time, timedelta
+from enum import Enum
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+from app.core.config import get_settings
+from app.db.partitions import ensure_partitions
+from app.models.brief import Brief, BriefStudent
+from app.models.enrollment import Enrollment
+from app.models.formation import Formation
+from app.models.group import Group, GroupMember
+from app.models.session import Session
+from app.models.signature import Signature
+from app.models.user import User
+from app.repositories.attendance_repo import backfill_from_signatures
+from app.utils.enum import Level, Role, SessionStatus
+
+BASE_SIZES = {
+    "users": 10_000,
+    "formations": 500,
+    "sessions": 2_000,
+}
+# Hash bcrypt (coût 12) de "password123" : toutes les comptes générés partagent ce mot de passe.
+PASSWORD = "password123"
+PASSWORD_HASH = "$2b$12$u5kTkVsYsW6z.toLxBmHve8p1TMw93NMJLsjcpFHjC6TEwwolWSYq"
+# Date de référence fixe : les sessions antérieures sont terminées et émargées.
+REFERENCE_DATE = date(2024, 12, 2)
+FIRST_SESSION_DATE = date(2024, 1, 8)
+ADMIN_COUNT = 5
+TRAINER_RATIO = 0.02
+ATTENDANCE_RATE = 0.9
+GROUPS_PER_SESSION = 4
+BRIEFS_PER_SESSION = 3
+INSERT_CHUNK = 10_000
+LOAD_METHODS = ("copy", "insert")
+
+# Ordre d'insertion (dépendances FK) ; l'ordre inverse sert au TRUNCATE.
+TABLES = [
+    User.__table__,
+    Formation.__table__,
+    Session.__table__,
+    Enrollment.__table__,
+    Signature.__table__,
+    Group.__table__,
+    GroupMember.__table__,
+    Brief.__table__,
+    BriefStudent.__table__,
+]
+
+
+class Dataset:
+    """
+    Génère les lignes de chaque table à partir d'une graine et d'un facteur d'échelle.
+
+    Les ids sont attribués explicitement (1..n) pour relier les tables sans aller-retour
+    en base ; les séquences sont recalées après chargement.
+    """
+
+    def __init__(self, scale: float = 1.0, seed: int = 42):
+        self.scale = scale
+        self.rng = random.Random(seed)
+        self.user_count = max(20, int(BASE_SIZES["users"] * scale))
+        self.formation_count = max(2, int(BASE_SIZES["formations"] * scale))
+        self.session_count = max(2, int(BASE_SIZES["sessions"] * scale))
+        self.admin_ids: List[int] = list(range(1, ADMIN_COUNT + 1))
+        trainer_count = max(1, int(self.user_count * TRAINER_RATIO))
+        self.trainer_ids = list(range(ADMIN_COUNT + 1, ADMIN_COUNT + 1 + trainer_count))
+        self.learner_ids = list(range(self.trainer_ids[-1] + 1, self.user_count + 1))
+        self.sessions: List[Dict[str, Any]] = []
+        self.students_by_session: Dict[int, List[int]] = {}
+
+    def users(self) -> Iterator[Dict[str, Any]]:
+        now = datetime(2023, 9, 1)
+        for uid in range(1, self.user_count + 1):
+            if uid in self.admin_ids:
+                role = Role.ADMIN
+            elif uid <= self.trainer_ids[-1]:
+                role = Role.TRAINER
+            else:
+                role = Role.LEARNER
+            yield {
+                "id": uid,
+                "email": f"{role.value}{uid}@bench-gestsimplon.com",
+                "first_name": f"Prenom{uid}",
+                "last_name": f"Nom{uid}",
+                "hashed_password": PASSWORD_HASH,
+                "registered_at": now,
+                "updated_at": now,
+                "role": role,
+                "must_change_password": False,
+            }
+
+    def formations(self) -> Iterator[Dict[str, Any]]:
+        levels = list(Level)
+        now = datetime(2023, 9, 1)
+        for fid in range(1, self.formation_count + 1):
+            yield {
+                "id": fid,
+                "title": f"Formation {fid:05d}",
+                "description": f"Parcours de formation numéro {fid}.",
+                "duration_hours": self.rng.randint(14, 400),
+                "level": levels[fid % len(levels)],
+                "created_at": now,
+                "updated_at": now,
+            }
+
+    def _plan_sessions(self) -> None:
+        """Planifie les sessions : chaque formateur enchaîne des sessions sans chevauchement."""
+        next_start = {
+            tid: FIRST_SESSION_DATE + timedelta(days=self.rng.randint(0, 300))
+            for tid in self.trainer_ids
+        }
+        for sid in range(1, self.session_count + 1):
+            teacher_id = self.trainer_ids[(sid - 1) % len(self.trainer_ids)]
+            start_day = next_start[teacher_id]
+            end_day = start_day + timedelta(days=self.rng.randint(7, 15))
+            next_start[teacher_id] = end_day + timedelta(days=self.rng.randint(1, 10))
+            if end_day < REFERENCE_DATE:
+                status = SessionStatus.COMPLETED
+            elif start_day <= REFERENCE_DATE:
+                status = SessionStatus.ONGOING
+            else:
+                status = SessionStatus.SCHEDULED
+            self.sessions.append(
+                {
+                    "id": sid,
+                    "formation_id": self.rng.randint(1, self.formation_count),
+                    "teacher_id": teacher_id,
+                    "start_date": datetime.combine(start_day, time(9, 0)),
+                    "end_date": datetime.combine(end_day, time(17, 0)),
+                    "capacity_max": self.rng.randint(40, 70),
+                    "status": status,
+                }
+            )
+
+    def sessions_rows(self) -> Iterator[Dict[str, Any]]:
+        if not self.sessions:
+            self._plan_sessions()
+        yield from self.sessions
+
+    def enrollments(self) -> Iterator[Dict[str, Any]]:
+        """Remplit chaque session à 85–100 % de capacity_max (apprenants distincts)."""
+        eid = 0
+        for session in self.sessions:
+            capacity = session["capacity_max"]
+            count = min(len(self.learner_ids), int(capacity * self.rng.uniform(0.85, 1.0)))
+            students = sorted(self.rng.sample(self.learner_ids, count))
+            self.students_by_session[session["id"]] = students
+            enrolled_at = session["start_date"] - timedelta(days=14)
+            for student_id in students:
+                eid += 1
+                yield {
+                    "id": eid,
+                    "session_id": session["id"],
+                    "student_id": student_id,
+                    "enrolled_at": enrolled_at,
+                    "attendance": None,
+                    "attendance_origin": None,
+                }
+
+    def signatures(self) -> Iterator[Dict[str, Any]]:
+        """Une signature par apprenant inscrit et par jour de session écoulé (présence ~90 %)."""
+        sig_id = 0
+        for session in self.sessions:
+            first_day = session["start_date"].date()
+            last_day = min(session["end_date"].date(), REFERENCE_DATE)
+            days = (last_day - first_day).days + 1
+            for student_id in self.students_by_session[session["id"]]:
+                for offset in range(days):
+                    if self.rng.random() >= ATTENDANCE_RATE:
+                        continue
+                    sig_id += 1
+                    yield {
+                        "id": sig_id,
+                        "session_id": session["id"],
+                        "user_id": student_id,
+                        "date": datetime.combine(first_day + timedelta(days=offset), time.min),
+                    }
+
+    def groups(self) -> Iterator[Dict[str, Any]]:
+        gid = 0
+        for session in self.sessions:
+            for index in range(GROUPS_PER_SESSION):
+                gid += 1
+                yield {"id": gid, "session_id": session["id"], "name": f"Groupe {index + 1}"}
+
+    def _group_slices(self, session_id: int) -> List[List[int]]:
+        students = self.students_by_session[session_id]
+        return [students[i::GROUPS_PER_SESSION] for i in range(GROUPS_PER_SESSION)]
+
+    def group_members(self) -> Iterator[Dict[str, Any]]:
+        member_id = 0
+        gid = 0
+        for session in self.sessions:
+            for members in self._group_slices(session["id"]):
+                gid += 1
+                for student_id in members:
+                    member_id += 1
+                    yield {"id": member_id, "group_id": gid, "student_id": student_id}
+
+    def briefs(self) -> Iterator[Dict[str, Any]]:
+        bid = 0
+        for session in self.sessions:
+            span = session["end_date"] - session["start_date"]
+            for order in range(BRIEFS_PER_SESSION):
+                bid += 1
+                created = session["start_date"]
+                yield {
+                    "id": bid,
+                    "title": f"Brief {order + 1} - session {session['id']}",
+                    "description": None,
+                    "delivery_deadline": created + span * (order + 1) / BRIEFS_PER_SESSION,
+                    "order": order,
+                    "session_id": session["id"],
+                    "reminded_at": None,
+                    "overdue_at": None,
+                    "created_at": created,
+                    "updated_at": created,
+                }
+
+    def brief_students(self) -> Iterator[Dict[str, Any]]:
+        """Chaque brief est assigné aux membres d'un groupe de sa session."""
+        link_id = 0
+        bid = 0
+        for session in self.sessions:
+            slices = self._group_slices(session["id"])
+            for order in range(BRIEFS_PER_SESSION):
+                bid += 1
+                for student_id in slices[order % len(slices)]:
+                    link_id += 1
+                    yield {"id": link_id, "brief_id": bid, "student_id": student_id}
+
+    def index(self) -> None:
+        """
+        Reconstruit en mémoire sessions et inscriptions sans rien insérer.
+
+        Consomme le générateur aléatoire dans le même ordre que `rows()` : les ids
+        obtenus correspondent à ceux d'une base chargée avec la même graine.
+        """
+        for _ in self.formations():
+            pass
+        self._plan_sessions()
+        for _ in self.enrollments():
+            pass
+
+    def rows(self) -> Iterator[tuple]:
+        """(table, lignes) dans l'ordre d'insertion ; les générateurs sont consommés dans l'ordre."""
+        yield User.__table__, self.users()
+        yield Formation.__table__, self.formations()
+        yield Session.__table__, self.sessions_rows()
+        yield Enrollment.__table__, self.enrollments()
+        yield Signature.__table__, self.signatures()
+        yield Group.__table__, self.groups()
+        yield GroupMember.__table__, self.group_members()
+        yield Brief.__table__, self.briefs()
+        yield BriefStudent.__table__, self.brief_students()
+
+
+def _chunks(rows: Iterable[Dict[str, Any]], size: int) -> Iterator[List[Dict[str, Any]]]:
+    chunk: List[Dict[str, Any]] = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def reset(engine: Engine) -> None:
+    """Vide toutes les tables du domaine et remet les séquences à zéro."""
+    names = ", ".join(table.name for table in reversed(TABLES))
+    with engine.begin() as conn:
+        conn.execute(text(f"TRUNCATE {names} RESTART IDENTITY CASCADE"))
+
+
+def _copy_text(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n").replace("\r", "\\r")
+
+
+def _copy_encoder(kind: type) -> Callable[[Any], str]:
+    """Encodeur au format texte de COPY pour un type Python (énumérations stockées par nom)."""
+    if issubclass(kind, Enum):
+        return lambda value: value.name
+    if kind is type(None):
+        return lambda value: "\\N"
+    if kind is bool:
+        return lambda value: "t" if value else "f"
+    if issubclass(kind, datetime):
+        return lambda value: value.isoformat(sep=" ")
+    if issubclass(kind, str):
+        return _copy_text
+    return str
+
+
+class _CopyStream:
+    """
+    Fichier en lecture seule alimenté par un générateur de lignes, pour `copy_expert`.
+
+    Les lignes sont encodées à la demande : une table de plusieurs millions de lignes
+    part en un seul COPY sans être matérialisée en mémoire. Les encodeurs sont résolus
+    une fois par type de valeur.
+    """
+
+    def __init__(self, rows: Iterable[Dict[str, Any]], columns: List[str]):
+        self._rows = iter(rows)
+        self._columns = columns
+        self._encoders: Dict[type, Callable[[Any], str]] = {}
+        self._buffer = b""
+        self.count = 0
+
+    def _encode(self, row: Dict[str, Any]) -> str:
+        fields = []
+        for column in self._columns:
+            value = row[column]
+            kind = type(value)
+            encoder = self._encoders.get(kind)
+            if encoder is None:
+                encoder = self._encoders[kind] = _copy_encoder(kind)
+            fields.append(encoder(value))
+        return "\t".join(fields)
+
+    def read(self, size: int = -1) -> bytes:
+        lines = []
+        pending = len(self._buffer)
+        for row in self._rows:
+            line = self._encode(row)
+            lines.append(line)
+            self.count += 1
+            pending += len(line) + 1
+            if 0 <= size <= pending:
+                break
+        if lines:
+            self._buffer += ("\n".join(lines) + "\n").encode("utf-8")
+        if size < 0:
+            size = len(self._buffer)
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+    readline = read
+
+
+def _copy_rows(conn: Any, table: Any, rows: Iterable[Dict[str, Any]]) -> int:
+    columns = [column.name for column in table.columns]
+    stream = _CopyStream(rows, columns)
+    quoted = ", ".join(f'"{name}"' for name in columns)
+    with conn.connection.cursor() as cursor:
+        cursor.copy_expert(f"COPY {table.name} ({quoted}) FROM STDIN", stream, size=1 << 16)
+    return stream.count
+
+
+def _insert_rows(conn: Any, table: Any, rows: Iterable[Dict[str, Any]]) -> int:
+    total = 0
+    for chunk in _chunks(rows, INSERT_CHUNK):
+        conn.execute(table.insert(), chunk)
+        total += len(chunk)
+    return total
+
+
+def _drop_foreign_keys(conn: Any) -> List[tuple]:
+    """
+    Supprime les clés étrangères des tables du domaine et retourne leurs définitions.
+
+    Recréées après chargement, elles sont validées en un seul passage au lieu d'un
+    contrôle ligne à ligne pendant le COPY (le coût dominant sur `signatures`).
+    """
+    names = [table.name for table in TABLES]
+    foreign_keys = conn.execute(
+        text(
+            "SELECT conrelid::regclass::text, conname, pg_get_constraintdef(oid) "
+            "FROM pg_constraint WHERE contype = 'f' AND conrelid::regclass::text = ANY(:names)"
+        ),
+        {"names": names},
+    ).all()
+    for table, name, _ in foreign_keys:
+        conn.execute(text(f'ALTER TABLE {table} DROP CONSTRAINT "{name}"'))
+    return foreign_keys
+
+
+def _restore_foreign_keys(conn: Any, foreign_keys: List[tuple]) -> None:
+    for table, name, definition in foreign_keys:
+        conn.execute(text(f'ALTER TABLE {table} ADD CONSTRAINT "{name}" {definition}'))
+
+
+def seed(engine: Engine, scale: float = 1.0, seed: int = 42, method: str = "copy") -> Dict[str, int]:
+    """
+    Vide la base puis charge le jeu de données. Retourne le nombre de lignes par table.
+
+    method="copy" (défaut) passe par COPY FROM STDIN, "insert" par INSERT multi-lignes
+    (INSERT_CHUNK lignes par instruction). Tout est chargé dans une seule transaction,
+    clés étrangères suspendues le temps du chargement.
+    """
+    if method not in LOAD_METHODS:
+        raise ValueError(f"Unknown load method: {method}")
+    load = _copy_rows if method == "copy" else _insert_rows
+    reset(engine)
+    dataset = Dataset(scale=scale, seed=seed)
+    counts: Dict[str, int] = {}
+    with engine.begin() as conn:
+        conn.execute(text("SET LOCAL synchronous_commit = off"))
+        foreign_keys = _drop_foreign_keys(conn)
+        # Signatures datées de FIRST_SESSION_DATE à REFERENCE_DATE : partitions mensuelles requises par le COPY.
+        ensure_partitions(conn, FIRST_SESSION_DATE, REFERENCE_DATE)
+        for table, rows in dataset.rows():
+            counts[table.name] = load(conn, table, rows)
+            conn.execute(
+                text(
+                    f"SELECT setval(pg_get_serial_sequence('{table.name}', 'id'), "
+                    f"GREATEST((SELECT MAX(id) FROM {table.name}), 1))"
+                )
+            )
+        _restore_foreign_keys(conn, foreign_keys)
+        # Même présence en stockage bitmap (ATTENDANCE_STORAGE=bitmap) qu'en table signatures,
+        # dans la disposition (ATTENDANCE_SLOTS_PER_DAY) que relira AttendanceBitmapRepository.
+        backfill_from_signatures(conn, get_settings().attendance_slots_per_day)
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.execute(text(f"ANALYZE {', '.join(table.name for table in TABLES)}"))
+    return counts
+
+
+# Chaque requête compte les lignes qui violent une règle métier : toutes doivent renvoyer 0.
+DOMAIN_CHECKS = {
+    "sessions animées par un non-formateur": """
+        SELECT COUNT(*) FROM sessions s JOIN users u ON u.id = s.teacher_id
+        WHERE u.role <> 'TRAINER'
+    """,
+    "sessions d'un formateur qui se chevauchent": """
+        SELECT COUNT(*) FROM sessions a JOIN sessions b
+          ON a.teacher_id = b.teacher_id AND a.id < b.id
+         AND a.start_date < b.end_date AND b.start_date < a.end_date
+    """,
+    "sessions au-delà de capacity_max": """
+        SELECT COUNT(*) FROM (
+            SELECT s.id FROM sessions s JOIN enrollments e ON e.session_id = s.id
+            GROUP BY s.id, s.capacity_max HAVING COUNT(*) > s.capacity_max
+        ) over_capacity
+    """,
+    "inscriptions d'un non-apprenant": """
+        SELECT COUNT(*) FROM enrollments e JOIN users u ON u.id = e.student_id
+        WHERE u.role <> 'LEARNER'
+    """,
+    "signatures hors des dates de session": """
+        SELECT COUNT(*) FROM signatures g JOIN sessions s ON s.id = g.session_id
+        WHERE g.date::date < s.start_date::date OR g.date::date > s.end_date::date
+    """,
+    "signatures sans inscription": """
+        SELECT COUNT(*) FROM signatures g
+        LEFT JOIN enrollments e ON e.session_id = g.session_id AND e.student_id = g.user_id
+        WHERE e.id IS NULL
+    """,
+    "membres de groupe non inscrits à la session": """
+        SELECT COUNT(*) FROM group_members m JOIN groups gr ON gr.id = m.group_id
+        LEFT JOIN enrollments e ON e.session_id = gr.session_id AND e.student_id = m.student_id
+        WHERE e.id IS NULL
+    """,
+    "briefs assignés hors d'un groupe de la session": """
+        SELECT COUNT(*) FROM brief_students bs JOIN briefs b ON b.id = bs.brief_id
+        WHERE NOT EXISTS (
+            SELECT 1 FROM group_members m JOIN groups gr ON gr.id = m.group_id
+            WHERE gr.session_id = b.session_id AND m.student_id = bs.student_id
+        )
+    """,
+}
+
+
+def check(engine: Engine) -> Dict[str, int]:
+    """Vérifie les règles métier sur la base chargée ; retourne les violations par règle."""
+    with engine.connect() as conn:
+        return {name: conn.execute(text(query)).scalar_one() for name, query in DOMAIN_CHECKS.items()}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", type=float, default=1.0, help="Facteur d'échelle (1.0 = 10k users, ~1M signatures).")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--method", choices=LOAD_METHODS, default="copy")
+    parser.add_argument("--check", action="store_true", help="Vérifier les règles métier après chargement.")
+    args = parser.parse_args(argv)
+
+    from benchmarks.common import use_bench_database
+
+    use_bench_database()
+    from app.db.session import get_engine
+
+    engine = get_engine()
+    started = timer.perf_counter()
+    counts = seed(engine, scale=args.scale, seed=args.seed, method=args.method)
+    elapsed = timer.perf_counter() - started
+    total = sum(counts.values())
+    for name, count in counts.items():
+        print(f"{name:<16} {count:>12,}")
+    print(f"{'total':<16} {total:>12,}  en {elapsed:.1f}s ({total / max(elapsed, 1e-9):,.0f} lignes/s)")
+
+    if args.check:
+        violations = {name: count for name, count in check(engine).items() if count}
+        for name, count in violations.items():
+            print(f"VIOLATION {name}: {count}", file=sys.stderr)
+        if violations:
+            return 1
+        print("Règles métier : OK")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
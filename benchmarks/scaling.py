@@ -0,0 +1,171 @@
+"""
+Benchmark de montée en charge : débit de `serve.py` selon le nombre de workers.
+
+Pour chaque nombre de workers (--workers, défaut 1 2 4 8), lance le vrai serveur
+(`serve.py`, même découpage du budget de connexions qu'en production) sur la base
+de benchmark, puis --concurrency clients HTTP keep-alive enchaînent pendant
+--duration secondes un mélange de lectures. Mesures : requêtes/s, p50/p95 (ms),
+erreurs. Le débit dépend de la machine : pas de baseline, comparer les lignes
+d'un même run.
+
+    BENCH_DATABASE_URL=... python -m benchmarks.scaling [--workers 1 2 4 8] [--reuse-data]
+"""
+import argparse
+import http.client
+import os
+import random
+import signal
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from benchmarks.common import percentile, use_bench_database, write_report
+
+ROOT = Path(__file__).resolve().parent.parent
+HOST = "127.0.0.1"
+API = "/api/v1"
+
+
+def _paths(scale: float, seed: int, count: int = 1000) -> List[str]:
+    """Mélange de lectures représentatif (listes et détails) sur des ids du jeu de données."""
+    from benchmarks.dataset import Dataset
+
+    data = Dataset(scale=scale, seed=seed)
+    rng = random.Random(seed)
+    choices = [
+        lambda: f"{API}/formations?limit=20",
+        lambda: f"{API}/formations/{rng.randint(1, data.formation_count)}",
+        lambda: f"{API}/users/{rng.randint(1, data.user_count)}",
+        lambda: f"{API}/sessions/{rng.randint(1, data.session_count)}",
+    ]
+    return [rng.choice(choices)() for _ in range(count)]
+
+
+def _wait_until_ready(port: int, process: subprocess.Popen, timeout: float = 60.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"serve.py exited with code {process.returncode}")
+        try:
+            connection = http.client.HTTPConnection(HOST, port, timeout=1)
+            connection.request("GET", f"{API}/formations?limit=1")
+            if connection.getresponse().status == 200:
+                return
+        except OSError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError("serve.py did not become ready in time")
+
+
+def _load(port: int, paths: List[str], concurrency: int, duration: float) -> Dict[str, Any]:
+    """`concurrency` clients keep-alive pendant `duration` secondes ; retourne les mesures brutes."""
+    latencies: List[List[float]] = [[] for _ in range(concurrency)]
+    errors = [0] * concurrency
+    stop = threading.Event()
+
+    def client(index: int) -> None:
+        rng = random.Random(index)
+        connection = http.client.HTTPConnection(HOST, port, timeout=30)
+        while not stop.is_set():
+            path = rng.choice(paths)
+            started = time.perf_counter()
+            try:
+                connection.request("GET", path)
+                response = connection.getresponse()
+                response.read()
+                ok = response.status < 500
+            except (OSError, http.client.HTTPException):
+                ok = False
+                connection.close()
+                connection = http.client.HTTPConnection(HOST, port, timeout=30)
+            if ok:
+                latencies[index].append((time.perf_counter() - started) * 1000)
+            else:
+                errors[index] += 1
+        connection.close()
+
+    threads = [threading.Thread(target=client, args=(i,), daemon=True) for i in range(concurrency)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    time.sleep(duration)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    values = sorted(value for series in latencies for value in series)
+    return {
+        "requests": len(values),
+        "errors": sum(errors),
+        "rps": round(len(values) / elapsed, 1),
+        "p50_ms": round(percentile(values, 50), 3),
+        "p95_ms": round(percentile(values, 95), 3),
+    }
+
+
+def measure(workers: int, port: int, paths: List[str], concurrency: int, duration: float) -> Dict[str, Any]:
+    """Démarre `serve.py --workers N`, le charge, puis l'arrête proprement (SIGTERM)."""
+    env = dict(os.environ, WARMUP_ON_STARTUP="1")
+    process = subprocess.Popen(
+        [sys.executable, "serve.py", "--workers", str(workers), "--port", str(port), "--no-access-log", "--log-level", "warning"],
+        cwd=ROOT,
+        env=env,
+    )
+    try:
+        _wait_until_ready(port, process)
+        _load(port, paths, concurrency, min(1.0, duration))
+        return _load(port, paths, concurrency, duration)
+    finally:
+        process.send_signal(signal.SIGTERM)
+        try:
+            process.wait(timeout=60)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--concurrency", type=int, default=32, help="Clients HTTP simultanés.")
+    parser.add_argument("--duration", type=float, default=10.0, help="Durée de mesure par palier (s).")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--scale", type=float, default=1.0)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--reuse-data", action="store_true", help="Ne pas recharger le jeu de données.")
+    parser.add_argument("--output", type=Path, help="Écrire aussi les résultats dans ce fichier JSON.")
+    args = parser.parse_args(argv)
+
+    use_bench_database()
+    if not args.reuse_data:
+        from app.db.session import get_engine
+        from benchmarks.dataset import seed
+
+        counts = seed(get_engine(), scale=args.scale, seed=args.seed)
+        print(f"Seed: {counts}")
+
+    paths = _paths(args.scale, args.seed)
+    results: Dict[str, Dict[str, Any]] = {}
+    for workers in args.workers:
+        stats = results[str(workers)] = measure(workers, args.port, paths, args.concurrency, args.duration)
+        print(
+            f"workers={workers:<3} {stats['rps']:>9.1f} req/s  p50={stats['p50_ms']:>8.1f}ms "
+            f"p95={stats['p95_ms']:>8.1f}ms  errors={stats['errors']}"
+        )
+
+    if args.output:
+        write_report(
+            args.output,
+            {
+                "meta": {"scale": args.scale, "seed": args.seed, "concurrency": args.concurrency, "duration": args.duration},
+                "workers": results,
+            },
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
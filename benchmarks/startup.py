@@ -0,0 +1,151 @@
+"""
+Benchmark de démarrage : coût d'un worker jusqu'à sa première réponse.
+
+Chaque run lance un interpréteur neuf qui importe `main`, exécute le lifespan
+(préchauffage compris, sauf --no-warmup) puis sert une première requête. Mesures
+(ms, p50/p95 sur --runs) :
+
+- import_ms : `import main` ;
+- startup_ms : lifespan (moteur, instrumentation, préchauffage) ;
+- first_request_ms : première requête servie ;
+- time_to_first_request_ms : somme des trois.
+
+    BENCH_DATABASE_URL=... python -m benchmarks.startup [--importtime] [--update-baseline]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from benchmarks.common import (
+    DEFAULT_TOLERANCE,
+    compare_to_baseline,
+    load_baseline,
+    percentile,
+    use_bench_database,
+    write_report,
+)
+
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_BASELINE = Path(__file__).parent / "startup_baseline.json"
+FIRST_REQUEST = "/api/v1/formations?limit=1"
+PHASES = ("import_ms", "startup_ms", "first_request_ms", "time_to_first_request_ms")
+
+# Exécuté dans un interpréteur neuf : le client de test est importé hors chrono.
+_CHILD = """
+import json, time
+started = time.perf_counter()
+import main
+imported = time.perf_counter()
+from fastapi.testclient import TestClient
+ready = time.perf_counter()
+with TestClient(main.app) as client:
+    started_up = time.perf_counter()
+    response = client.get({path!r})
+    answered = time.perf_counter()
+assert response.status_code == 200, response.text
+print(json.dumps({{
+    "import_ms": (imported - started) * 1000,
+    "startup_ms": (started_up - ready) * 1000,
+    "first_request_ms": (answered - started_up) * 1000,
+    "time_to_first_request_ms": (imported - started + answered - ready) * 1000,
+}}))
+"""
+
+
+def _run_once(env: Dict[str, str]) -> Dict[str, float]:
+    result = subprocess.run(
+        [sys.executable, "-c", _CHILD.format(path=FIRST_REQUEST)],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"startup run failed:\n{result.stderr}")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def measure(runs: int, warmup: bool) -> Dict[str, Dict[str, float]]:
+    """Lance `runs` démarrages ; retourne p50/p95 par phase."""
+    env = dict(os.environ, WARMUP_ON_STARTUP="1" if warmup else "0")
+    samples: Dict[str, List[float]] = {phase: [] for phase in PHASES}
+    for _ in range(runs):
+        for phase, value in _run_once(env).items():
+            samples[phase].append(value)
+    results = {}
+    for phase, values in samples.items():
+        values.sort()
+        results[phase] = {
+            "runs": len(values),
+            "p50_ms": round(percentile(values, 50), 3),
+            "p95_ms": round(percentile(values, 95), 3),
+        }
+    return results
+
+
+def import_profile(limit: int = 15) -> List[str]:
+    """Modules les plus coûteux à l'import de `main` (cumulé, `python -X importtime`)."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, module = (part.strip() for part in line.split(":", 1)[1].split("|"))
+        if cumulative.isdigit():
+            rows.append((int(cumulative), module))
+    return [f"{us / 1000:8.1f} ms  {module}" for us, module in sorted(rows, reverse=True)[:limit]]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--no-warmup", action="store_true", help="Démarrer sans préchauffage (WARMUP_ON_STARTUP=0).")
+    parser.add_argument("--importtime", action="store_true", help="Afficher les imports les plus coûteux.")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    parser.add_argument("--output", type=Path, help="Écrire aussi les résultats dans ce fichier JSON.")
+    args = parser.parse_args(argv)
+
+    use_bench_database()
+    if args.importtime:
+        print("\n".join(import_profile()))
+
+    warmup = not args.no_warmup
+    results = measure(args.runs, warmup)
+    for phase, stats in results.items():
+        print(f"{phase:<26} p50={stats['p50_ms']:>9.1f}ms p95={stats['p95_ms']:>9.1f}ms")
+
+    report = {"meta": {"runs": args.runs, "warmup": warmup}, "phases": results}
+    if args.output:
+        write_report(args.output, report)
+    if args.update_baseline:
+        write_report(args.baseline, report)
+        print(f"Baseline écrite : {args.baseline}")
+        return 0
+    baseline = load_baseline(args.baseline)
+    if baseline is None:
+        print(f"Pas de baseline ({args.baseline}) : relancer avec --update-baseline.")
+        return 0
+    if baseline.get("meta", {}).get("warmup") != warmup:
+        print("Attention : baseline mesurée avec un autre réglage de préchauffage.", file=sys.stderr)
+    regressions = compare_to_baseline(
+        results, baseline["phases"], tolerance=args.tolerance, metrics=("p50_ms", "p95_ms")
+    )
+    for line in regressions:
+        print(f"REGRESSION {line}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
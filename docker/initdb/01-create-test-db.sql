@@ -1,3 +1,6 @@
 -- Création de la base de test au premier démarrage du conteneur
 CREATE DATABASE gestsimplon_test;
 
+
+-- Base dédiée aux benchmarks (vidée et rechargée à chaque run)
+CREATE DATABASE gestsimplon_bench;
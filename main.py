@@ -3,43 +3,114 @@ Point d'entrée de l'API GestSimplon.
 
 Expose l'application FastAPI et les routes racines.
 Documentation interactive : /docs (Swagger), /redoc.
+
+L'import ne lit pas la configuration et n'ouvre aucune connexion : le moteur et
+les paramètres sont créés dans le lifespan, suivi du préchauffage optionnel.
 """
+import math
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+
 from fastapi import FastAPI, Request
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
 
 from app.api.v1.router import api_router
+from app.core import metrics
+from app.core.profiling import ProfilingMiddleware
+from app.core.attendance_hub import AttendanceHub
+from app.core.config import get_settings
+from app.core.events import OutboxDispatcher
+from app.core.idempotency import IdempotencyMiddleware, purge_expired as purge_idempotency_keys
+from app.core.scheduler import BriefDeadlineScheduler
 from app.core.errors import (
     AppError,
+    AttendanceSlotInvalid,
     BriefNotFound,
     EmailAlreadyUsed,
     EnrollmentAlreadyExists,
     EnrollmentSessionFull,
+    FormationHasSessions,
     FormationNotFound,
     FormationTitleAlreadyUsed,
     GroupNotFound,
+    GroupSplitInvalid,
     InvalidCredentials,
-    SessionEndDateAlreadyExists,
+    LoginRateLimited,
+    ProfileNotFound,
+    SessionCalendarRangeInvalid,
     SessionNotFound,
     SessionStartDateAfterEndDate,
-    SessionStartDateAlreadyExists,
+    SessionTeacherScheduleConflict,
     SignatureAlreadyExistsForDate,
     SignatureDateOutsideSession,
     SignatureNotFound,
     TeacherNotFound,
+    UserHasSessions,
     UserNotFound,
     UserNotEnrolledInSession,
     UserNotTrainer,
     EnrollmentNotFound,
 )
+from app.core.warmup import warm_up
+from app.db import outbox, query_stats
+from app.db.partitions import ensure_upcoming_partitions
+from app.db.routing import ReadYourWritesMiddleware
+from app.db.session import dispose_engine, get_engine, get_replica_engines
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Démarrage : configuration, moteur, instrumentation, partitions à venir, purge de
+    l'outbox et des clés d'idempotence expirées, préchauffage, planificateur d'échéances, dispatcher de l'outbox et hub
+    d'émargement en direct ;
+    arrêt : dispatcher, planificateur puis fermeture du pool.
+    """
+    settings = get_settings()
+    engine = get_engine()
+    replicas = get_replica_engines()
+    metrics.track_pool(lambda: engine.pool)
+    query_stats.install(settings.slow_query_threshold_ms)
+    ensure_upcoming_partitions(engine, settings.signature_partitions_ahead)
+    with engine.begin() as conn:
+        outbox.purge(conn, datetime.utcnow() - timedelta(hours=settings.outbox_retention_hours))
+    purge_idempotency_keys()
+    if settings.warmup_on_startup:
+        warm_up(app, engine, replicas)
+    scheduler = None
+    if settings.brief_scheduler_interval_seconds > 0:
+        scheduler = BriefDeadlineScheduler(engine, settings)
+        scheduler.start()
+    app.state.outbox = OutboxDispatcher(engine, settings.outbox_poll_seconds)
+    app.state.attendance_hub = AttendanceHub(app.state.outbox)
+    if settings.outbox_poll_seconds > 0:
+        app.state.outbox.start()
+    yield
+    app.state.outbox.stop()
+    if scheduler is not None:
+        scheduler.stop()
+    dispose_engine()
+
 
 app = FastAPI(
     title="GestSimplon API",
     description="API REST pour la gestion de formations, sessions et inscriptions (apprenants / formateurs).",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 app.include_router(api_router, prefix="/api/v1")
+app.add_middleware(IdempotencyMiddleware)
+app.add_middleware(ReadYourWritesMiddleware, enabled=lambda: bool(get_replica_engines()))
+app.add_middleware(ProfilingMiddleware)
+app.add_middleware(metrics.MetricsMiddleware)
+
+
+@app.get("/metrics", include_in_schema=False)
+def read_metrics() -> PlainTextResponse:
+    """Métriques au format texte Prometheus (requêtes, latences, SQL, pool, bcrypt)."""
+    return PlainTextResponse(metrics.render(), media_type=metrics.CONTENT_TYPE)
 
 
 def _format_validation_error_loc(loc: tuple) -> str:
@@ -119,25 +190,41 @@ def app_error_handler(request: Request, exc: AppError) -> JSONResponse:
             BriefNotFound,
             GroupNotFound,
             SignatureNotFound,
+            ProfileNotFound,
         ),
     ):
         status_code = 404
     elif isinstance(
         exc,
-        (EmailAlreadyUsed, FormationTitleAlreadyUsed, EnrollmentAlreadyExists, SignatureAlreadyExistsForDate),
+        (
+            EmailAlreadyUsed,
+            FormationTitleAlreadyUsed,
+            FormationHasSessions,
+            UserHasSessions,
+            EnrollmentAlreadyExists,
+            SignatureAlreadyExistsForDate,
+            SessionTeacherScheduleConflict,
+        ),
     ):
         status_code = 409
     elif isinstance(exc, InvalidCredentials):
         status_code = 401
+    elif isinstance(exc, LoginRateLimited):
+        return JSONResponse(
+            status_code=429,
+            content={"code": exc.code, "message": exc.message},
+            headers={"Retry-After": str(math.ceil(exc.retry_after))},
+        )
     elif isinstance(
         exc,
         (
             SessionStartDateAfterEndDate,
-            SessionStartDateAlreadyExists,
-            SessionEndDateAlreadyExists,
+            SessionCalendarRangeInvalid,
+            GroupSplitInvalid,
             UserNotTrainer,
             EnrollmentSessionFull,
             SignatureDateOutsideSession,
+            AttendanceSlotInvalid,
             UserNotEnrolledInSession,
         ),
     ):
@@ -0,0 +1,125 @@
+"""
+Point d'entrée de production : N workers uvicorn derrière un même socket.
+
+- Workers : --workers, sinon WEB_CONCURRENCY, sinon nombre de cœurs.
+- Pool SQLAlchemy par worker dérivé de DB_CONNECTION_BUDGET, de sorte que
+  workers × (pool_size + max_overflow + 1) ne dépasse jamais le budget Postgres,
+  la connexion en plus étant l'écoute LISTEN de l'outbox, hors pool
+  (DB_POOL_SIZE / DB_MAX_OVERFLOW explicites : vérifiés contre le budget).
+- Recyclage : un worker redémarre après MAX_REQUESTS ± MAX_REQUESTS_JITTER requêtes
+  (le jitter évite que tous les workers redémarrent en même temps).
+- Arrêt (SIGTERM / SIGINT) : plus de nouvelles connexions, les requêtes en cours ont
+  GRACEFUL_TIMEOUT_SECONDS pour se terminer, puis le lifespan ferme les pools.
+
+    python serve.py [--workers 4] [--host 0.0.0.0] [--port 8000]
+"""
+import argparse
+import logging
+import os
+import sys
+from typing import List, Optional, Tuple
+
+from uvicorn import Config
+from uvicorn.supervisors import Multiprocess
+
+from app.core.config import get_settings
+
+logger = logging.getLogger("serve")
+
+# Part du pool d'un worker réservée au débordement (connexions ouvertes à la demande).
+OVERFLOW_SHARE = 0.25
+# Connexions hors pool ouvertes par chaque worker : l'écoute LISTEN du dispatcher de l'outbox.
+DEDICATED_CONNECTIONS_PER_WORKER = 1
+
+
+def pool_sizing(workers: int, budget: int) -> Tuple[int, int]:
+    """
+    (pool_size, max_overflow) par worker tels que
+    workers × (pool + overflow + DEDICATED_CONNECTIONS_PER_WORKER) ≤ budget.
+    """
+    per_worker = budget // workers - DEDICATED_CONNECTIONS_PER_WORKER
+    if per_worker < 1:
+        raise ValueError(f"connection budget {budget} is too small for {workers} workers")
+    max_overflow = int(per_worker * OVERFLOW_SHARE)
+    return per_worker - max_overflow, max_overflow
+
+
+def default_workers() -> int:
+    """WEB_CONCURRENCY, sinon le nombre de cœurs disponibles pour le process."""
+    configured = get_settings().web_concurrency
+    if configured:
+        return configured
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def configure_pools(workers: int) -> Tuple[int, int]:
+    """
+    Fixe DB_POOL_SIZE / DB_MAX_OVERFLOW dans l'environnement hérité par les workers.
+
+    Des valeurs déjà fournies sont conservées mais doivent tenir dans le budget.
+    """
+    settings = get_settings()
+    budget = settings.db_connection_budget
+    if settings.db_pool_size is not None or settings.db_max_overflow is not None:
+        pool_size = settings.db_pool_size if settings.db_pool_size is not None else 5
+        max_overflow = settings.db_max_overflow if settings.db_max_overflow is not None else 0
+        if workers * (pool_size + max_overflow + DEDICATED_CONNECTIONS_PER_WORKER) > budget:
+            raise ValueError(
+                f"{workers} workers × (DB_POOL_SIZE={pool_size} + DB_MAX_OVERFLOW={max_overflow} "
+                f"+ {DEDICATED_CONNECTIONS_PER_WORKER} LISTEN) exceeds DB_CONNECTION_BUDGET={budget}"
+            )
+    else:
+        pool_size, max_overflow = pool_sizing(workers, budget)
+    os.environ["DB_POOL_SIZE"] = str(pool_size)
+    os.environ["DB_MAX_OVERFLOW"] = str(max_overflow)
+    return pool_size, max_overflow
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, help="Défaut : WEB_CONCURRENCY, sinon nombre de cœurs.")
+    parser.add_argument("--log-level", default="info")
+    parser.add_argument("--no-access-log", action="store_true")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=args.log_level.upper(), format="%(levelname)s: %(message)s")
+
+    settings = get_settings()
+    workers = args.workers or default_workers()
+    try:
+        pool_size, max_overflow = configure_pools(workers)
+    except ValueError as exc:
+        print(f"serve: {exc}", file=sys.stderr)
+        return 2
+    logger.info(
+        "Starting %d workers, pool %d + %d overflow + %d LISTEN each (%d / %d connections)",
+        workers,
+        pool_size,
+        max_overflow,
+        DEDICATED_CONNECTIONS_PER_WORKER,
+        workers * (pool_size + max_overflow + DEDICATED_CONNECTIONS_PER_WORKER),
+        settings.db_connection_budget,
+    )
+
+    config = Config(
+        "main:app",
+        host=args.host,
+        port=args.port,
+        workers=workers,
+        limit_max_requests=settings.max_requests or None,
+        limit_max_requests_jitter=settings.max_requests_jitter,
+        timeout_graceful_shutdown=settings.graceful_timeout_seconds,
+        log_level=args.log_level,
+        access_log=not args.no_access_log,
+    )
+    # Toujours sous superviseur, même avec un seul worker : un worker recyclé
+    # (MAX_REQUESTS atteint) ou mort est relancé au lieu d'arrêter le service.
+    Multiprocess(config, sockets=[config.bind_socket()]).run()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
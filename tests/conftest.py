@@ -2,18 +2,24 @@
 Configuration des tests (pytest).
 
 Active la base de test via USE_TEST_DB=1 avant l'import de l'app, et fournit
-la fixture `client` (TestClient FastAPI) pour les tests d'API.
+la fixture `client` (TestClient FastAPI, lifespan exécuté) pour les tests d'API.
 """
 import os
+from typing import Iterator
 
 import pytest
 from fastapi.testclient import TestClient
 
 os.environ["USE_TEST_DB"] = "1"
+# Le lifespan tourne à chaque test : pas de préchauffage (couvert par test_api_startup.py).
+os.environ.setdefault("WARMUP_ON_STARTUP", "0")
+# Planificateur d'échéances piloté explicitement par test_api_briefs.py.
+os.environ.setdefault("BRIEF_SCHEDULER_INTERVAL_SECONDS", "0")
 from main import app
 
 
 @pytest.fixture
-def client() -> TestClient:
+def client() -> Iterator[TestClient]:
     """Client HTTP de test pour l'API FastAPI (injection dans les tests)."""
-    return TestClient(app)
\ No newline at end of file
+    with TestClient(app) as test_client:
+        yield test_client
\ No newline at end of file
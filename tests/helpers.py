@@ -0,0 +1,29 @@
+"""
+Utilitaires partagés des tests d'API : création de ressources via l'API v1.
+"""
+import uuid
+
+from fastapi.testclient import TestClient
+
+
+def create(client: TestClient, path: str, payload: dict) -> dict:
+    """POST `payload` sur `path`, vérifie le 201 et retourne la ressource créée."""
+    response = client.post(path, json=payload)
+    assert response.status_code == 201, response.text
+    return response.json()
+
+
+def user_payload(role: str = "learner") -> dict:
+    """Corps de création d'un utilisateur `role` à l'email unique."""
+    return {
+        "email": f"{role}_{uuid.uuid4()}@test.com",
+        "first_name": "Test",
+        "last_name": "User",
+        "password": "password123",
+        "role": role,
+    }
+
+
+def make_user(client: TestClient, role: str) -> int:
+    """Crée un utilisateur `role` et retourne son id."""
+    return create(client, "/api/v1/users", user_payload(role))["id"]
@@ -0,0 +1,69 @@
+"""
+Tests d'intégration pour la limitation des connexions (API v1).
+
+Vérifient le refus en 429 avec Retry-After une fois la limite par email ou par
+IP atteinte, sans requête SQL ni bcrypt, et le compteur de métriques associé.
+"""
+import uuid
+from typing import Iterator, List
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.config import get_settings
+from app.core.rate_limit import LOGIN_RATE_LIMITED, login_limiter
+from app.db.instrumentation import add_statement_observer, remove_statement_observer
+
+
+@pytest.fixture(autouse=True)
+def fresh_limiter() -> Iterator[None]:
+    """Seaux vides avant et après chaque test (le limiteur est global au worker)."""
+    login_limiter.reset()
+    yield
+    login_limiter.reset()
+
+
+def _login(client: TestClient, email: str):
+    return client.post("/api/v1/auth/login", json={"email": email, "password": "wrong-password"})
+
+
+def test_login_limited_per_email_before_db_lookup(client: TestClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Au-delà de la limite par email : 429 + Retry-After, aucune instruction SQL ; un autre email reste accepté."""
+    settings = get_settings()
+    monkeypatch.setattr(settings, "login_rate_limit_per_ip", 0)
+    monkeypatch.setattr(settings, "login_rate_limit_per_email", 3)
+    email = f"limited_{uuid.uuid4()}@test.com"
+    rejected_before = LOGIN_RATE_LIMITED.value("email")
+
+    attempts = [_login(client, email).status_code for _ in range(3)]
+    statements: List[str] = []
+
+    def observer(statement, parameters, duration, rowcount, context) -> None:
+        statements.append(statement)
+
+    add_statement_observer(observer)
+    try:
+        limited = _login(client, f"  {email.upper()} ")
+    finally:
+        remove_statement_observer(observer)
+
+    assert attempts == [401, 401, 401]
+    assert limited.status_code == 429
+    assert limited.json()["code"] == "LOGIN_RATE_LIMITED"
+    assert 1 <= int(limited.headers["Retry-After"]) <= 20
+    assert statements == []
+    assert LOGIN_RATE_LIMITED.value("email") == rejected_before + 1
+    assert _login(client, f"other_{uuid.uuid4()}@test.com").status_code == 401
+
+
+def test_login_limited_per_client_ip(client: TestClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    """La limite par IP s'applique quel que soit l'email visé."""
+    settings = get_settings()
+    monkeypatch.setattr(settings, "login_rate_limit_per_ip", 2)
+    monkeypatch.setattr(settings, "login_rate_limit_per_email", 0)
+    rejected_before = LOGIN_RATE_LIMITED.value("ip")
+
+    statuses = [_login(client, f"ip_{uuid.uuid4()}@test.com").status_code for _ in range(3)]
+
+    assert statuses == [401, 401, 429]
+    assert LOGIN_RATE_LIMITED.value("ip") == rejected_before + 1
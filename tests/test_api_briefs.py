@@ -0,0 +1,119 @@
+"""
+Tests d'intégration pour les routes briefs (API v1).
+
+Vérifient la réassignation d'un brief par différence : seuls les étudiants
+ajoutés / retirés sont écrits et rapportés dans la réponse ; puis le planificateur
+d'échéances (rappel, retard, une seule exécution par tâche entre workers).
+"""
+import uuid
+from datetime import datetime, timedelta
+
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from app.db.session import get_engine
+from app.repositories.job_repo import JobRepository
+from app.services.brief_deadline_service import BriefDeadlineService
+
+from helpers import create, make_user
+
+
+def _make_session(client: TestClient, start: datetime) -> dict:
+    formation = create(
+        client, "/api/v1/formations", {"title": f"Briefs {uuid.uuid4().hex[:8]}", "duration_hours": 7, "level": "0"}
+    )
+    return create(
+        client,
+        "/api/v1/sessions",
+        {
+            "formation_id": formation["id"],
+            "teacher_id": make_user(client, "trainer"),
+            "start_date": start.isoformat(),
+            "end_date": (start + timedelta(hours=8)).isoformat(),
+            "capacity_max": 10,
+            "status": "scheduled",
+        },
+    )
+
+
+def test_update_brief_students_reports_diff(client: TestClient) -> None:
+    """PATCH student_ids : ajouts et retraits rapportés, doublons ignorés, autres champs conservés."""
+    start = datetime(2032, 1, 5, 9) + timedelta(days=uuid.uuid4().int % 3000)
+    session = _make_session(client, start)
+    students = [make_user(client, "learner") for _ in range(4)]
+    brief = create(
+        client,
+        "/api/v1/briefs",
+        {
+            "title": "Diff",
+            "delivery_deadline": (start + timedelta(days=7)).isoformat(),
+            "session_id": session["id"],
+            "student_ids": students[:3],
+        },
+    )
+
+    response = client.patch(
+        f"/api/v1/briefs/{brief['id']}", json={"student_ids": [students[3], students[1], students[3]]}
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["added_student_ids"] == [students[3]]
+    assert data["removed_student_ids"] == sorted([students[0], students[2]])
+    assert sorted(data["student_ids"]) == sorted([students[1], students[3]])
+    assert data["title"] == "Diff"
+
+
+def _run_scheduler(now: datetime) -> dict:
+    with Session(get_engine()) as db:
+        service = BriefDeadlineService(JobRepository(db), timedelta(hours=24), timedelta(hours=168), 1000)
+        return service.run_once(now)
+
+
+def _deadline_brief(client: TestClient) -> tuple:
+    """(brief, échéance) dans une année lointaine propre au test."""
+    deadline = datetime(2600 + uuid.uuid4().int % 300, 5, 12, 17)
+    session = _make_session(client, deadline - timedelta(days=10))
+    brief = create(
+        client,
+        "/api/v1/briefs",
+        {"title": "Deadline", "delivery_deadline": deadline.isoformat(), "session_id": session["id"], "student_ids": []},
+    )
+    return brief, deadline
+
+
+def test_brief_deadline_scheduler_reminds_then_flags_overdue_once(client: TestClient) -> None:
+    """Rappel dans la fenêtre `lead`, retard après l'échéance, chaque tâche exécutée une seule fois."""
+    brief, deadline = _deadline_brief(client)
+
+    assert _run_scheduler(deadline - timedelta(hours=30))["enqueued"] == 0
+    reminded = _run_scheduler(deadline - timedelta(hours=2))
+    again = _run_scheduler(deadline - timedelta(hours=1))
+    after_reminder = client.get(f"/api/v1/briefs/{brief['id']}").json()
+    overdue = _run_scheduler(deadline + timedelta(hours=1))
+    after_deadline = client.get(f"/api/v1/briefs/{brief['id']}").json()
+
+    assert reminded == {"enqueued": 1, "reminded": 1, "overdue": 0, "stale": 0}
+    assert again == {"enqueued": 0, "reminded": 0, "overdue": 0, "stale": 0}
+    assert after_reminder["reminded_at"] == (deadline - timedelta(hours=2)).isoformat()
+    assert after_reminder["overdue_at"] is None
+    assert after_reminder["updated_at"] == brief["updated_at"]
+    assert overdue == {"enqueued": 1, "reminded": 0, "overdue": 1, "stale": 0}
+    assert after_deadline["overdue_at"] == (deadline + timedelta(hours=1)).isoformat()
+
+
+def test_brief_deadline_jobs_claimed_by_one_worker(client: TestClient) -> None:
+    """Tâche réclamée (SKIP LOCKED) : invisible pour un second worker ; balayage réservé au détenteur du verrou."""
+    brief, deadline = _deadline_brief(client)
+    now = deadline + timedelta(hours=1)
+
+    with Session(get_engine()) as first, Session(get_engine()) as second:
+        first_repo, second_repo = JobRepository(first), JobRepository(second)
+        assert first_repo.enqueue_deadline_jobs(now, timedelta(hours=24), timedelta(hours=168)) == 1
+        claimed = [job for job in first_repo.claim_due(now, 1000) if job.brief_id == brief["id"]]
+        assert len(claimed) == 1
+        assert all(job.brief_id != brief["id"] for job in second_repo.claim_due(now, 1000))
+        second.rollback()
+        assert len(first_repo.complete(claimed, now)) == 1
+
+    assert client.get(f"/api/v1/briefs/{brief['id']}").json()["overdue_at"] == now.isoformat()
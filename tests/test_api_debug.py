@@ -0,0 +1,156 @@
+"""
+Tests d'intégration pour les routes de diagnostic (API v1).
+
+Vérifient l'accès réservé aux administrateurs, l'agrégation des requêtes SQL
+par empreinte, le journal des requêtes lentes et le profilage à la demande.
+"""
+import logging
+import time
+import uuid
+
+import psycopg2.errors
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.exc import IntegrityError
+
+from app.core.config import get_settings
+from app.db import query_stats
+from app.db.session import get_engine
+from app.services.user_service import UserService
+
+
+def _token(client: TestClient, role: str) -> str:
+    """Crée un utilisateur du rôle donné et renvoie son JWT."""
+    email = f"debug_{uuid.uuid4()}@test.com"
+    client.post(
+        "/api/v1/users",
+        json={
+            "email": email,
+            "first_name": "Debug",
+            "last_name": "Debug",
+            "password": "password123",
+            "role": role,
+        },
+    )
+    response = client.post("/api/v1/auth/login", json={"email": email, "password": "password123"})
+    return response.json()["access_token"]
+
+
+def test_debug_queries_requires_authentication(client: TestClient) -> None:
+    """Sans token : 401."""
+    response = client.get("/api/v1/debug/queries")
+
+    assert response.status_code == 401
+
+
+def test_debug_queries_forbidden_for_non_admin(client: TestClient) -> None:
+    """Un apprenant authentifié reçoit 403."""
+    token = _token(client, "learner")
+
+    response = client.get("/api/v1/debug/queries", headers={"Authorization": f"Bearer {token}"})
+
+    assert response.status_code == 403
+
+
+def test_debug_queries_returns_fingerprints_for_admin(client: TestClient) -> None:
+    """Un admin obtient le top des empreintes, littéraux remplacés par ?, trié par temps total."""
+    token = _token(client, "admin")
+    client.get("/api/v1/formations/987654321")
+
+    response = client.get(
+        "/api/v1/debug/queries",
+        params={"limit": 100},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data
+    totals = [entry["total_ms"] for entry in data]
+    assert totals == sorted(totals, reverse=True)
+    assert all("987654321" not in entry["fingerprint"] for entry in data)
+    assert any(
+        "FROM formations" in entry["fingerprint"] and "formations.id = ?" in entry["fingerprint"]
+        for entry in data
+    )
+
+
+def test_slow_query_is_logged_with_repository_method(client: TestClient, caplog) -> None:
+    """Au-delà du seuil, l'instruction est journalisée avec la méthode de repository appelante."""
+    query_stats.install(0)
+    try:
+        with caplog.at_level(logging.WARNING, logger="app.db.slow_query"):
+            client.get("/api/v1/sessions/987654321")
+    finally:
+        query_stats.install(get_settings().slow_query_threshold_ms)
+
+    messages = [record.getMessage() for record in caplog.records]
+    assert any("SessionRepository.get_by_id" in message for message in messages)
+
+
+def test_failing_statement_keeps_its_dbapi_error() -> None:
+    """Une instruction en échec lève son erreur d'origine (pas d'AttributeError du hook handle_error)."""
+    with get_engine().connect() as conn:
+        conn.execute(text("CREATE TEMPORARY TABLE debug_unique (id int PRIMARY KEY)"))
+        conn.execute(text("INSERT INTO debug_unique VALUES (1)"))
+        with pytest.raises(IntegrityError) as excinfo:
+            conn.execute(text("INSERT INTO debug_unique VALUES (1)"))
+        conn.rollback()
+
+        assert isinstance(excinfo.value.orig, psycopg2.errors.UniqueViolation)
+        assert conn.info.get("statement_started") == []
+        assert conn.execute(text("SELECT 1")).scalar() == 1
+
+
+def test_profile_header_from_admin_stores_collapsed_stacks(client: TestClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    """X-Profile: 1 avec un JWT admin : X-Profile-Id renvoyé, profil lisible en texte."""
+    token = _token(client, "admin")
+    headers = {"Authorization": f"Bearer {token}"}
+    list_users = UserService.list
+
+    def slow_list(self, *args, **kwargs):
+        # Requête assez longue pour être échantillonnée quelle que soit la machine.
+        time.sleep(0.05)
+        return list_users(self, *args, **kwargs)
+
+    monkeypatch.setattr(UserService, "list", slow_list)
+
+    response = client.get("/api/v1/users", params={"limit": 100}, headers={**headers, "X-Profile": "1"})
+
+    assert response.status_code == 200
+    profile_id = response.headers["X-Profile-Id"]
+    profile = client.get(f"/api/v1/debug/profiles/{profile_id}", headers=headers)
+    assert profile.status_code == 200
+    assert profile.headers["content-type"].startswith("text/plain")
+    assert profile.headers["X-Profile-Request"] == "GET /api/v1/users"
+    assert profile.text.strip()
+    assert "slow_list" in profile.text
+    for line in profile.text.splitlines():
+        stack, count = line.rsplit(" ", 1)
+        assert int(count) >= 1
+        assert stack.startswith(("app.", "main:", "fastapi."))
+
+
+def test_profile_query_flag_ignored_for_non_admin(client: TestClient) -> None:
+    """?profile=1 sans droits admin : requête servie normalement, sans profil."""
+    token = _token(client, "learner")
+
+    response = client.get(
+        "/api/v1/users",
+        params={"profile": 1},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+
+    assert response.status_code == 200
+    assert "X-Profile-Id" not in response.headers
+
+
+def test_get_unknown_profile_returns_404(client: TestClient) -> None:
+    """Id de profil inconnu : 404 PROFILE_NOT_FOUND."""
+    token = _token(client, "admin")
+
+    response = client.get("/api/v1/debug/profiles/unknown", headers={"Authorization": f"Bearer {token}"})
+
+    assert response.status_code == 404
+    assert response.json()["code"] == "PROFILE_NOT_FOUND"
@@ -0,0 +1,112 @@
+"""
+Tests d'intégration pour l'outbox des événements de changement.
+
+Vérifient qu'une écriture de l'API publie son événement aux abonnés du worker
+(et qu'une écriture refusée n'en publie pas), puis que le dispatcher diffuse
+dans l'ordre des transactions : un événement validé n'est pas lu avant ceux
+d'une transaction plus ancienne encore ouverte, un événement annulé jamais.
+"""
+import queue
+import uuid
+from datetime import datetime, timedelta
+from typing import List
+
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlmodel import Session
+
+from app.core.events import OutboxDispatcher
+from app.db import outbox
+from app.db.session import get_engine
+from app.models.outbox import OutboxEvent
+
+from helpers import create, make_user
+
+
+def test_enrollment_write_publishes_event(client: TestClient) -> None:
+    """POST /enrollments : `enrollment.created` reçu par un abonné ; le doublon refusé (409) ne publie rien."""
+    formation = create(
+        client, "/api/v1/formations", {"title": f"Events {uuid.uuid4().hex[:8]}", "duration_hours": 7, "level": "0"}
+    )
+    start = datetime(2034, 1, 2, 9) + timedelta(days=uuid.uuid4().int % 3000)
+    session = create(
+        client,
+        "/api/v1/sessions",
+        {
+            "formation_id": formation["id"],
+            "teacher_id": make_user(client, "trainer"),
+            "start_date": start.isoformat(),
+            "end_date": (start + timedelta(hours=8)).isoformat(),
+            "capacity_max": 5,
+            "status": "scheduled",
+        },
+    )
+    learner_id = make_user(client, "learner")
+    received: "queue.Queue[OutboxEvent]" = queue.Queue()
+    dispatcher = client.app.state.outbox
+    dispatcher.subscribe(received.put)
+    try:
+        payload = {"session_id": session["id"], "student_id": learner_id}
+        enrollment = create(client, "/api/v1/enrollments", payload)
+        assert client.post("/api/v1/enrollments", json=payload).status_code == 409
+        event = received.get(timeout=10)
+        dispatcher.drain()
+    finally:
+        dispatcher.unsubscribe(received.put)
+
+    assert event.topic == "enrollment.created"
+    assert event.payload == {"id": enrollment["id"], "session_id": session["id"], "student_id": learner_id}
+    assert received.empty()
+
+
+def test_dispatcher_follows_transaction_order() -> None:
+    """Un événement validé attend la fin d'une transaction plus ancienne ; un événement annulé n'est jamais diffusé."""
+    token = uuid.uuid4().hex
+    dispatcher = OutboxDispatcher(get_engine(), poll_seconds=0)
+    received: List[OutboxEvent] = []
+    dispatcher.subscribe(lambda event: received.append(event) if event.payload.get("token") == token else None)
+    dispatcher.drain()
+
+    try:
+        with Session(get_engine()) as older, Session(get_engine()) as newer, Session(get_engine()) as aborted:
+            outbox.append(older, [("test.older", {"token": token})])
+            outbox.append(newer, [("test.newer", {"token": token})])
+            newer.commit()
+            outbox.append(aborted, [("test.aborted", {"token": token})])
+            dispatcher.drain()
+            assert received == []
+
+            older.commit()
+            aborted.rollback()
+            dispatcher.drain()
+    finally:
+        dispatcher.stop()
+
+    assert [event.topic for event in received] == ["test.older", "test.newer"]
+
+
+def test_dispatcher_reconnects_after_losing_listen_connection() -> None:
+    """Connexion LISTEN coupée côté serveur : le thread se reconnecte et diffuse les événements suivants."""
+    token = uuid.uuid4().hex
+    dispatcher = OutboxDispatcher(get_engine(), poll_seconds=30)
+    received: "queue.Queue[OutboxEvent]" = queue.Queue()
+    dispatcher.subscribe(lambda event: received.put(event) if event.payload.get("token") == token else None)
+    dispatcher.start()
+    try:
+        with get_engine().begin() as conn:
+            terminated = conn.execute(
+                text(
+                    "SELECT count(pg_terminate_backend(pid)) FROM pg_stat_activity "
+                    "WHERE query = :listen AND pid <> pg_backend_pid()"
+                ),
+                {"listen": f"LISTEN {outbox.OUTBOX_CHANNEL}"},
+            ).scalar()
+        with Session(get_engine()) as session:
+            outbox.append(session, [("test.reconnected", {"token": token})])
+            session.commit()
+        event = received.get(timeout=10)
+    finally:
+        dispatcher.stop()
+
+    assert terminated >= 1
+    assert event.topic == "test.reconnected"
@@ -4,6 +4,7 @@ Tests d'intégration pour les routes formations (API v1).
 CRUD formations, validation (titre, durée, niveau), conflits (titre déjà utilisé).
 """
 import uuid
+from datetime import datetime, timedelta
 
 from fastapi.testclient import TestClient
 
@@ -97,6 +98,24 @@ def test_list_formations_ok(client: TestClient) -> None:
     assert title in titles, f"Expected {title} in {len(titles)} formations"
 
 
+def test_list_formations_by_ids(client: TestClient) -> None:
+    """Lecture groupée `?ids=` : formations dans l'ordre demandé, sans en-tête si rien ne manque."""
+    ids = [
+        client.post(
+            "/api/v1/formations",
+            json={"title": f"Batch {uuid.uuid4().hex[:8]}", "duration_hours": 10, "level": "0"},
+        ).json()["id"]
+        for _ in range(3)
+    ]
+    requested = [ids[2], ids[0], ids[1]]
+
+    response = client.get("/api/v1/formations", params={"ids": ",".join(map(str, requested))})
+
+    assert response.status_code == 200
+    assert [f["id"] for f in response.json()] == requested
+    assert "X-Missing-Ids" not in response.headers
+
+
 def test_get_formation_ok(client: TestClient) -> None:
     """Récupération d'une formation par ID renvoie 200 et les champs attendus."""
     title = f"Get {uuid.uuid4().hex[:8]}"
@@ -193,6 +212,43 @@ def test_delete_formation_ok(client: TestClient) -> None:
     assert get_response.status_code == 404
 
 
+def test_delete_formation_with_sessions_conflict(client: TestClient) -> None:
+    """Suppression d'une formation ayant une session : 409 FORMATION_HAS_SESSIONS, formation conservée."""
+    formation = client.post(
+        "/api/v1/formations",
+        json={"title": f"Busy {uuid.uuid4().hex[:8]}", "duration_hours": 7, "level": "0"},
+    ).json()
+    teacher = client.post(
+        "/api/v1/users",
+        json={
+            "email": f"busy_{uuid.uuid4()}@test.com",
+            "first_name": "Busy",
+            "last_name": "Trainer",
+            "password": "password123",
+            "role": "trainer",
+        },
+    ).json()
+    start = datetime(2033, 1, 3, 9) + timedelta(days=uuid.uuid4().int % 3000)
+    session = client.post(
+        "/api/v1/sessions",
+        json={
+            "formation_id": formation["id"],
+            "teacher_id": teacher["id"],
+            "start_date": start.isoformat(),
+            "end_date": (start + timedelta(hours=8)).isoformat(),
+            "capacity_max": 5,
+            "status": "scheduled",
+        },
+    )
+    assert session.status_code == 201, session.text
+
+    response = client.delete(f"/api/v1/formations/{formation['id']}")
+
+    assert response.status_code == 409
+    assert response.json()["code"] == "FORMATION_HAS_SESSIONS"
+    assert client.get(f"/api/v1/formations/{formation['id']}").status_code == 200
+
+
 def test_delete_formation_not_found(client: TestClient) -> None:
     """Suppression avec un ID inexistant renvoie 404 et FORMATION_NOT_FOUND."""
     response = client.delete("/api/v1/formations/999999")
@@ -0,0 +1,112 @@
+"""
+Tests d'intégration pour les routes groupes (API v1).
+
+Vérifient la répartition automatique des inscrits d'une session : tailles
+équilibrées, couverture de tous les inscrits, stratification par l'historique
+des groupes et erreurs (répartition impossible, paramètres invalides) ; et la
+mise à jour des membres par différence (ajouts / retraits rapportés).
+"""
+import uuid
+from datetime import datetime, timedelta
+from typing import List, Tuple
+
+from fastapi.testclient import TestClient
+
+from helpers import create, make_user
+
+
+def _session_with_learners(client: TestClient, count: int) -> Tuple[int, List[int]]:
+    """Session (formateur et formation dédiés) et `count` apprenants inscrits."""
+    formation = create(
+        client, "/api/v1/formations", {"title": f"Groups {uuid.uuid4().hex[:8]}", "duration_hours": 7, "level": "0"}
+    )
+    start = datetime(2031, 1, 6, 9) + timedelta(days=uuid.uuid4().int % 3000)
+    session_id = create(
+        client,
+        "/api/v1/sessions",
+        {
+            "formation_id": formation["id"],
+            "teacher_id": make_user(client, "trainer"),
+            "start_date": start.isoformat(),
+            "end_date": (start + timedelta(hours=8)).isoformat(),
+            "capacity_max": count,
+            "status": "scheduled",
+        },
+    )["id"]
+    learners = [make_user(client, "learner") for _ in range(count)]
+    for learner_id in learners:
+        create(client, "/api/v1/enrollments", {"session_id": session_id, "student_id": learner_id})
+    return session_id, learners
+
+
+def test_auto_groups_balanced_by_count(client: TestClient) -> None:
+    """group_count : tailles à une unité près, chaque inscrit dans exactement un groupe."""
+    session_id, learners = _session_with_learners(client, 10)
+
+    response = client.post(f"/api/v1/groups/session/{session_id}/auto", json={"group_count": 3, "seed": 1})
+
+    assert response.status_code == 201
+    groups = response.json()
+    assert [g["name"] for g in groups] == ["Groupe 1", "Groupe 2", "Groupe 3"]
+    assert sorted(len(g["student_ids"]) for g in groups) == [3, 3, 4]
+    assert sorted(s for g in groups for s in g["student_ids"]) == sorted(learners)
+    listed = client.get(f"/api/v1/groups/session/{session_id}").json()
+    assert sorted(g["id"] for g in listed) == sorted(g["id"] for g in groups)
+
+
+def test_auto_groups_by_size(client: TestClient) -> None:
+    """group_size : le moins de groupes possible d'au plus N apprenants, équilibrés."""
+    session_id, _ = _session_with_learners(client, 10)
+
+    response = client.post(
+        f"/api/v1/groups/session/{session_id}/auto", json={"group_size": 4, "name_prefix": "Team"}
+    )
+
+    assert response.status_code == 201
+    assert sorted(len(g["student_ids"]) for g in response.json()) == [3, 3, 4]
+    assert response.json()[0]["name"] == "Team 1"
+
+
+def test_auto_groups_stratify_separates_previous_groupmates(client: TestClient) -> None:
+    """stratify : deux apprenants déjà réunis ne se retrouvent pas ensemble quand c'est évitable."""
+    session_id, learners = _session_with_learners(client, 6)
+    previous = [learners[:3], learners[3:]]
+    for index, members in enumerate(previous):
+        create(client, "/api/v1/groups", {"session_id": session_id, "name": f"Old {index}", "student_ids": members})
+
+    response = client.post(
+        f"/api/v1/groups/session/{session_id}/auto", json={"group_count": 3, "stratify": True, "seed": 7}
+    )
+
+    assert response.status_code == 201
+    for group in response.json():
+        assert len(group["student_ids"]) == 2
+        assert not any(set(group["student_ids"]) <= set(members) for members in previous)
+
+
+def test_auto_groups_invalid_split(client: TestClient) -> None:
+    """Plus de groupes que d'inscrits : 400 ; group_count et group_size ensemble : 422."""
+    session_id, _ = _session_with_learners(client, 2)
+
+    too_many = client.post(f"/api/v1/groups/session/{session_id}/auto", json={"group_count": 3})
+    both = client.post(f"/api/v1/groups/session/{session_id}/auto", json={"group_count": 1, "group_size": 2})
+
+    assert too_many.status_code == 400
+    assert too_many.json()["code"] == "GROUP_SPLIT_INVALID"
+    assert both.status_code == 422
+
+
+def test_update_group_members_reports_diff(client: TestClient) -> None:
+    """PATCH student_ids : seule la différence est appliquée et rapportée."""
+    session_id, learners = _session_with_learners(client, 5)
+    group = create(client, "/api/v1/groups", {"session_id": session_id, "name": "Diff", "student_ids": learners[:4]})
+
+    response = client.patch(f"/api/v1/groups/{group['id']}", json={"student_ids": [learners[4], *learners[1:4]]})
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["added_student_ids"] == [learners[4]]
+    assert data["removed_student_ids"] == [learners[0]]
+    assert sorted(data["student_ids"]) == sorted(learners[1:])
+    unchanged = client.patch(f"/api/v1/groups/{group['id']}", json={"student_ids": learners[1:]})
+    assert (unchanged.json()["added_student_ids"], unchanged.json()["removed_student_ids"]) == ([], [])
@@ -0,0 +1,186 @@
+"""
+Tests d'intégration pour l'en-tête Idempotency-Key des créations (API v1).
+
+Vérifient qu'un POST rejoué avec la même clé reçoit la réponse d'origine sans
+repasser par les services, qu'une clé réutilisée pour une autre requête est
+refusée, qu'un doublon concurrent attend l'original au lieu de créer deux fois,
+et qu'une clé abandonnée n'est reprise que par la même requête.
+"""
+import json
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import List
+
+import pytest
+from fastapi.testclient import TestClient
+
+from sqlmodel import Session
+
+from app.core.config import get_settings
+from app.core.idempotency import _hash
+from app.db.instrumentation import add_statement_observer, remove_statement_observer
+from app.db.session import get_engine
+from app.models.idempotency import IdempotencyKey
+from app.repositories.idempotency_repo import IdempotencyRepository
+from app.services.enrollment_service import EnrollmentService
+from app.services.user_service import UserService
+
+from helpers import create, user_payload
+
+
+def test_replayed_post_returns_stored_response(client: TestClient) -> None:
+    """Même clé : réponse d'origine rejouée (seule la table idempotency_keys est lue) ; autre corps : 422."""
+    headers = {"Idempotency-Key": str(uuid.uuid4())}
+    payload = user_payload()
+    first = client.post("/api/v1/users", json=payload, headers=headers)
+    statements: List[str] = []
+
+    def observer(statement, parameters, duration, rowcount, context) -> None:
+        statements.append(statement)
+
+    add_statement_observer(observer)
+    try:
+        replay = client.post("/api/v1/users", json=payload, headers=headers)
+    finally:
+        remove_statement_observer(observer)
+    reused = client.post("/api/v1/users", json=user_payload(), headers=headers)
+
+    assert first.status_code == 201
+    assert "idempotent-replayed" not in first.headers
+    assert replay.status_code == 201
+    assert replay.headers["idempotent-replayed"] == "true"
+    assert replay.json() == first.json()
+    assert statements and all("idempotency_keys" in statement for statement in statements)
+    assert reused.status_code == 422
+    assert reused.json()["code"] == "IDEMPOTENCY_KEY_REUSED"
+    # Sans clé, le doublon passe par le service (email déjà pris).
+    assert client.post("/api/v1/users", json=payload).status_code == 409
+
+
+def test_concurrent_duplicate_waits_for_original(client: TestClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Deux POST /enrollments simultanés avec la même clé : une seule inscription, la même réponse 201."""
+    formation = create(
+        client, "/api/v1/formations", {"title": f"Idem {uuid.uuid4().hex[:8]}", "duration_hours": 7, "level": "0"}
+    )
+    start = datetime(2034, 1, 2, 9) + timedelta(days=uuid.uuid4().int % 3000)
+    session = create(
+        client,
+        "/api/v1/sessions",
+        {
+            "formation_id": formation["id"],
+            "teacher_id": create(client, "/api/v1/users", user_payload("trainer"))["id"],
+            "start_date": start.isoformat(),
+            "end_date": (start + timedelta(hours=8)).isoformat(),
+            "capacity_max": 5,
+            "status": "scheduled",
+        },
+    )
+    learner_id = create(client, "/api/v1/users", user_payload())["id"]
+
+    calls: List[int] = []
+    original_create = EnrollmentService.create
+
+    def slow_create(self, data):
+        calls.append(data.student_id)
+        time.sleep(0.5)
+        return original_create(self, data)
+
+    monkeypatch.setattr(EnrollmentService, "create", slow_create)
+    headers = {"Idempotency-Key": str(uuid.uuid4())}
+    payload = {"session_id": session["id"], "student_id": learner_id}
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        responses = list(
+            pool.map(lambda _: client.post("/api/v1/enrollments", json=payload, headers=headers), range(2))
+        )
+
+    assert [response.status_code for response in responses] == [201, 201]
+    assert responses[0].json() == responses[1].json()
+    assert sorted(response.headers.get("idempotent-replayed", "") for response in responses) == ["", "true"]
+    assert calls == [learner_id]
+    enrollments = client.get(f"/api/v1/enrollments/session/{session['id']}")
+    assert enrollments.status_code == 200, enrollments.text
+    assert len(enrollments.json()) == 1
+
+
+def _abandoned_claim(raw_key: str, body: bytes, token: str) -> str:
+    """Réserve la clé comme l'aurait fait un worker tombé il y a une heure. Retourne la clé stockée."""
+    key = _hash(raw_key.encode(), b"")
+    long_ago = datetime.utcnow() - timedelta(hours=1)
+    with Session(get_engine()) as session:
+        claimed, _ = IdempotencyRepository(session).claim(
+            key,
+            _hash(b"POST", b"/api/v1/users", b"", body),
+            token,
+            long_ago,
+            expires_at=datetime.utcnow() + timedelta(hours=1),
+            stale_before=long_ago,
+        )
+    assert claimed
+    return key
+
+
+def _stored(key: str) -> IdempotencyKey:
+    with Session(get_engine()) as session:
+        return IdempotencyRepository(session).get(key)
+
+
+def test_abandoned_key_is_only_taken_over_by_the_same_request(client: TestClient) -> None:
+    """Clé sans signe de vie : autre corps refusé (422, ligne intacte) ; même corps : réexécuté, nouveau jeton."""
+    raw_key = str(uuid.uuid4())
+    headers = {"Idempotency-Key": raw_key, "Content-Type": "application/json"}
+    body = json.dumps(user_payload()).encode()
+    key = _abandoned_claim(raw_key, body, "dead-worker")
+    before = _stored(key)
+
+    reused = client.post("/api/v1/users", content=json.dumps(user_payload()).encode(), headers=headers)
+    kept = _stored(key)
+    taken_over = client.post("/api/v1/users", content=body, headers=headers)
+    after = _stored(key)
+
+    assert reused.status_code == 422
+    assert reused.json()["code"] == "IDEMPOTENCY_KEY_REUSED"
+    assert (kept.request_hash, kept.claim_token, kept.status_code) == (before.request_hash, "dead-worker", None)
+    assert taken_over.status_code == 201, taken_over.text
+    assert "idempotent-replayed" not in taken_over.headers
+    assert after.request_hash == before.request_hash
+    assert after.claim_token != "dead-worker"
+    assert after.status_code == 201
+    # Le worker tombé qui se réveille n'écrase ni ne libère la clé reprise.
+    with Session(get_engine()) as session:
+        repo = IdempotencyRepository(session)
+        assert not repo.save_response(key, "dead-worker", 500, None, b"late")
+        repo.release(key, "dead-worker")
+    assert _stored(key).body == after.body
+
+
+def test_slow_original_is_not_taken_over(client: TestClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Original plus long que IDEMPOTENCY_LOCK_SECONDS mais vivant : le doublon tardif attend sa réponse."""
+    monkeypatch.setattr(get_settings(), "idempotency_lock_seconds", 0.3)
+    calls: List[str] = []
+    original_create = UserService.create
+
+    def slow_create(self, data):
+        calls.append(data.email)
+        time.sleep(1.0)
+        return original_create(self, data)
+
+    monkeypatch.setattr(UserService, "create", slow_create)
+    headers = {"Idempotency-Key": str(uuid.uuid4())}
+    payload = user_payload()
+    responses = []
+    original = threading.Thread(
+        target=lambda: responses.append(client.post("/api/v1/users", json=payload, headers=headers))
+    )
+    original.start()
+    time.sleep(0.6)
+    duplicate = client.post("/api/v1/users", json=payload, headers=headers)
+    original.join()
+
+    assert responses[0].status_code == 201, responses[0].text
+    assert duplicate.status_code == 201
+    assert duplicate.headers["idempotent-replayed"] == "true"
+    assert duplicate.json() == responses[0].json()
+    assert calls == [payload["email"]]
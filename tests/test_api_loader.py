@@ -0,0 +1,89 @@
+"""
+Tests d'intégration du chargeur de requête (app/db/loader.py).
+
+Vérifient que les listes de briefs et de groupes chargent leurs liaisons en une
+requête groupée (nombre d'instructions SQL constant, pas de N+1).
+"""
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Iterator, List
+
+from fastapi.testclient import TestClient
+
+from app.db.instrumentation import add_statement_observer, remove_statement_observer
+
+from helpers import create, make_user
+
+
+@contextmanager
+def _count_statements() -> Iterator[List[str]]:
+    """Collecte les instructions SQL exécutées dans le bloc."""
+    statements: List[str] = []
+
+    def observer(statement, parameters, duration, rowcount, context) -> None:
+        statements.append(statement)
+
+    add_statement_observer(observer)
+    try:
+        yield statements
+    finally:
+        remove_statement_observer(observer)
+
+
+def _make_session(client: TestClient) -> int:
+    formation = create(
+        client, "/api/v1/formations", {"title": f"Loader {uuid.uuid4().hex[:8]}", "duration_hours": 7, "level": "0"}
+    )
+    start = datetime(2030, 1, 7, 9) + timedelta(days=uuid.uuid4().int % 3000)
+    return create(
+        client,
+        "/api/v1/sessions",
+        {
+            "formation_id": formation["id"],
+            "teacher_id": make_user(client, "trainer"),
+            "start_date": start.isoformat(),
+            "end_date": (start + timedelta(hours=8)).isoformat(),
+            "capacity_max": 10,
+            "status": "scheduled",
+        },
+    )["id"]
+
+
+def test_briefs_by_session_load_students_in_one_query(client: TestClient) -> None:
+    """Liste de briefs : liaisons étudiants de tous les briefs en une requête (2 instructions au total)."""
+    session_id = _make_session(client)
+    learners = [make_user(client, "learner") for _ in range(3)]
+    for index in range(4):
+        create(
+            client,
+            "/api/v1/briefs",
+            {
+                "title": f"Brief {index}",
+                "delivery_deadline": "2030-02-01T18:00:00",
+                "session_id": session_id,
+                "student_ids": learners[: index % 3 + 1],
+            },
+        )
+
+    with _count_statements() as statements:
+        response = client.get(f"/api/v1/briefs/session/{session_id}")
+
+    assert response.status_code == 200
+    assert sorted(len(b["student_ids"]) for b in response.json()) == [1, 1, 2, 3]
+    assert len(statements) == 2
+
+
+def test_groups_by_session_load_members_in_one_query(client: TestClient) -> None:
+    """Liste de groupes : membres de tous les groupes en une requête."""
+    session_id = _make_session(client)
+    learners = [make_user(client, "learner") for _ in range(2)]
+    for name in ("A", "B", "C"):
+        create(client, "/api/v1/groups", {"session_id": session_id, "name": name, "student_ids": learners})
+
+    with _count_statements() as statements:
+        response = client.get(f"/api/v1/groups/session/{session_id}")
+
+    assert response.status_code == 200
+    assert [g["student_ids"] for g in response.json()] == [learners] * 3
+    assert len(statements) == 2
@@ -0,0 +1,59 @@
+"""
+Tests d'intégration pour la route /metrics (format texte Prometheus).
+
+Vérifient l'exposition des compteurs par gabarit de route, des statistiques SQL
+par requête, des jauges du pool et de bcrypt.
+"""
+from fastapi.testclient import TestClient
+
+
+def test_metrics_exposes_prometheus_text(client: TestClient) -> None:
+    """GET /metrics renvoie 200 en text/plain avec les métriques déclarées."""
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    body = response.text
+    for name in (
+        "http_requests_total",
+        "http_request_duration_seconds",
+        "http_requests_in_flight",
+        "db_statements_per_request",
+        "db_time_per_request_seconds",
+        "db_pool_connections",
+        "bcrypt_operations_in_flight",
+    ):
+        assert f"# TYPE {name} " in body
+
+
+def test_metrics_use_route_template_and_count_statements(client: TestClient) -> None:
+    """Les requêtes sont agrégées par gabarit (/users/{id}) et les instructions SQL comptées."""
+    client.get("/api/v1/users/999999999")
+    client.get("/api/v1/users/999999998")
+
+    body = client.get("/metrics").text
+
+    assert 'http_requests_total{method="GET",route="/api/v1/users/{id}",status="404"}' in body
+    assert "/api/v1/users/999999999" not in body
+    count_line = next(
+        line
+        for line in body.splitlines()
+        if line.startswith('db_statements_per_request_count{method="GET",route="/api/v1/users/{id}"}')
+    )
+    sum_line = next(
+        line
+        for line in body.splitlines()
+        if line.startswith('db_statements_per_request_sum{method="GET",route="/api/v1/users/{id}"}')
+    )
+    assert int(count_line.split()[-1]) >= 2
+    assert float(sum_line.split()[-1]) >= 2
+
+
+def test_metrics_unmatched_paths_are_grouped(client: TestClient) -> None:
+    """Une URL sans route correspondante est comptée sous route="unmatched"."""
+    client.get("/does-not-exist/123")
+
+    body = client.get("/metrics").text
+
+    assert 'route="unmatched",status="404"' in body
+    assert "/does-not-exist/123" not in body
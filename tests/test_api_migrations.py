@@ -0,0 +1,50 @@
+"""
+Test des migrations Alembic.
+
+Vérifie sur une base jetable que toute la chaîne de révisions s'applique
+(`upgrade head`) puis se défait (`downgrade base`) sans erreur.
+"""
+import os
+import subprocess
+import sys
+import uuid
+from pathlib import Path
+from urllib.parse import unquote
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+
+from app.db.session import get_engine
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def _alembic(url: str, *args: str) -> subprocess.CompletedProcess:
+    env = dict(os.environ, DATABASE_URL=url)
+    env.pop("USE_TEST_DB", None)
+    return subprocess.run(
+        [sys.executable, "-m", "alembic", *args], cwd=ROOT, env=env, capture_output=True, text=True
+    )
+
+
+def test_migrations_upgrade_head_then_downgrade_base() -> None:
+    """upgrade head puis downgrade base sur une base vide : chaque downgrade s'exécute."""
+    engine = get_engine()
+    name = f"{engine.url.database}_migrations_{uuid.uuid4().hex[:8]}"
+    admin = engine.execution_options(isolation_level="AUTOCOMMIT")
+    try:
+        with admin.connect() as conn:
+            conn.execute(text(f'CREATE DATABASE "{name}"'))
+    except DBAPIError as exc:
+        pytest.skip(f"CREATE DATABASE impossible : {exc.orig}")
+    # alembic.ini interpole les « % » : URL non encodée (ex. host=/tmp/pgdata).
+    url = unquote(engine.url.set(database=name).render_as_string(hide_password=False))
+    try:
+        upgrade = _alembic(url, "upgrade", "head")
+        assert upgrade.returncode == 0, upgrade.stderr
+        downgrade = _alembic(url, "downgrade", "base")
+        assert downgrade.returncode == 0, downgrade.stderr
+    finally:
+        with admin.connect() as conn:
+            conn.execute(text(f'DROP DATABASE IF EXISTS "{name}" WITH (FORCE)'))
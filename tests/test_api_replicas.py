@@ -0,0 +1,84 @@
+"""
+Tests d'intégration du routage lecture/écriture vers les réplicas.
+
+Les tests avec réplica nécessitent une seconde base, au même schéma mais non
+répliquée (TEST_REPLICA_DATABASE_URLS) : une écriture sur le primaire y est
+donc invisible, ce qui rend observable la base servant chaque lecture.
+"""
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.db.routing import PRIMARY_COOKIE, PRIMARY_HEADER
+from app.db.session import get_replica_engines
+
+
+@pytest.fixture
+def with_replica() -> None:
+    """Ignore le test sans réplica (décidé à l'exécution : la collecte ne lit pas la configuration)."""
+    if not get_replica_engines():
+        pytest.skip("TEST_REPLICA_DATABASE_URLS non configurée")
+
+
+@pytest.fixture
+def without_replica() -> None:
+    """Ignore le test si des réplicas sont configurés."""
+    if get_replica_engines():
+        pytest.skip("réplicas configurés")
+
+
+requires_replica = pytest.mark.usefixtures("with_replica")
+
+
+def _create_user(client: TestClient):
+    return client.post(
+        "/api/v1/users",
+        json={
+            "email": f"replica_{uuid.uuid4()}@test.com",
+            "first_name": "Replica",
+            "last_name": "Replica",
+            "password": "password123",
+            "role": "learner",
+        },
+    )
+
+
+@pytest.mark.usefixtures("without_replica")
+def test_no_primary_cookie_without_replicas(client: TestClient) -> None:
+    """Sans réplica : pas de cookie posé après une écriture."""
+    response = _create_user(client)
+
+    assert response.status_code == 201
+    assert PRIMARY_COOKIE not in response.cookies
+
+
+@requires_replica
+def test_write_pins_client_to_primary(client: TestClient) -> None:
+    """Après une écriture, le cookie colle le client au primaire : il relit sa création."""
+    response = _create_user(client)
+
+    assert response.status_code == 201
+    assert PRIMARY_COOKIE in response.cookies
+    user_id = response.json()["id"]
+    assert client.get(f"/api/v1/users/{user_id}").status_code == 200
+
+
+@requires_replica
+def test_reads_without_pin_go_to_replica(client: TestClient) -> None:
+    """Sans cookie, la lecture part sur le réplica (qui n'a pas l'écriture) ; X-Read-Primary la ramène au primaire."""
+    user_id = _create_user(client).json()["id"]
+    client.cookies.clear()
+
+    assert client.get(f"/api/v1/users/{user_id}").status_code == 404
+    assert client.get(f"/api/v1/users/{user_id}", headers={PRIMARY_HEADER: "1"}).status_code == 200
+
+
+@requires_replica
+def test_expired_pin_reads_from_replica(client: TestClient) -> None:
+    """Un cookie expiré ne colle plus au primaire."""
+    user_id = _create_user(client).json()["id"]
+    client.cookies.clear()
+    client.cookies.set(PRIMARY_COOKIE, "0")
+
+    assert client.get(f"/api/v1/users/{user_id}").status_code == 404
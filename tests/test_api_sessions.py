@@ -2,7 +2,8 @@
 Tests d'intégration pour les routes sessions (API v1).
 
 CRUD sessions, listes par formation / formateur / dates, erreurs métier
-(formation/formateur introuvable, utilisateur non formateur, dates invalides).
+(formation/formateur introuvable, utilisateur non formateur, dates invalides,
+chevauchement du planning d'un formateur).
 """
 import uuid
 from datetime import datetime, timedelta
@@ -154,44 +155,64 @@ def test_create_session_start_date_after_end_date(client: TestClient) -> None:
     assert response.json()["code"] == "VALIDATION_ERROR"
 
 
-def test_create_session_start_date_already_exists(client: TestClient) -> None:
-    """Création avec une start_date déjà utilisée par une autre session renvoie 400."""
+def test_create_session_teacher_overlap_conflict(client: TestClient) -> None:
+    """Création qui chevauche une autre session du même formateur renvoie 409."""
     formation_id = _make_formation(client)
     teacher_id = _make_trainer(client)
-    start_dt = datetime(2025, 7, 1, 9, 0, 0)
-    payload = _make_session_payload(formation_id, teacher_id, start_dt)
+    start_dt = _next_session_start()
+    client.post("/api/v1/sessions", json=_make_session_payload(formation_id, teacher_id, start_dt))
 
-    client.post("/api/v1/sessions", json=payload)
-    payload2 = _make_session_payload(formation_id, teacher_id, start_dt)
-    payload2["end_date"] = (start_dt + timedelta(hours=6)).isoformat()
+    payload = _make_session_payload(formation_id, teacher_id, start_dt + timedelta(hours=4))
+    response = client.post("/api/v1/sessions", json=payload)
+    assert response.status_code == 409
+    assert response.json()["code"] == "SESSION_TEACHER_SCHEDULE_CONFLICT"
 
-    response = client.post("/api/v1/sessions", json=payload2)
-    assert response.status_code == 400
-    assert response.json()["code"] == "SESSION_START_DATE_ALREADY_EXISTS"
+
+def test_create_session_same_dates_other_teacher_ok(client: TestClient) -> None:
+    """Mêmes dates qu'une session d'un autre formateur : autorisé (201)."""
+    formation_id = _make_formation(client)
+    start_dt = _next_session_start()
+    first = client.post(
+        "/api/v1/sessions", json=_make_session_payload(formation_id, _make_trainer(client), start_dt)
+    )
+    assert first.status_code == 201
+
+    response = client.post(
+        "/api/v1/sessions", json=_make_session_payload(formation_id, _make_trainer(client), start_dt)
+    )
+    assert response.status_code == 201
 
 
-def test_create_session_end_date_already_exists(client: TestClient) -> None:
-    """Création avec une end_date déjà utilisée par une autre session renvoie 400."""
+def test_create_session_adjacent_same_teacher_ok(client: TestClient) -> None:
+    """Session qui commence à la fin de la précédente (même formateur) : autorisé (201)."""
     formation_id = _make_formation(client)
     teacher_id = _make_trainer(client)
-    start_dt = datetime(2025, 8, 1, 9, 0, 0)
-    end_dt = start_dt + timedelta(hours=8)
+    start_dt = _next_session_start()
     client.post("/api/v1/sessions", json=_make_session_payload(formation_id, teacher_id, start_dt))
 
-    start_dt2 = datetime(2025, 8, 1, 10, 0, 0)
-    response = client.post(
+    payload = _make_session_payload(formation_id, teacher_id, start_dt + timedelta(hours=8))
+    response = client.post("/api/v1/sessions", json=payload)
+    assert response.status_code == 201
+
+
+def test_update_session_teacher_overlap_conflict(client: TestClient) -> None:
+    """Déplacer une session sur une autre session du formateur renvoie 409."""
+    formation_id = _make_formation(client)
+    teacher_id = _make_trainer(client)
+    start_dt = _next_session_start()
+    client.post("/api/v1/sessions", json=_make_session_payload(formation_id, teacher_id, start_dt))
+    later = client.post(
         "/api/v1/sessions",
-        json={
-            "formation_id": formation_id,
-            "teacher_id": teacher_id,
-            "start_date": start_dt2.isoformat(),
-            "end_date": end_dt.isoformat(),
-            "capacity_max": 5,
-            "status": "scheduled",
-        },
+        json=_make_session_payload(formation_id, teacher_id, start_dt + timedelta(hours=8)),
     )
-    assert response.status_code == 400
-    assert response.json()["code"] == "SESSION_END_DATE_ALREADY_EXISTS"
+    assert later.status_code == 201
+
+    response = client.patch(
+        f"/api/v1/sessions/{later.json()['id']}",
+        json={"start_date": (start_dt + timedelta(hours=2)).isoformat()},
+    )
+    assert response.status_code == 409
+    assert response.json()["code"] == "SESSION_TEACHER_SCHEDULE_CONFLICT"
 
 
 def test_list_sessions_ok(client: TestClient) -> None:
@@ -205,6 +226,101 @@ def test_list_sessions_ok(client: TestClient) -> None:
     assert isinstance(response.json(), list)
 
 
+def test_list_sessions_by_ids(client: TestClient) -> None:
+    """Lecture groupée `?ids=` : sessions dans l'ordre demandé, ids absents signalés."""
+    formation_id = _make_formation(client)
+    ids = [
+        client.post("/api/v1/sessions", json=_make_session_payload(formation_id, _make_trainer(client))).json()["id"]
+        for _ in range(2)
+    ]
+
+    response = client.get("/api/v1/sessions", params={"ids": f"{ids[1]},0,{ids[0]}"})
+
+    assert response.status_code == 200
+    assert [s["id"] for s in response.json()] == [ids[1], ids[0]]
+    assert response.headers["X-Missing-Ids"] == "0"
+
+
+def test_get_session_fields(client: TestClient) -> None:
+    """`?fields=` sur le détail : seulement les champs demandés ; 404 conservé si absente."""
+    formation_id = _make_formation(client)
+    teacher_id = _make_trainer(client)
+    session_id = client.post("/api/v1/sessions", json=_make_session_payload(formation_id, teacher_id)).json()["id"]
+
+    response = client.get(f"/api/v1/sessions/{session_id}", params={"fields": "teacher_id,status"})
+
+    assert response.status_code == 200
+    assert response.json() == {"teacher_id": teacher_id, "status": "scheduled"}
+    assert client.get("/api/v1/sessions/999999999", params={"fields": "id"}).status_code == 404
+
+
+def test_sessions_calendar_returns_overlapping_sessions_and_day_counts(client: TestClient) -> None:
+    """Calendrier : sessions qui chevauchent la fenêtre (filtre formateur) et comptage par jour."""
+    formation_id = _make_formation(client)
+    teacher_id = _make_trainer(client)
+    day = _next_session_start().replace(hour=0)
+    inside = client.post(
+        "/api/v1/sessions",
+        json=_make_session_payload(formation_id, teacher_id, day + timedelta(days=1, hours=9)),
+    ).json()
+    spanning = {
+        **_make_session_payload(formation_id, teacher_id, day - timedelta(days=1)),
+        "end_date": (day + timedelta(hours=12)).isoformat(),
+    }
+    spanning_id = client.post("/api/v1/sessions", json=spanning).json()["id"]
+    client.post(
+        "/api/v1/sessions",
+        json=_make_session_payload(formation_id, teacher_id, day + timedelta(days=5, hours=9)),
+    )
+
+    response = client.get(
+        "/api/v1/sessions/calendar",
+        params={"from": day.isoformat(), "to": (day + timedelta(days=3)).isoformat(), "teacher_id": teacher_id},
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert [s["id"] for s in data["sessions"]] == [spanning_id, inside["id"]]
+    assert [d["count"] for d in data["days"]] == [1, 1, 0]
+    assert data["days"][0]["date"] == day.date().isoformat()
+
+
+def test_sessions_calendar_accepts_timezone_aware_bounds(client: TestClient) -> None:
+    """Bornes avec fuseau (`Z`, `+02:00`) : converties en UTC naïf, mêmes sessions qu'en naïf."""
+    formation_id = _make_formation(client)
+    teacher_id = _make_trainer(client)
+    day = _next_session_start().replace(hour=0)
+    session_id = client.post(
+        "/api/v1/sessions",
+        json=_make_session_payload(formation_id, teacher_id, day + timedelta(days=1, hours=9)),
+    ).json()["id"]
+
+    response = client.get(
+        "/api/v1/sessions/calendar",
+        params={
+            "from": day.isoformat() + "Z",
+            "to": (day + timedelta(days=2, hours=2)).isoformat() + "+02:00",
+            "teacher_id": teacher_id,
+        },
+    )
+
+    assert response.status_code == 200, response.text
+    data = response.json()
+    assert [s["id"] for s in data["sessions"]] == [session_id]
+    assert data["from"] == day.isoformat()
+    assert [d["count"] for d in data["days"]] == [0, 1]
+
+
+def test_sessions_calendar_invalid_range(client: TestClient) -> None:
+    """Fenêtre inversée : 400 SESSION_CALENDAR_RANGE_INVALID."""
+    response = client.get(
+        "/api/v1/sessions/calendar",
+        params={"from": "2025-02-01T00:00:00", "to": "2025-01-01T00:00:00"},
+    )
+    assert response.status_code == 400
+    assert response.json()["code"] == "SESSION_CALENDAR_RANGE_INVALID"
+
+
 def test_get_session_ok(client: TestClient) -> None:
     """Récupération d'une session par ID renvoie 200."""
     formation_id = _make_formation(client)
@@ -340,6 +456,42 @@ def test_delete_session_ok(client: TestClient) -> None:
     assert get_response.status_code == 404
 
 
+def test_delete_session_cascades_to_children(client: TestClient) -> None:
+    """Suppression d'une session avec inscription, signature, groupe et brief : 204, enfants supprimés par la base."""
+    start = _next_session_start()
+    session_id = client.post(
+        "/api/v1/sessions", json=_make_session_payload(_make_formation(client), _make_trainer(client), start)
+    ).json()["id"]
+    learner_id = _make_learner(client)
+    enrollment = client.post("/api/v1/enrollments", json={"session_id": session_id, "student_id": learner_id})
+    signature = client.post(
+        "/api/v1/signatures",
+        json={"session_id": session_id, "user_id": learner_id, "date": start.date().isoformat()},
+    )
+    group = client.post(
+        "/api/v1/groups", json={"session_id": session_id, "name": "Cascade", "student_ids": [learner_id]}
+    )
+    brief = client.post(
+        "/api/v1/briefs",
+        json={
+            "title": "Cascade",
+            "delivery_deadline": (start + timedelta(days=7)).isoformat(),
+            "session_id": session_id,
+            "student_ids": [learner_id],
+        },
+    )
+    assert [r.status_code for r in (enrollment, signature, group, brief)] == [201] * 4
+
+    response = client.delete(f"/api/v1/sessions/{session_id}")
+
+    assert response.status_code == 204
+    assert client.get(f"/api/v1/enrollments/{enrollment.json()['id']}").status_code == 404
+    assert client.get(f"/api/v1/signatures/{signature.json()['id']}").status_code == 404
+    assert client.get(f"/api/v1/groups/{group.json()['id']}").status_code == 404
+    assert client.get(f"/api/v1/briefs/{brief.json()['id']}").status_code == 404
+    assert client.get(f"/api/v1/users/{learner_id}").status_code == 200
+
+
 def test_delete_session_not_found(client: TestClient) -> None:
     """Suppression avec un ID inexistant renvoie 404 SESSION_NOT_FOUND."""
     response = client.delete("/api/v1/sessions/999999")
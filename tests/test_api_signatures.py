@@ -0,0 +1,279 @@
+"""
+Tests d'intégration pour l'émargement (API v1) sur la table partitionnée.
+
+Vérifient qu'une signature est rangée dans la partition de son mois (créée à la
+demande), que l'historique d'un apprenant n'examine que les partitions de la
+période de session, et l'archivage des partitions hors rétention ; puis le
+stockage bitmap par inscription (ATTENDANCE_STORAGE=bitmap) derrière la même API,
+et le flux SSE d'émargement partagé entre formateurs.
+"""
+import json
+import re
+import threading
+import time
+import uuid
+from datetime import date, datetime, timedelta
+from typing import List, Tuple
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from app.core.config import get_settings
+from app.db.instrumentation import add_statement_observer, remove_statement_observer
+from app.db import partitions
+from app.db.partitions import ARCHIVE_SCHEMA, add_months, archive_partitions, partition_name
+from app.db.session import get_engine
+
+from helpers import create, make_user
+
+
+def _enrolled_learner(client: TestClient, start: datetime) -> Tuple[int, int]:
+    """(session de 3 jours débutant à `start`, apprenant inscrit)."""
+    formation = create(
+        client, "/api/v1/formations", {"title": f"Sign {uuid.uuid4().hex[:8]}", "duration_hours": 21, "level": "0"}
+    )
+    session_id = create(
+        client,
+        "/api/v1/sessions",
+        {
+            "formation_id": formation["id"],
+            "teacher_id": make_user(client, "trainer"),
+            "start_date": start.isoformat(),
+            "end_date": (start + timedelta(days=2, hours=8)).isoformat(),
+            "capacity_max": 5,
+            "status": "scheduled",
+        },
+    )["id"]
+    learner_id = make_user(client, "learner")
+    create(client, "/api/v1/enrollments", {"session_id": session_id, "student_id": learner_id})
+    return session_id, learner_id
+
+
+def _partition_of(signature_id: int) -> str:
+    with get_engine().connect() as conn:
+        return conn.execute(
+            text("SELECT CAST(tableoid AS regclass) FROM signatures WHERE id = :id"), {"id": signature_id}
+        ).scalar_one()
+
+
+def test_signature_history_prunes_to_session_partition(client: TestClient) -> None:
+    """Signature rangée dans la partition de son mois ; l'historique n'examine que celle-ci."""
+    start = datetime(2200 + uuid.uuid4().int % 500, 3, 10, 9)
+    session_id, learner_id = _enrolled_learner(client, start)
+    signed = [
+        create(client, "/api/v1/signatures", {"session_id": session_id, "user_id": learner_id, "date": day})
+        for day in (start.date().isoformat(), (start.date() + timedelta(days=1)).isoformat())
+    ]
+    assert _partition_of(signed[0]["id"]) == partition_name(start.date())
+
+    captured: List[Tuple[str, dict]] = []
+
+    def observer(statement, parameters, duration, rowcount, context) -> None:
+        if "FROM signatures" in statement:
+            captured.append((statement, parameters))
+
+    add_statement_observer(observer)
+    try:
+        response = client.get(f"/api/v1/signatures/session/{session_id}/user/{learner_id}")
+    finally:
+        remove_statement_observer(observer)
+
+    assert response.status_code == 200
+    assert [s["id"] for s in response.json()] == [s["id"] for s in signed]
+    statement, parameters = captured[0]
+    with get_engine().connect() as conn:
+        plan = "\n".join(conn.exec_driver_sql(f"EXPLAIN {statement}", parameters).scalars())
+    assert set(re.findall(r"signatures_\d{4}_\d{2}", plan)) == {partition_name(start.date())}
+
+
+def test_dashboard_attendance_prunes_to_session_partitions(client: TestClient) -> None:
+    """Le comptage des jours signés du tableau de bord n'examine que les partitions des sessions."""
+    start = datetime(2200 + uuid.uuid4().int % 500, 9, 10, 9)
+    session_id, learner_id = _enrolled_learner(client, start)
+    payload = {"session_id": session_id, "user_id": learner_id, "date": start.date().isoformat()}
+    create(client, "/api/v1/signatures", payload)
+    captured: List[Tuple[str, dict]] = []
+
+    def observer(statement, parameters, duration, rowcount, context) -> None:
+        if "FROM signatures" in statement:
+            captured.append((statement, parameters))
+
+    add_statement_observer(observer)
+    try:
+        response = client.get(f"/api/v1/users/{learner_id}/dashboard")
+    finally:
+        remove_statement_observer(observer)
+
+    assert response.status_code == 200
+    assert response.json()["enrollments"][0]["attendance"]["signed_days"] == 1
+    statement, parameters = captured[0]
+    with get_engine().connect() as conn:
+        plan = "\n".join(conn.exec_driver_sql(f"EXPLAIN {statement}", parameters).scalars())
+    assert set(re.findall(r"signatures_\d{4}_\d{2}", plan)) == {partition_name(start.date())}
+
+
+def test_archive_detaches_partitions_past_retention(client: TestClient) -> None:
+    """
+    Partition antérieure à la coupure : listée en dry-run, puis détachée vers le schéma archive.
+    Un émargement antidaté recrée le mois malgré le cache d'un worker, et un second
+    archivage du même mois prend un suffixe.
+    """
+    start = datetime(1500 + uuid.uuid4().int % 300, 6, 3, 9)
+    session_id, learner_id = _enrolled_learner(client, start)
+    payload = {"session_id": session_id, "user_id": learner_id, "date": start.date().isoformat()}
+    signature = create(client, "/api/v1/signatures", payload)
+    month = date(start.year, start.month, 1)
+    name = partition_name(month)
+
+    with get_engine().begin() as conn:
+        assert name in archive_partitions(conn, add_months(month, 1), dry_run=True)
+    assert client.get(f"/api/v1/signatures/{signature['id']}").status_code == 200
+
+    archived: List[str] = []
+    try:
+        with get_engine().begin() as conn:
+            archived += archive_partitions(conn, add_months(month, 1))
+        assert name in archived
+        assert client.get(f"/api/v1/signatures/{signature['id']}").status_code == 404
+
+        # Cache d'un worker qui a vu la partition avant l'archivage (fait par un autre process).
+        partitions._known_months.add(month)
+        backdated = {**payload, "date": (start.date() + timedelta(days=1)).isoformat()}
+        late = create(client, "/api/v1/signatures", backdated)
+        with get_engine().begin() as conn:
+            archived += archive_partitions(conn, add_months(month, 1))
+        assert f"{name}_1" in archived
+
+        with get_engine().connect() as conn:
+            kept = conn.execute(text(f'SELECT id FROM "{ARCHIVE_SCHEMA}"."{name}"')).scalars().all()
+            kept_late = conn.execute(text(f'SELECT id FROM "{ARCHIVE_SCHEMA}"."{name}_1"')).scalars().all()
+        assert kept == [signature["id"]]
+        assert kept_late == [late["id"]]
+    finally:
+        with get_engine().begin() as conn:
+            for archived_name in archived:
+                conn.execute(text(f'DROP TABLE IF EXISTS "{ARCHIVE_SCHEMA}"."{archived_name}"'))
+
+
+@pytest.fixture
+def bitmap_storage(monkeypatch: pytest.MonkeyPatch):
+    """Stockage bitmap, un bit par jour ; un test peut passer attendance_slots_per_day à 2."""
+    settings = get_settings()
+    monkeypatch.setattr(settings, "attendance_storage", "bitmap")
+    monkeypatch.setattr(settings, "attendance_slots_per_day", 1)
+    return settings
+
+
+def _attendance_bits(session_id: int, learner_id: int) -> str:
+    with get_engine().connect() as conn:
+        return conn.execute(
+            text("SELECT attendance FROM enrollments WHERE session_id = :s AND student_id = :u"),
+            {"s": session_id, "u": learner_id},
+        ).scalar_one()
+
+
+def test_bitmap_half_day_slots_sign_in_one_update(client: TestClient, bitmap_storage, monkeypatch) -> None:
+    """Demi-journées : un UPDATE par émargement, doublon 409, créneau requis, relectures identiques à l'API rows."""
+    monkeypatch.setattr(bitmap_storage, "attendance_slots_per_day", 2)
+    start = datetime(2033, 1, 3, 9) + timedelta(days=uuid.uuid4().int % 3000)
+    session_id, learner_id = _enrolled_learner(client, start)
+    day1, day2 = start.date().isoformat(), (start.date() + timedelta(days=1)).isoformat()
+
+    statements: List[str] = []
+
+    def observer(statement, parameters, duration, rowcount, context) -> None:
+        if "outbox_events" not in statement:
+            statements.append(statement.split()[0].upper())
+
+    add_statement_observer(observer)
+    try:
+        first = create(
+            client,
+            "/api/v1/signatures",
+            {"session_id": session_id, "user_id": learner_id, "date": day1, "slot": "morning"},
+        )
+    finally:
+        remove_statement_observer(observer)
+    for day, slot in ((day1, "afternoon"), (day2, "morning")):
+        payload = {"session_id": session_id, "user_id": learner_id, "date": day, "slot": slot}
+        create(client, "/api/v1/signatures", payload)
+    duplicate = client.post(
+        "/api/v1/signatures", json={"session_id": session_id, "user_id": learner_id, "date": day1, "slot": "morning"}
+    )
+    no_slot = client.post("/api/v1/signatures", json={"session_id": session_id, "user_id": learner_id, "date": day2})
+
+    assert "INSERT" not in statements and statements.count("WITH") == 1
+    assert duplicate.status_code == 409
+    assert no_slot.status_code == 400 and no_slot.json()["code"] == "ATTENDANCE_SLOT_INVALID"
+    assert _attendance_bits(session_id, learner_id) == "111"
+    by_date = client.get(f"/api/v1/signatures/session/{session_id}/date/{day1}").json()
+    assert [s["slot"] for s in by_date] == ["morning", "afternoon"]
+    history = client.get(f"/api/v1/signatures/session/{session_id}/user/{learner_id}").json()
+    assert [(s["date"][:10], s["slot"]) for s in history] == [(day1, "morning"), (day1, "afternoon"), (day2, "morning")]
+    assert client.get(f"/api/v1/signatures/{first['id']}").json() == first
+
+
+def test_bitmap_sign_before_origin_shifts_bits(client: TestClient, bitmap_storage) -> None:
+    """Un jour antérieur au premier signé recale l'origine sans perdre les bits déjà posés."""
+    start = datetime(2033, 1, 3, 9) + timedelta(days=uuid.uuid4().int % 3000)
+    session_id, learner_id = _enrolled_learner(client, start)
+    days = [(start.date() + timedelta(days=offset)).isoformat() for offset in (2, 0)]
+    for day in days:
+        create(client, "/api/v1/signatures", {"session_id": session_id, "user_id": learner_id, "date": day})
+
+    assert _attendance_bits(session_id, learner_id) == "101"
+    history = client.get(f"/api/v1/signatures/session/{session_id}/user/{learner_id}").json()
+    assert [s["date"][:10] for s in history] == sorted(days)
+    assert all(s["slot"] is None for s in history)
+
+
+def _sse_events(body: str) -> List[Tuple[str, object]]:
+    events = []
+    for block in body.split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.splitlines() if not line.startswith(":"))
+        if "event" in lines:
+            events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+def test_signature_stream_shares_snapshot_and_pushes_new_signers(client: TestClient, monkeypatch) -> None:
+    """Deux formateurs : une seule lecture des signataires, puis le nouvel émargement poussé aux deux flux."""
+    monkeypatch.setattr(get_settings(), "signature_stream_max_seconds", 2.0)
+    start = datetime(2033, 1, 3, 9) + timedelta(days=uuid.uuid4().int % 3000)
+    session_id, first_learner = _enrolled_learner(client, start)
+    second_learner = make_user(client, "learner")
+    create(client, "/api/v1/enrollments", {"session_id": session_id, "student_id": second_learner})
+    day = start.date().isoformat()
+    signed = create(client, "/api/v1/signatures", {"session_id": session_id, "user_id": first_learner, "date": day})
+    hub = client.app.state.attendance_hub
+
+    reads: List[str] = []
+
+    def observer(statement, parameters, duration, rowcount, context) -> None:
+        if "FROM signatures" in statement:
+            reads.append(statement)
+
+    bodies: List[str] = []
+
+    def watch() -> None:
+        bodies.append(client.get(f"/api/v1/signatures/session/{session_id}/date/{day}/stream").text)
+
+    add_statement_observer(observer)
+    watchers = [threading.Thread(target=watch) for _ in range(2)]
+    try:
+        for thread in watchers:
+            thread.start()
+        key = (session_id, start.date())
+        while hub.watcher_count(*key) < 2 or hub._channels[key].signatures is None:
+            time.sleep(0.01)
+    finally:
+        remove_statement_observer(observer)
+    pushed = create(client, "/api/v1/signatures", {"session_id": session_id, "user_id": second_learner, "date": day})
+    for thread in watchers:
+        thread.join()
+
+    assert len(reads) == 1
+    assert hub.watcher_count(*key) == 0
+    for body in bodies:
+        assert _sse_events(body) == [("snapshot", [signed]), ("signature", pushed)]
@@ -0,0 +1,66 @@
+"""
+Tests du démarrage de l'application.
+
+Vérifient que l'import n'a pas d'effet de bord (ni moteur, ni configuration,
+ni bcrypt / jose), que le préchauffage du lifespan prépare le worker et que le
+pool de chaque worker de `serve.py` tient dans le budget de connexions.
+"""
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+from app.core.warmup import warm_up
+from app.db.session import get_engine
+from main import app
+from serve import DEDICATED_CONNECTIONS_PER_WORKER, pool_sizing
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def test_import_main_has_no_side_effects() -> None:
+    """Importer main ne crée ni moteur ni settings et ne charge pas bcrypt / jose."""
+    code = (
+        "import sys, main, app.db.session as db, app.core.config as config; "
+        "print(db._engine is None, config.get_settings.cache_info().currsize == 0, "
+        "'bcrypt' in sys.modules, 'jose' in sys.modules)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.split() == ["True", "True", "False", "False"]
+
+
+def test_warm_up_prepares_pool_openapi_and_backends(client: TestClient) -> None:
+    """Le préchauffage remplit le pool, construit le schéma OpenAPI et charge bcrypt / jose."""
+    engine = get_engine()
+
+    timings = warm_up(app, engine)
+
+    assert set(timings) == {"pool", "routes", "openapi", "security"}
+    assert app.openapi_schema is not None
+    assert engine.pool.checkedin() >= engine.pool.size()
+    assert "bcrypt" in sys.modules and "jose" in sys.modules
+
+
+def test_pool_sizing_stays_within_connection_budget() -> None:
+    """workers × (pool + overflow + connexion LISTEN) ≤ budget, avec une part de débordement."""
+    for workers in (1, 2, 3, 4, 8, 16):
+        pool_size, max_overflow = pool_sizing(workers, 90)
+        assert pool_size >= 1 and max_overflow >= 0
+        assert workers * (pool_size + max_overflow + DEDICATED_CONNECTIONS_PER_WORKER) <= 90
+    assert pool_sizing(4, 90) == (16, 5)
+
+
+def test_engine_uses_pool_size_from_environment() -> None:
+    """DB_POOL_SIZE / DB_MAX_OVERFLOW (posés par serve.py) dimensionnent le pool du worker."""
+    code = "from app.db.session import get_engine; pool = get_engine().pool; print(pool.size(), pool._max_overflow)"
+    env = dict(os.environ, DB_POOL_SIZE="7", DB_MAX_OVERFLOW="2")
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=ROOT, env=env, capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.split() == ["7", "2"]
@@ -1,12 +1,20 @@
 """
 Tests d'intégration pour les routes utilisateurs (API v1).
 
-Vérifient la création, la liste, les erreurs de validation et les conflits (email déjà utilisé).
+Vérifient la création, la liste, les erreurs de validation, les conflits (email déjà utilisé),
+la lecture groupée et les champs partiels, le tableau de bord apprenant le digest formateur et la
+suppression en cascade (un seul DELETE).
 """
 import uuid
+from datetime import datetime, timedelta
+from typing import List
 
 from fastapi.testclient import TestClient
 
+from app.db.instrumentation import add_statement_observer, remove_statement_observer
+
+from helpers import create, make_user
+
 
 def test_create_user_ok(client: TestClient) -> None:
     """Création d'un utilisateur avec email unique renvoie 201 et les champs attendus."""
@@ -270,8 +278,232 @@ def test_delete_user_ok(client: TestClient) -> None:
     assert get_response.status_code == 404
 
 
+def test_delete_learner_cascades_to_links(client: TestClient) -> None:
+    """Suppression d'un apprenant inscrit et membre d'un groupe : 204 en un seul DELETE, liaisons supprimées."""
+    learner_id, teacher_id = make_user(client, "learner"), make_user(client, "trainer")
+    formation = create(
+        client, "/api/v1/formations", {"title": f"Cascade {uuid.uuid4().hex[:8]}", "duration_hours": 7, "level": "0"}
+    )
+    start = datetime(2032, 1, 5, 9) + timedelta(days=uuid.uuid4().int % 3000)
+    session = create(
+        client,
+        "/api/v1/sessions",
+        {
+            "formation_id": formation["id"],
+            "teacher_id": teacher_id,
+            "start_date": start.isoformat(),
+            "end_date": (start + timedelta(hours=8)).isoformat(),
+            "capacity_max": 5,
+            "status": "scheduled",
+        },
+    )
+    enrollment = create(client, "/api/v1/enrollments", {"session_id": session["id"], "student_id": learner_id})
+    group = create(client, "/api/v1/groups", {"session_id": session["id"], "name": "G", "student_ids": [learner_id]})
+    statements: List[str] = []
+
+    def observer(statement, parameters, duration, rowcount, context) -> None:
+        statements.append(statement)
+
+    add_statement_observer(observer)
+    try:
+        response = client.delete(f"/api/v1/users/{learner_id}")
+    finally:
+        remove_statement_observer(observer)
+
+    assert response.status_code == 204
+    assert [s.split()[0].upper() for s in statements] == ["DELETE"]
+    assert client.get(f"/api/v1/enrollments/{enrollment['id']}").status_code == 404
+    assert client.get(f"/api/v1/groups/{group['id']}").json()["student_ids"] == []
+
+
+def test_delete_trainer_with_sessions_conflict(client: TestClient) -> None:
+    """Suppression d'un formateur qui anime encore une session : 409 USER_HAS_SESSIONS, formateur conservé."""
+    teacher_id = make_user(client, "trainer")
+    formation = create(
+        client, "/api/v1/formations", {"title": f"Keep {uuid.uuid4().hex[:8]}", "duration_hours": 7, "level": "0"}
+    )
+    start = datetime(2032, 1, 5, 9) + timedelta(days=uuid.uuid4().int % 3000)
+    create(
+        client,
+        "/api/v1/sessions",
+        {
+            "formation_id": formation["id"],
+            "teacher_id": teacher_id,
+            "start_date": start.isoformat(),
+            "end_date": (start + timedelta(hours=8)).isoformat(),
+            "capacity_max": 5,
+            "status": "scheduled",
+        },
+    )
+
+    response = client.delete(f"/api/v1/users/{teacher_id}")
+
+    assert response.status_code == 409
+    assert response.json()["code"] == "USER_HAS_SESSIONS"
+    assert client.get(f"/api/v1/users/{teacher_id}").status_code == 200
+
+
 def test_delete_user_not_found(client: TestClient) -> None:
     """Suppression avec un ID inexistant renvoie 404 et USER_NOT_FOUND."""
     response = client.delete("/api/v1/users/999999")
     assert response.status_code == 404
-    assert response.json()["code"] == "USER_NOT_FOUND"
\ No newline at end of file
+    assert response.json()["code"] == "USER_NOT_FOUND"
+
+
+def test_list_users_by_ids_preserves_order_and_reports_missing(client: TestClient) -> None:
+    """Lecture groupée : ordre demandé conservé, ids introuvables dans X-Missing-Ids."""
+    first, second = make_user(client, "learner"), make_user(client, "learner")
+    missing = second + 1_000_000
+
+    response = client.get("/api/v1/users", params={"ids": f"{second},{missing},{first},{second}"})
+
+    assert response.status_code == 200
+    assert [u["id"] for u in response.json()] == [second, first]
+    assert response.headers["X-Missing-Ids"] == str(missing)
+
+
+def test_list_users_by_ids_invalid(client: TestClient) -> None:
+    """Lecture groupée avec un id non entier : 422."""
+    response = client.get("/api/v1/users", params={"ids": "1,abc"})
+
+    assert response.status_code == 422
+
+
+def test_user_fields_limit_payload_to_requested_fields(client: TestClient) -> None:
+    """`?fields=` : seuls les champs demandés, dans l'ordre du schéma, en liste comme en détail."""
+    user_id = make_user(client, "learner")
+
+    listed = client.get("/api/v1/users", params={"ids": str(user_id), "fields": "last_name,id,first_name"})
+    single = client.get(f"/api/v1/users/{user_id}", params={"fields": "role"})
+
+    assert listed.status_code == 200
+    assert listed.json() == [{"id": user_id, "first_name": "Test", "last_name": "User"}]
+    assert single.status_code == 200
+    assert single.json() == {"role": "learner"}
+
+
+def test_user_fields_unknown_field(client: TestClient) -> None:
+    """Champ absent de UserRead (ex. hashed_password) : 422."""
+    response = client.get("/api/v1/users", params={"fields": "id,hashed_password"})
+
+    assert response.status_code == 422
+    assert "hashed_password" in response.json()["detail"]
+
+
+def test_learner_dashboard_aggregates_enrollments_briefs_and_attendance(client: TestClient) -> None:
+    """Tableau de bord : inscriptions + session + formation, briefs à venir par échéance, présence."""
+    learner_id = make_user(client, "learner")
+    teacher_id = make_user(client, "trainer")
+    formation = create(
+        client, "/api/v1/formations", {"title": f"Dash {uuid.uuid4().hex[:8]}", "duration_hours": 21, "level": "0"}
+    )
+    past = create(
+        client,
+        "/api/v1/sessions",
+        {
+            "formation_id": formation["id"],
+            "teacher_id": teacher_id,
+            "start_date": "2024-01-10T09:00:00",
+            "end_date": "2024-01-12T17:00:00",
+            "capacity_max": 5,
+            "status": "scheduled",
+        },
+    )
+    future_start = datetime.utcnow().replace(microsecond=0) + timedelta(days=30)
+    future = create(
+        client,
+        "/api/v1/sessions",
+        {
+            "formation_id": formation["id"],
+            "teacher_id": teacher_id,
+            "start_date": future_start.isoformat(),
+            "end_date": (future_start + timedelta(days=2)).isoformat(),
+            "capacity_max": 5,
+            "status": "scheduled",
+        },
+    )
+    for session in (past, future):
+        create(client, "/api/v1/enrollments", {"session_id": session["id"], "student_id": learner_id})
+    for day in ("2024-01-10", "2024-01-12"):
+        create(client, "/api/v1/signatures", {"session_id": past["id"], "user_id": learner_id, "date": day})
+    for title, deadline in (("Later", 20), ("Sooner", 10), ("Overdue", -10)):
+        create(
+            client,
+            "/api/v1/briefs",
+            {
+                "title": title,
+                "delivery_deadline": (datetime.utcnow() + timedelta(days=deadline)).isoformat(),
+                "session_id": future["id"],
+                "student_ids": [learner_id],
+            },
+        )
+
+    response = client.get(f"/api/v1/users/{learner_id}/dashboard")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert [e["session"]["id"] for e in data["enrollments"]] == [past["id"], future["id"]]
+    assert data["enrollments"][0]["formation"]["title"] == formation["title"]
+    assert data["enrollments"][0]["attendance"] == {"signed_days": 2, "elapsed_days": 3, "rate": 0.667}
+    assert data["enrollments"][1]["attendance"] == {"signed_days": 0, "elapsed_days": 0, "rate": None}
+    assert [b["title"] for b in data["upcoming_briefs"]] == ["Sooner", "Later"]
+
+
+def test_learner_dashboard_user_not_found(client: TestClient) -> None:
+    """Tableau de bord d'un utilisateur inexistant : 404."""
+    response = client.get("/api/v1/users/999999/dashboard")
+
+    assert response.status_code == 404
+    assert response.json()["code"] == "USER_NOT_FOUND"
+
+
+def test_trainer_digest_counts_enrollments_signers_and_briefs_due(client: TestClient) -> None:
+    """Digest formateur : sessions du jour, inscrits, émargements du jour, briefs dus sous 7 jours."""
+    teacher_id = make_user(client, "trainer")
+    learners = [make_user(client, "learner") for _ in range(2)]
+    formation = create(
+        client, "/api/v1/formations", {"title": f"Digest {uuid.uuid4().hex[:8]}", "duration_hours": 7, "level": "0"}
+    )
+    session = create(
+        client,
+        "/api/v1/sessions",
+        {
+            "formation_id": formation["id"],
+            "teacher_id": teacher_id,
+            "start_date": "2024-03-05T09:00:00",
+            "end_date": "2024-03-05T17:00:00",
+            "capacity_max": 5,
+            "status": "scheduled",
+        },
+    )
+    for learner_id in learners:
+        create(client, "/api/v1/enrollments", {"session_id": session["id"], "student_id": learner_id})
+    create(client, "/api/v1/signatures", {"session_id": session["id"], "user_id": learners[0], "date": "2024-03-05"})
+    for title, deadline in (("This week", "2024-03-08T18:00:00"), ("Next month", "2024-04-05T18:00:00")):
+        create(
+            client,
+            "/api/v1/briefs",
+            {"title": title, "delivery_deadline": deadline, "session_id": session["id"], "student_ids": learners},
+        )
+
+    response = client.get(f"/api/v1/users/{teacher_id}/digest", params={"date": "2024-03-05"})
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["date"] == "2024-03-05"
+    [entry] = data["sessions"]
+    assert entry["session"]["id"] == session["id"]
+    assert entry["enrolled_count"] == 2
+    assert entry["signed_count"] == 1
+    assert [s["id"] for s in entry["signers"]] == [learners[0]]
+    assert [b["title"] for b in data["briefs_due"]] == ["This week"]
+
+
+def test_trainer_digest_rejects_non_trainer(client: TestClient) -> None:
+    """Digest demandé pour un apprenant : 400 USER_NOT_TRAINER."""
+    learner_id = make_user(client, "learner")
+
+    response = client.get(f"/api/v1/users/{learner_id}/digest")
+
+    assert response.status_code == 400
+    assert response.json()["code"] == "USER_NOT_TRAINER"